@@ -0,0 +1,88 @@
+"""
+Measure the memory cost of deduplicating GenericStatementSinks.
+
+Adds the same statements `--copies` times (as when merging overlapping files)
+and reports retained memory per unique statement for each store.
+
+Usage:
+    python benchmarks/dedup.py [--statements N] [--copies N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from pyjelly.integrations.generic.generic_sink import (
+    GenericStatementSink,
+    StatementStore,
+    TermFactory,
+    Triple,
+)
+from pyjelly.integrations.generic.stores import ColumnarStore
+
+EX = "http://example.org/"
+
+
+def make_statements(count: int) -> list[Triple]:
+    terms = TermFactory(max_size=None)
+    return [
+        Triple(
+            terms.iri(f"{EX}s{i // 10}"),
+            terms.iri(f"{EX}p{i % 20}"),
+            terms.literal(str(i % 1000)),
+        )
+        for i in range(count)
+    ]
+
+
+def measure(
+    label: str,
+    statements: list[Triple],
+    copies: int,
+    store: StatementStore | None,
+    *,
+    deduplicate: bool,
+) -> None:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    sink = GenericStatementSink(store=store, deduplicate=deduplicate)
+    for _ in range(copies):
+        for statement in statements:
+            sink.add(statement)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(  # noqa: T201
+        f"{label:<22} {len(sink):>9} stored {sink.duplicates:>9} dropped "
+        f"{current / len(statements):7.1f} B/unique  {elapsed:6.2f} s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--statements", type=int, default=500_000)
+    parser.add_argument("--copies", type=int, default=2)
+    args = parser.parse_args()
+
+    # Terms are created up front, so only the sink's own memory is measured
+    statements = make_statements(args.statements)
+    for deduplicate in (False, True):
+        suffix = ", dedup" if deduplicate else ""
+        measure(
+            f"deque{suffix}", statements, args.copies, None, deduplicate=deduplicate
+        )
+        measure(
+            f"columnar{suffix}",
+            statements,
+            args.copies,
+            ColumnarStore(),
+            deduplicate=deduplicate,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Measure memory held by a parsed GenericStatementSink.
+
+Usage:
+    python benchmarks/generic_terms.py [--triples N] [--columnar]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import io
+import time
+import tracemalloc
+
+from pyjelly import jelly
+from pyjelly.integrations.generic.generic_sink import (
+    IRI,
+    GenericStatementSink,
+    Literal,
+    Triple,
+)
+from pyjelly.integrations.generic.parse import parse_jelly_to_graph
+from pyjelly.integrations.generic.serialize import flat_stream_to_file
+from pyjelly.integrations.generic.stores import ColumnarStore
+from pyjelly.serialize.streams import SerializerOptions
+
+EX = "http://example.org/"
+
+
+def make_stream(triples: int) -> bytes:
+    statements = (
+        Triple(
+            IRI(f"{EX}s{i // 10}"),
+            IRI(f"{EX}p{i % 20}"),
+            Literal(str(i % 500), datatype="http://www.w3.org/2001/XMLSchema#integer"),
+        )
+        for i in range(triples)
+    )
+    out = io.BytesIO()
+    options = SerializerOptions(logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_TRIPLES)
+    flat_stream_to_file(statements, out, options)
+    return out.getvalue()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--triples", type=int, default=1_000_000)
+    parser.add_argument(
+        "--columnar", action="store_true", help="parse into a ColumnarStore"
+    )
+    args = parser.parse_args()
+    store = ColumnarStore() if args.columnar else None
+
+    data = make_stream(args.triples)
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    sink = parse_jelly_to_graph(
+        io.BytesIO(data), sink_factory=lambda: GenericStatementSink(store=store)
+    )
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"triples:        {len(sink)}")  # noqa: T201
+    print(f"parse time:     {elapsed:.2f} s")  # noqa: T201
+    print(f"retained:       {current / 2**20:.1f} MiB")  # noqa: T201
+    print(f"peak:           {peak / 2**20:.1f} MiB")  # noqa: T201
+    print(f"bytes / triple: {current / len(sink):.1f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Measure the N-Triples/N-Quads reader and writer on a synthetic workload.
+
+Writes the workload as N-Quads in memory, then times splitting lines into
+strings, parsing them into generic terms, converting them to Jelly, and
+(with --rdflib) parsing them with RDFLib for comparison. The writer is timed
+converting the workload from Jelly back to N-Quads, with `jelly_to_ntriples`
+and through generic terms (and RDFLib). With --memory, also reports peak
+memory, which for the reader does not grow with the input.
+
+Usage:
+    python -m benchmarks.ntriples [--statements N] [--quoted-ratio R]
+        [--rdflib] [--memory]
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from pyjelly.integrations.generic import ntriples
+from pyjelly.integrations.generic.generic_sink import Prefix
+from pyjelly.integrations.generic.parse import parse_jelly_flat
+from pyjelly.integrations.generic.serialize import (
+    flat_stream_to_file,
+    flat_stream_to_frames,
+)
+
+from .synthetic import GENERIC, WorkloadSpec, statements
+
+
+def measure(
+    label: str, lines: list[str], run: Callable[[], object], *, memory: bool
+) -> None:
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    result = f"{label:<16} {len(lines) / elapsed / 1000:8.1f}k lines/s {elapsed:7.2f} s"
+    if memory:
+        # Traced separately, tracing slows the run down several times
+        tracemalloc.start()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result += f"  peak {peak / 1024**2:7.1f} MiB"
+    print(result)  # noqa: T201
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--statements", type=int, default=200_000)
+    parser.add_argument("--graphs", type=int, default=8)
+    parser.add_argument("--quoted-ratio", type=float, default=0.0)
+    parser.add_argument("--rdflib", action="store_true")
+    parser.add_argument("--memory", action="store_true")
+    args = parser.parse_args()
+
+    spec = WorkloadSpec(
+        statements=args.statements,
+        graphs=args.graphs,
+        quoted_ratio=args.quoted_ratio,
+    )
+    lines = [
+        ntriples.statement_to_nt(statement) for statement in statements(spec, GENERIC)
+    ]
+
+    measure(
+        "split",
+        lines,
+        lambda: sum(1 for _ in ntriples.split_lines(lines)),
+        memory=args.memory,
+    )
+    measure(
+        "parse",
+        lines,
+        lambda: sum(1 for _ in ntriples.parse_lines(lines)),
+        memory=args.memory,
+    )
+    measure(
+        "parse to jelly",
+        lines,
+        lambda: sum(
+            frame.ByteSize()
+            for frame in flat_stream_to_frames(
+                ntriples.parse_lines(lines, quads=spec.quads)
+            )
+        ),
+        memory=args.memory,
+    )
+
+    jelly_data = io.BytesIO()
+    flat_stream_to_file(ntriples.parse_lines(lines, quads=spec.quads), jelly_data)
+    data = jelly_data.getvalue()
+    measure(
+        "jelly to nq",
+        lines,
+        lambda: ntriples.jelly_to_ntriples(io.BytesIO(data), io.BytesIO()),
+        memory=args.memory,
+    )
+    measure(
+        "jelly via terms",
+        lines,
+        lambda: ntriples.write_statements(
+            (
+                statement
+                for statement in parse_jelly_flat(io.BytesIO(data))
+                if not isinstance(statement, Prefix)
+            ),
+            io.StringIO(),
+        ),
+        memory=args.memory,
+    )
+    if args.rdflib:
+        import rdflib  # noqa: PLC0415
+
+        import pyjelly.integrations.rdflib  # noqa: F401, PLC0415
+
+        text = "".join(lines)
+        measure(
+            "rdflib",
+            lines,
+            lambda: rdflib.Dataset().parse(io.StringIO(text), format="nquads"),
+            memory=args.memory,
+        )
+        measure(
+            "rdflib to nq",
+            lines,
+            lambda: (
+                rdflib.Dataset()
+                .parse(io.BytesIO(data), format="jelly")
+                .serialize(io.BytesIO(), format="nquads")
+            ),
+            memory=args.memory,
+        )
+
+
+if __name__ == "__main__":
+    main()
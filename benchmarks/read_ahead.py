@@ -0,0 +1,104 @@
+"""
+Compare parsing with and without the read-ahead frame pipeline.
+
+Two inputs are measured: an in-memory/local file, and a pipe fed by a writer
+thread that sleeps between chunks to simulate a slow producer (e.g. network).
+
+Usage:
+    python benchmarks/read_ahead.py [--triples N] [--frame-size N] [--depth N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import IO
+
+from pyjelly import jelly
+from pyjelly.integrations.generic.generic_sink import IRI, Literal, Triple
+from pyjelly.integrations.generic.parse import parse_jelly_flat
+from pyjelly.integrations.generic.serialize import flat_stream_to_file
+from pyjelly.serialize.streams import SerializerOptions
+
+EX = "http://example.org/"
+
+
+def make_stream(triples: int, frame_size: int) -> bytes:
+    statements = (
+        Triple(IRI(f"{EX}s{i % 1000}"), IRI(f"{EX}p{i % 20}"), Literal(f"value {i}"))
+        for i in range(triples)
+    )
+    out = io.BytesIO()
+    options = SerializerOptions(
+        logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_TRIPLES, frame_size=frame_size
+    )
+    flat_stream_to_file(statements, out, options)
+    return out.getvalue()
+
+
+def consume(inp: IO[bytes], depth: int) -> int:
+    return sum(1 for _ in parse_jelly_flat(inp, read_ahead=depth))
+
+
+def slow_pipe(data: bytes, chunk_size: int, delay: float) -> IO[bytes]:
+    read_fd, write_fd = os.pipe()
+
+    def feed() -> None:
+        with os.fdopen(write_fd, "wb") as out:
+            for start in range(0, len(data), chunk_size):
+                out.write(data[start : start + chunk_size])
+                out.flush()
+                time.sleep(delay)
+
+    threading.Thread(target=feed, daemon=True).start()
+    return os.fdopen(read_fd, "rb")
+
+
+def timed(label: str, run: Callable[[], int], repeat: int) -> None:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = run()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<32} {best * 1000:9.1f} ms  ({count} statements)")  # noqa: T201
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--triples", type=int, default=200_000)
+    parser.add_argument("--frame-size", type=int, default=250)
+    parser.add_argument("--depth", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--chunk-size", type=int, default=64 * 1024)
+    parser.add_argument("--delay", type=float, default=0.002)
+    args = parser.parse_args()
+
+    data = make_stream(args.triples, args.frame_size)
+    with tempfile.NamedTemporaryFile(suffix=".jelly") as file:
+        file.write(data)
+        file.flush()
+        for depth in (0, args.depth):
+
+            def from_file(depth: int = depth) -> int:
+                with Path(file.name).open("rb") as inp:
+                    return consume(inp, depth)
+
+            timed(f"local file, read_ahead={depth}", from_file, args.repeat)
+
+    for depth in (0, args.depth):
+
+        def from_pipe(depth: int = depth) -> int:
+            with slow_pipe(data, args.chunk_size, args.delay) as inp:
+                return consume(inp, depth)
+
+        timed(f"slow pipe, read_ahead={depth}", from_pipe, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Compare opening a Jelly file with JellyStore against parsing it into a Graph.
+
+Writes `--statements` triples to a temporary Jelly file, then reports the time
+and the memory retained (traced with tracemalloc) for opening it with
+`JellyStore`, reopening it from the persisted index, and `Graph().parse`.
+Each is followed by one pattern query.
+
+Usage:
+    python benchmarks/store.py [--statements N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from rdflib import Graph, URIRef
+
+from pyjelly.integrations.generic.generic_sink import IRI, Literal, Triple
+from pyjelly.integrations.generic.serialize import flat_stream_to_file
+from pyjelly.integrations.rdflib.store import JellyStore
+
+EX = "http://example.org/"
+
+
+def write_file(path: Path, count: int) -> None:
+    statements = (
+        Triple(
+            IRI(f"{EX}s{i // 10}"),
+            IRI(f"{EX}p{i % 20}"),
+            Literal(str(i % 1000), datatype="http://www.w3.org/2001/XMLSchema#integer"),
+        )
+        for i in range(count)
+    )
+    with path.open("wb") as out:
+        flat_stream_to_file(statements, out)
+
+
+def measure(label: str, open_graph: Callable[[], Graph]) -> None:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    graph = open_graph()
+    opened = time.perf_counter() - start
+    matches = sum(1 for _ in graph.triples((None, URIRef(f"{EX}p3"), None)))
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(  # noqa: T201
+        f"{label:<18} open {opened:6.2f} s  open+query {elapsed:6.2f} s  "
+        f"{current / 2**20:7.1f} MiB  {matches} matches"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--statements", type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "data.jelly"
+        write_file(path, args.statements)
+        measure("JellyStore", lambda: Graph(store=JellyStore(str(path))))
+        JellyStore(str(path), persist=True)
+        measure(
+            "JellyStore (.idx)",
+            lambda: Graph(store=JellyStore(str(path), persist=True)),
+        )
+        measure("Graph().parse", lambda: Graph().parse(path, format="jelly"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+"""
+Run the encode/decode benchmark suite and compare it against a baseline.
+
+Measures serialize and parse throughput (statements/s, MB/s of Jelly data)
+and peak traced memory for the generic and RDFLib integrations, across
+FLAT_TRIPLES, FLAT_QUADS, GRAPHS and DATASETS streams, lookup presets and
+frame sizes. Workloads are the e2e test corpora and seeded synthetic data
+(see `synthetic.py`), so the suite runs offline and reproducibly.
+
+Results are printed as a table and can be written as JSON with `--output`.
+With `--baseline`, every case is compared against a previous JSON result
+and the exit code is 1 if any throughput drops (or peak memory grows) by
+more than `--tolerance`.
+
+Usage:
+    python -m benchmarks.suite [--output results.json] [--baseline base.json]
+        [--workload PATTERN] [--integration generic|rdflib] [--quick]
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import gc
+import io
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import asdict, dataclass
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any, cast
+
+from rdflib import Dataset, Graph
+
+from pyjelly import jelly
+from pyjelly.integrations.generic import parse as gparse
+from pyjelly.integrations.generic import serialize as gserialize
+from pyjelly.integrations.generic.generic_sink import GenericStatementSink, Prefix
+from pyjelly.integrations.rdflib import parse as rparse
+from pyjelly.integrations.rdflib import serialize as rserialize
+from pyjelly.options import LookupPreset
+from pyjelly.parse import decode
+from pyjelly.serialize.streams import SerializerOptions
+
+from . import synthetic
+from .synthetic import WorkloadSpec
+
+CORPORA = Path(__file__).parent.parent / "tests" / "e2e_test_cases"
+
+PRESETS = {"default": LookupPreset(), "small": LookupPreset.small()}
+FRAME_SIZES = (256, 4096)
+LOGICAL_TYPES = {
+    "triples": {
+        "FLAT_TRIPLES": jelly.LOGICAL_STREAM_TYPE_FLAT_TRIPLES,
+        "GRAPHS": jelly.LOGICAL_STREAM_TYPE_GRAPHS,
+    },
+    "quads": {
+        "FLAT_QUADS": jelly.LOGICAL_STREAM_TYPE_FLAT_QUADS,
+        "DATASETS": jelly.LOGICAL_STREAM_TYPE_DATASETS,
+    },
+}
+MIN_TIME = 0.2
+
+
+@dataclass
+class Workload:
+    name: str
+    kind: str
+    rdflib: list[tuple[Any, ...]]
+    generic: list[Any]
+
+
+@dataclass
+class Result:
+    name: str
+    workload: str
+    integration: str
+    logical_type: str
+    preset: str
+    frame_size: int
+    operation: str
+    statements: int
+    bytes: int
+    seconds: float
+    statements_per_s: float
+    mb_per_s: float
+    peak_memory: int
+
+
+def to_generic(statements: list[tuple[Any, ...]], kind: str) -> list[Any]:
+    out = io.BytesIO()
+    logical_type = LOGICAL_TYPES[kind][f"FLAT_{kind.upper()}"]
+    rserialize.flat_stream_to_file(
+        # RDFLib yields plain tuples, which serialize like Triple and Quad
+        (cast("rparse.Statement", s) for s in statements),
+        out,
+        SerializerOptions(logical_type=logical_type),
+    )
+    out.seek(0)
+    return [s for s in gparse.parse_jelly_flat(out) if not isinstance(s, Prefix)]
+
+
+def corpus_workloads() -> Iterator[Workload]:
+    for path in sorted(CORPORA.glob("*/*.nt")):
+        graph = Graph()
+        graph.parse(path, format="nt")
+        triples = list(graph)
+        yield Workload(path.stem, "triples", triples, to_generic(triples, "triples"))
+    for path in sorted(CORPORA.glob("*/*.nq")):
+        dataset = Dataset()
+        dataset.parse(path, format="nquads")
+        quads = list(dataset.quads())
+        yield Workload(path.stem, "quads", quads, to_generic(quads, "quads"))
+
+
+def synthetic_workloads(count: int) -> Iterator[Workload]:
+    specs = {
+        "synthetic-triples": WorkloadSpec(statements=count),
+        "synthetic-quads": WorkloadSpec(statements=count, graphs=16),
+        # Large, flat vocabularies keep evicting lookup entries
+        "synthetic-wide": WorkloadSpec(
+            statements=count, subjects=count, objects=count, zipf=0.5, subject_run=1
+        ),
+    }
+    for name, spec in specs.items():
+        yield Workload(
+            name,
+            "quads" if spec.quads else "triples",
+            list(synthetic.statements(spec, synthetic.RDFLIB)),
+            list(synthetic.statements(spec, synthetic.GENERIC)),
+        )
+
+
+def chunks(statements: list[Any], size: int) -> Iterator[list[Any]]:
+    for start in range(0, len(statements), size):
+        yield statements[start : start + size]
+
+
+def rdflib_groups(workload: Workload, size: int) -> list[Graph]:
+    groups: list[Graph] = []
+    for chunk in chunks(workload.rdflib, size):
+        group = Graph() if workload.kind == "triples" else Dataset()
+        for statement in chunk:
+            group.add(statement)
+        groups.append(group)
+    return groups
+
+
+def generic_groups(workload: Workload, size: int) -> list[GenericStatementSink]:
+    groups = []
+    for chunk in chunks(workload.generic, size):
+        sink = GenericStatementSink()
+        for statement in chunk:
+            sink.add(statement)
+        groups.append(sink)
+    return groups
+
+
+def serializer(
+    workload: Workload, integration: str, options: SerializerOptions
+) -> Callable[[], bytes]:
+    flat = options.logical_type in (
+        jelly.LOGICAL_STREAM_TYPE_FLAT_TRIPLES,
+        jelly.LOGICAL_STREAM_TYPE_FLAT_QUADS,
+    )
+    module: Any = gserialize if integration == "generic" else rserialize
+    if flat:
+        statements = workload.generic if integration == "generic" else workload.rdflib
+
+        def run_flat() -> bytes:
+            out = io.BytesIO()
+            module.flat_stream_to_file((s for s in statements), out, options)
+            return out.getvalue()
+
+        return run_flat
+
+    groups: list[Any]
+    if integration == "generic":
+        groups = generic_groups(workload, options.frame_size)
+    else:
+        groups = rdflib_groups(workload, options.frame_size)
+
+    def run_grouped() -> bytes:
+        out = io.BytesIO()
+        module.grouped_stream_to_file((g for g in groups), out, options=options)
+        return out.getvalue()
+
+    return run_grouped
+
+
+def parser(data: bytes, integration: str, *, flat: bool) -> Callable[[], int]:
+    module: Any = gparse if integration == "generic" else rparse
+    if flat:
+        return lambda: sum(1 for _ in module.parse_jelly_flat(io.BytesIO(data)))
+    return lambda: sum(
+        len(sink) for sink in module.parse_jelly_grouped(io.BytesIO(data))
+    )
+
+
+def measure(run: Callable[[], Any], repeat: int) -> tuple[float, int]:
+    """Return the best time per call and the peak traced memory of one call."""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_TIME:
+            break
+        loops *= 2
+    best = elapsed / loops
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        best = min(best, (time.perf_counter() - start) / loops)
+    gc.collect()
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def run_cases(
+    workloads: Iterable[Workload], integrations: list[str], repeat: int, *, quick: bool
+) -> Iterator[Result]:
+    presets = {"default": PRESETS["default"]} if quick else PRESETS
+    frame_sizes = FRAME_SIZES[:1] if quick else FRAME_SIZES
+    for workload in workloads:
+        for integration in integrations:
+            for type_name, logical_type in LOGICAL_TYPES[workload.kind].items():
+                flat = type_name.startswith("FLAT")
+                for preset_name, preset in presets.items():
+                    for frame_size in frame_sizes:
+                        options = SerializerOptions(
+                            logical_type=logical_type,
+                            lookup_preset=preset,
+                            frame_size=frame_size,
+                        )
+                        serialize = serializer(workload, integration, options)
+                        data = serialize()
+                        operations = {
+                            "serialize": serialize,
+                            "parse": parser(data, integration, flat=flat),
+                        }
+                        for operation, run in operations.items():
+                            seconds, peak = measure(run, repeat)
+                            count = len(workload.rdflib)
+                            name = "/".join(
+                                (
+                                    workload.name,
+                                    integration,
+                                    type_name,
+                                    preset_name,
+                                    str(frame_size),
+                                    operation,
+                                )
+                            )
+                            yield Result(
+                                name=name,
+                                workload=workload.name,
+                                integration=integration,
+                                logical_type=type_name,
+                                preset=preset_name,
+                                frame_size=frame_size,
+                                operation=operation,
+                                statements=count,
+                                bytes=len(data),
+                                seconds=seconds,
+                                statements_per_s=count / seconds,
+                                mb_per_s=len(data) / seconds / 1e6,
+                                peak_memory=peak,
+                            )
+
+
+def compare(
+    results: list[Result], baseline: dict[str, Any], tolerance: float
+) -> list[str]:
+    """Return a description of every case that regressed against the baseline."""
+    previous = {case["name"]: case for case in baseline["results"]}
+    regressions = []
+    for result in results:
+        case = previous.get(result.name)
+        if case is None:
+            continue
+        speed = result.statements_per_s / case["statements_per_s"]
+        memory = result.peak_memory / max(case["peak_memory"], 1)
+        if speed < 1 - tolerance:
+            regressions.append(f"{result.name}: throughput {speed - 1:+.1%}")
+        if memory > 1 + tolerance:
+            regressions.append(f"{result.name}: peak memory {memory - 1:+.1%}")
+    return regressions
+
+
+def report(result: Result, baseline: dict[str, Any] | None) -> None:
+    line = (
+        f"{result.name:<72} {result.statements_per_s:>12,.0f} st/s "
+        f"{result.mb_per_s:>8.2f} MB/s {result.peak_memory / 1024:>9,.0f} KiB"
+    )
+    if baseline is not None:
+        case = next((c for c in baseline["results"] if c["name"] == result.name), None)
+        if case is not None:
+            line += f" {result.statements_per_s / case['statements_per_s'] - 1:>+8.1%}"
+    print(line)  # noqa: T201
+
+
+def main() -> None:
+    parser_ = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser_.add_argument("--output", type=Path, help="write results as JSON")
+    parser_.add_argument("--baseline", type=Path, help="JSON results to compare to")
+    parser_.add_argument("--tolerance", type=float, default=0.15)
+    parser_.add_argument("--workload", default="*", help="glob on workload names")
+    parser_.add_argument(
+        "--integration", choices=("generic", "rdflib"), action="append"
+    )
+    parser_.add_argument("--synthetic", type=int, default=20_000)
+    parser_.add_argument("--repeat", type=int, default=3)
+    parser_.add_argument(
+        "--quick", action="store_true", help="default preset and one frame size"
+    )
+    args = parser_.parse_args()
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    workloads = (
+        workload
+        for source in (corpus_workloads(), synthetic_workloads(args.synthetic))
+        for workload in source
+        if fnmatch.fnmatch(workload.name, args.workload)
+    )
+    integrations = args.integration or ["generic", "rdflib"]
+    results = []
+    for result in run_cases(workloads, integrations, args.repeat, quick=args.quick):
+        report(result, baseline)
+        results.append(result)
+
+    if args.output:
+        meta = {
+            "pyjelly": version("pyjelly"),
+            "python": platform.python_version(),
+            "compiled": not decode.__file__.endswith(".py"),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        args.output.write_text(
+            json.dumps(
+                {"meta": meta, "results": [asdict(r) for r in results]}, indent=2
+            )
+        )
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")  # noqa: T201
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+"""
+Generate seeded synthetic RDF workloads for performance testing.
+
+The shape of the data is controlled by `WorkloadSpec`: vocabulary sizes and
+their Zipf skew, the number of distinct IRI prefixes, the mix of IRI, blank
+node and literal objects, language tags and datatypes, named graphs, subject
+runs (consecutive statements sharing a subject) and RDF-star nesting. The
+same spec and seed always produce the same statements, either as generic
+terms (`GENERIC`) or as RDFLib terms (`RDFLIB`), so a workload can exercise
+lookup eviction, repeated terms and framing predictably at any scale.
+
+Usage as a module:
+    from benchmarks.synthetic import GENERIC, WorkloadSpec, statements
+    quads = list(statements(WorkloadSpec(statements=10_000, graphs=8), GENERIC))
+
+Usage as a script (writes a Jelly file):
+    python -m benchmarks.synthetic OUTPUT [--statements N] [--seed N] ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from bisect import bisect
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, fields, replace
+from itertools import accumulate, islice
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import rdflib
+
+from pyjelly import jelly
+from pyjelly.integrations.generic import generic_sink as generic
+from pyjelly.integrations.generic.serialize import flat_stream_to_file
+from pyjelly.options import StreamParameters
+from pyjelly.serialize.streams import SerializerOptions
+
+XSD = "http://www.w3.org/2001/XMLSchema#"
+DATATYPES = (
+    f"{XSD}integer",
+    f"{XSD}decimal",
+    f"{XSD}boolean",
+    f"{XSD}date",
+    f"{XSD}dateTime",
+)
+LANGUAGES = ("en", "de", "fr", "pl", "ja")
+
+
+@dataclass(frozen=True)
+class WorkloadSpec:
+    """
+    Shape of a synthetic workload.
+
+    Vocabulary sizes are the number of distinct terms in each position,
+    terms are drawn with a Zipf distribution of exponent `zipf`
+    (0 draws uniformly). Object kinds are drawn with the relative weights
+    `iri_weight`, `bnode_weight` and `literal_weight`.
+    """
+
+    statements: int = 100_000
+    seed: int = 0
+    subjects: int = 10_000
+    predicates: int = 100
+    objects: int = 50_000
+    bnodes: int = 1_000
+    literals: int = 20_000
+    zipf: float = 1.0
+    prefixes: int = 16
+    iri_weight: float = 0.4
+    bnode_weight: float = 0.1
+    literal_weight: float = 0.5
+    language_ratio: float = 0.2
+    languages: tuple[str, ...] = LANGUAGES
+    datatype_ratio: float = 0.5
+    datatypes: tuple[str, ...] = DATATYPES
+    graphs: int = 0
+    default_graph_ratio: float = 0.1
+    subject_run: float = 4.0
+    quoted_ratio: float = 0.0
+    quoted_depth: int = 1
+    base: str = "http://example.org/"
+
+    @property
+    def quads(self) -> bool:
+        return self.graphs > 0
+
+    @property
+    def rdf_star(self) -> bool:
+        return self.quoted_ratio > 0
+
+
+class Terms(NamedTuple):
+    """Term and statement constructors of one integration."""
+
+    iri: Callable[[str], Any]
+    bnode: Callable[[str], Any]
+    literal: Callable[[str, str | None, str | None], Any]
+    quoted: Callable[[Any, Any, Any], Any]
+    triple: Callable[[Any, Any, Any], Any]
+    quad: Callable[[Any, Any, Any, Any], Any]
+    default_graph: Any
+
+
+def _rdflib_quoted(*_: Any) -> Any:
+    msg = "RDFLib does not support quoted triples, set quoted_ratio=0"
+    raise ValueError(msg)
+
+
+GENERIC = Terms(
+    iri=generic.IRI,
+    bnode=generic.BlankNode,
+    literal=generic.Literal,
+    quoted=generic.Triple,
+    triple=generic.Triple,
+    quad=generic.Quad,
+    default_graph=generic.DefaultGraph,
+)
+RDFLIB = Terms(
+    iri=rdflib.URIRef,
+    bnode=rdflib.BNode,
+    literal=lambda lex, lang, datatype: rdflib.Literal(
+        lex, lang=lang, datatype=datatype
+    ),
+    quoted=_rdflib_quoted,
+    triple=lambda s, p, o: (s, p, o),
+    quad=lambda s, p, o, g: (s, p, o, g),
+    default_graph=rdflib.graph.DATASET_DEFAULT_GRAPH_ID,
+)
+
+
+class _Vocabulary:
+    """Terms of one position, drawn with a Zipf distribution."""
+
+    def __init__(self, terms: list[Any], skew: float, rng: random.Random) -> None:
+        self.terms = terms
+        self.rng = rng
+        self.cumulative = list(
+            accumulate(1 / (rank + 1) ** skew for rank in range(len(terms)))
+        )
+        self.total = self.cumulative[-1]
+
+    def draw(self) -> Any:
+        index = bisect(self.cumulative, self.rng.random() * self.total)
+        return self.terms[min(index, len(self.terms) - 1)]
+
+
+def _lexical(index: int, datatype: str | None) -> str:
+    if datatype == f"{XSD}integer":
+        return str(index)
+    if datatype == f"{XSD}decimal":
+        return f"{index / 100:.2f}"
+    if datatype == f"{XSD}boolean":
+        return "true" if index % 2 else "false"
+    if datatype == f"{XSD}date":
+        return f"{2000 + index % 25}-{index % 12 + 1:02d}-{index % 28 + 1:02d}"
+    if datatype == f"{XSD}dateTime":
+        return f"{2000 + index % 25}-{index % 12 + 1:02d}-01T{index % 24:02d}:00:00Z"
+    return f"value {index}"
+
+
+class _Generator:
+    def __init__(self, spec: WorkloadSpec, terms: Terms) -> None:
+        self.spec = spec
+        self.terms = terms
+        # A separate generator builds the vocabularies, so that changing
+        # e.g. the statement count does not change the vocabularies
+        rng = random.Random(f"{spec.seed}:vocabulary")  # noqa: S311
+        self.rng = random.Random(spec.seed)  # noqa: S311
+        prefixes = [f"{spec.base}ns{i}/" for i in range(max(spec.prefixes, 1))]
+
+        def iris(kind: str, size: int) -> list[Any]:
+            return [
+                terms.iri(f"{rng.choice(prefixes)}{kind}{i}")
+                for i in range(max(size, 1))
+            ]
+
+        self.subjects = _Vocabulary(iris("s", spec.subjects), spec.zipf, self.rng)
+        self.predicates = _Vocabulary(iris("p", spec.predicates), spec.zipf, self.rng)
+        self.objects = _Vocabulary(iris("o", spec.objects), spec.zipf, self.rng)
+        self.bnodes = _Vocabulary(
+            [terms.bnode(f"b{i}") for i in range(max(spec.bnodes, 1))],
+            spec.zipf,
+            self.rng,
+        )
+        self.literals = _Vocabulary(
+            [self._literal(i, rng) for i in range(max(spec.literals, 1))],
+            spec.zipf,
+            self.rng,
+        )
+        self.graphs = _Vocabulary(iris("g", spec.graphs), spec.zipf, self.rng)
+        self.kinds = list(
+            accumulate((spec.iri_weight, spec.bnode_weight, spec.literal_weight))
+        )
+        self.subject: Any = None
+
+    def _literal(self, index: int, rng: random.Random) -> Any:
+        spec = self.spec
+        roll = rng.random()
+        if spec.languages and roll < spec.language_ratio:
+            language = spec.languages[index % len(spec.languages)]
+            return self.terms.literal(f"text {index}", language, None)
+        if spec.datatypes and roll < spec.language_ratio + spec.datatype_ratio:
+            datatype = spec.datatypes[index % len(spec.datatypes)]
+            return self.terms.literal(_lexical(index, datatype), None, datatype)
+        return self.terms.literal(_lexical(index, None), None, None)
+
+    def object(self) -> Any:
+        kind = bisect(self.kinds, self.rng.random() * self.kinds[-1])
+        if kind == 0:
+            return self.objects.draw()
+        if kind == 1:
+            return self.bnodes.draw()
+        return self.literals.draw()
+
+    def quoted(self, depth: int) -> Any:
+        subject = self.subjects.draw()
+        if depth > 1 and self.rng.random() < self.spec.quoted_ratio:
+            subject = self.quoted(depth - 1)
+        return self.terms.quoted(subject, self.predicates.draw(), self.object())
+
+    def next_subject(self) -> Any:
+        spec = self.spec
+        if self.subject is None or self.rng.random() * spec.subject_run < 1:
+            if spec.quoted_ratio and self.rng.random() < spec.quoted_ratio:
+                self.subject = self.quoted(spec.quoted_depth)
+            else:
+                self.subject = self.subjects.draw()
+        return self.subject
+
+    def graph(self) -> Any:
+        if self.rng.random() < self.spec.default_graph_ratio:
+            return self.terms.default_graph
+        return self.graphs.draw()
+
+    def __iter__(self) -> Iterator[Any]:
+        terms = self.terms
+        for _ in range(self.spec.statements):
+            s, p, o = self.next_subject(), self.predicates.draw(), self.object()
+            if self.spec.quads:
+                yield terms.quad(s, p, o, self.graph())
+            else:
+                yield terms.triple(s, p, o)
+
+
+def statements(spec: WorkloadSpec, terms: Terms = GENERIC) -> Iterator[Any]:
+    """
+    Generate the statements of a workload.
+
+    Args:
+        spec (WorkloadSpec): workload shape and seed
+        terms (Terms): GENERIC or RDFLIB term constructors
+
+    Returns:
+        Iterator[Any]: triples, or quads if `spec.graphs` is positive
+
+    """
+    return iter(_Generator(spec, terms))
+
+
+def graphs(
+    spec: WorkloadSpec, graph_size: int, terms: Terms = GENERIC
+) -> Iterator[list[Any]]:
+    """
+    Generate the triples of a workload in groups of `graph_size` statements.
+
+    Args:
+        spec (WorkloadSpec): workload shape and seed, `spec.graphs` is ignored
+        graph_size (int): number of triples per group
+        terms (Terms): GENERIC or RDFLIB term constructors
+
+    Yields:
+        list[Any]: triples of one graph
+
+    """
+    triples = statements(replace(spec, graphs=0), terms)
+    while group := list(islice(triples, graph_size)):
+        yield group
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("output", type=Path)
+    for field in fields(WorkloadSpec):
+        default = getattr(WorkloadSpec, field.name)
+        if isinstance(default, tuple):
+            continue
+        parser.add_argument(
+            f"--{field.name.replace('_', '-')}", type=type(default), default=default
+        )
+    parser.add_argument("--frame-size", type=int, default=250)
+    args = vars(parser.parse_args())
+    output, frame_size = args.pop("output"), args.pop("frame_size")
+    spec = WorkloadSpec(**args)
+
+    options = SerializerOptions(
+        logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_QUADS
+        if spec.quads
+        else jelly.LOGICAL_STREAM_TYPE_FLAT_TRIPLES,
+        frame_size=frame_size,
+        params=StreamParameters(rdf_star=spec.rdf_star),
+    )
+    with output.open("wb") as file:
+        flat_stream_to_file((s for s in statements(spec)), file, options)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Compare re-framing a Jelly stream by transcoding and by round trips.
+
+The synthetic workload is written as Jelly with the default preset, then
+re-framed with the small preset and another frame size three ways: with
+`transcode`, through generic terms, and (with --rdflib) through an RDFLib
+dataset.
+
+Usage:
+    python -m benchmarks.transcode [--statements N] [--frame-size N]
+        [--rdflib] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import time
+from collections.abc import Callable
+
+from pyjelly.integrations.generic.generic_sink import Prefix
+from pyjelly.integrations.generic.parse import parse_jelly_flat
+from pyjelly.integrations.generic.serialize import flat_stream_to_file
+from pyjelly.options import LookupPreset, StreamParameters
+from pyjelly.serialize.streams import SerializerOptions
+from pyjelly.transcode import transcode
+
+from .synthetic import GENERIC, WorkloadSpec, statements
+
+
+def timed(label: str, count: int, run: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<16} {count / best / 1000:8.1f}k statements/s {best:7.2f} s")  # noqa: T201
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--statements", type=int, default=200_000)
+    parser.add_argument("--frame-size", type=int, default=1000)
+    parser.add_argument("--rdflib", action="store_true")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    spec = WorkloadSpec(statements=args.statements, graphs=8)
+    params = StreamParameters(generalized_statements=True, rdf_star=True)
+    source = io.BytesIO()
+    flat_stream_to_file(
+        (s for s in statements(spec, GENERIC)), source, SerializerOptions(params=params)
+    )
+    data = source.getvalue()
+    preset = LookupPreset.small()
+    options = SerializerOptions(
+        frame_size=args.frame_size, lookup_preset=preset, params=params
+    )
+
+    def generic_round_trip() -> None:
+        flat_stream_to_file(
+            (
+                statement
+                for statement in parse_jelly_flat(io.BytesIO(data))
+                if not isinstance(statement, Prefix)
+            ),
+            io.BytesIO(),
+            options,
+        )
+
+    fast = timed(
+        "transcode",
+        spec.statements,
+        lambda: transcode(
+            io.BytesIO(data),
+            io.BytesIO(),
+            frame_size=args.frame_size,
+            lookup_preset=preset,
+        ),
+        args.repeat,
+    )
+    slow = timed("generic terms", spec.statements, generic_round_trip, args.repeat)
+    print(f"{'speedup':<16} {slow / fast:8.1f}x")  # noqa: T201
+    if args.rdflib:
+        import rdflib  # noqa: PLC0415
+
+        import pyjelly.integrations.rdflib  # noqa: F401, PLC0415
+
+        slow = timed(
+            "rdflib",
+            spec.statements,
+            lambda: (
+                rdflib.Dataset()
+                .parse(io.BytesIO(data), format="jelly")
+                .serialize(io.BytesIO(), format="jelly", options=options)
+            ),
+            args.repeat,
+        )
+        print(f"{'speedup':<16} {slow / fast:8.1f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Compare RDFLib parsing of literal-heavy data with and without trusted mode.
+
+Every object is a typed or language-tagged literal, so the cost of building
+`rdflib.Literal`s (validation, normalization, value conversion) dominates.
+Values are touched afterwards with `--touch` to include the deferred
+conversion in the trusted timing.
+
+Usage:
+    python benchmarks/trusted_literals.py [--triples N] [--touch]
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import time
+from collections.abc import Callable
+from functools import partial
+
+from rdflib import XSD, Graph, Literal, URIRef
+
+from pyjelly.integrations.rdflib.parse import Triple, parse_jelly_flat
+
+EX = "http://example.org/"
+
+
+def make_stream(triples: int) -> bytes:
+    graph = Graph()
+    for i in range(0, triples, 4):
+        subject = URIRef(f"{EX}s{i}")
+        graph.add((subject, URIRef(f"{EX}count"), Literal(i)))
+        graph.add((subject, URIRef(f"{EX}ratio"), Literal(i / 7)))
+        graph.add(
+            (
+                subject,
+                URIRef(f"{EX}date"),
+                Literal(f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}", datatype=XSD.date),
+            )
+        )
+        graph.add((subject, URIRef(f"{EX}label"), Literal(f"label {i}", lang="en")))
+    out = io.BytesIO()
+    graph.serialize(out, format="jelly")
+    return out.getvalue()
+
+
+def consume(data: bytes, *, trusted: bool, touch: bool) -> int:
+    count = 0
+    for statement in parse_jelly_flat(io.BytesIO(data), trusted=trusted):
+        if touch and isinstance(statement, Triple):
+            literal = statement[2]
+            assert isinstance(literal, Literal)
+            literal.toPython()
+        count += 1
+    return count
+
+
+def timed(label: str, run: Callable[[], int], repeat: int) -> None:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = run()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<32} {best * 1000:9.1f} ms  ({count} statements)")  # noqa: T201
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--triples", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--touch", action="store_true")
+    args = parser.parse_args()
+
+    data = make_stream(args.triples)
+    for trusted in (False, True):
+        timed(
+            f"trusted={trusted}",
+            partial(consume, data, trusted=trusted, touch=args.touch),
+            args.repeat,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,14 @@
 from pyjelly.integrations.generic.generic_sink import *
 
-
-# Helper generator that streams statements from a Jelly file path
-def stream_triples(jelly_path):
-    generic_sink = GenericStatementSink()
-    with open(jelly_path, "rb") as f:
-        generic_sink.parse(f)
-    yield from (stmt for stmt in generic_sink)
-
+# LazyStatementSink keeps only the file path and decodes statements
+# frame by frame while iterating, so memory use does not depend on file size
+lazy_sink = LazyStatementSink("output.jelly")
 
 # Example usage, just printing:
-for triple in stream_triples("output.jelly"):
+for triple in lazy_sink:
     print(triple)
 
+# Iterating again re-reads and decodes the file from the start
+print(f"{sum(1 for _ in lazy_sink)} statements")
+
 print("All done.")
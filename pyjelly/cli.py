@@ -0,0 +1,469 @@
+"""
+Command-line interface, run as `python -m pyjelly` or `pyjelly`.
+
+Commands:
+    convert   convert between Jelly, N-Triples and N-Quads (other formats
+              through RDFLib), re-framing Jelly output on the way
+    cat       concatenate Jelly streams into one, transcoding them if they
+              have the same physical type; blank nodes of different inputs
+              are kept apart
+    stats     print frame, row and lookup statistics of a Jelly stream
+    validate  check Jelly streams for conformance
+
+Paths may be `-` for standard input/output. Only `convert` between formats
+other than Jelly, N-Triples and N-Quads imports RDFLib.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import sys
+from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
+from contextlib import ExitStack
+from dataclasses import asdict, replace
+from itertools import chain
+from pathlib import Path
+from typing import IO, Any
+
+from google.protobuf.message import DecodeError
+
+from pyjelly import jelly
+from pyjelly.errors import JellyAssertionError, JellyConformanceError
+from pyjelly.integrations.generic import ntriples
+from pyjelly.integrations.generic.generic_sink import (
+    BlankNode,
+    DefaultGraph,
+    Prefix,
+    Quad,
+    Triple,
+)
+from pyjelly.integrations.generic.parse import parse_jelly_flat
+from pyjelly.integrations.generic.serialize import flat_stream_to_file
+from pyjelly.options import LookupPreset, StreamParameters, StreamTypes
+from pyjelly.parse.decode import ParserOptions
+from pyjelly.parse.ioutils import get_options_and_frames
+from pyjelly.parse.scan import StreamStatistics, scan_stream, validate_stream
+from pyjelly.serialize.flows import DEFAULT_FRAME_SIZE
+from pyjelly.serialize.ioutils import write_delimited
+from pyjelly.serialize.streams import SerializerOptions
+from pyjelly.transcode import Transcoder, transcode
+
+STDIO = "-"
+NATIVE_FORMATS = ("jelly", "nt", "nq")
+EXTENSIONS = {
+    ".jelly": "jelly",
+    ".nt": "nt",
+    ".nq": "nq",
+    ".ttl": "turtle",
+    ".trig": "trig",
+    ".n3": "n3",
+    ".rdf": "xml",
+    ".xml": "xml",
+    ".jsonld": "json-ld",
+}
+RDFLIB_FORMATS = {"nt": "nt", "nq": "nquads"}
+RDFLIB_QUAD_FORMATS = ("jelly", "nquads", "trig", "json-ld")
+PRESETS: dict[str, Callable[[], LookupPreset]] = {
+    "default": LookupPreset,
+    "small": LookupPreset.small,
+}
+
+
+class CommandError(Exception):
+    """Raised for invalid command-line usage, reported without a traceback."""
+
+
+def guess_format(path: str, explicit: str | None) -> str:
+    if explicit:
+        return explicit
+    fmt = EXTENSIONS.get(Path(path).suffix.lower())
+    if fmt is None:
+        msg = f"cannot guess the format of {path!r}, pass it explicitly"
+        raise CommandError(msg)
+    return fmt
+
+
+def open_input(path: str, stack: ExitStack) -> IO[bytes]:
+    if path == STDIO:
+        return sys.stdin.buffer
+    return stack.enter_context(Path(path).open("rb"))
+
+
+def open_output(path: str, stack: ExitStack) -> IO[bytes]:
+    if path == STDIO:
+        return sys.stdout.buffer
+    return stack.enter_context(Path(path).open("wb"))
+
+
+def lookup_preset(args: argparse.Namespace) -> LookupPreset:
+    preset = PRESETS[args.preset]()
+    return LookupPreset(
+        max_names=preset.max_names if args.max_names is None else args.max_names,
+        max_prefixes=preset.max_prefixes
+        if args.max_prefixes is None
+        else args.max_prefixes,
+        max_datatypes=preset.max_datatypes
+        if args.max_datatypes is None
+        else args.max_datatypes,
+    )
+
+
+def serializer_options(args: argparse.Namespace, *, quads: bool) -> SerializerOptions:
+    return SerializerOptions(
+        logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_QUADS
+        if quads
+        else jelly.LOGICAL_STREAM_TYPE_FLAT_TRIPLES,
+        frame_size=args.frame_size,
+        lookup_preset=lookup_preset(args),
+        # As guessed by the generic API, the input may hold any of these
+        params=StreamParameters(generalized_statements=True, rdf_star=True),
+    )
+
+
+def jelly_statements(
+    inp: IO[bytes],
+    frames: Iterable[jelly.RdfStreamFrame] | None = None,
+    options: ParserOptions | None = None,
+) -> Generator[Triple | Quad]:
+    for item in parse_jelly_flat(inp, frames, options):
+        if not isinstance(item, Prefix):
+            yield item
+
+
+def read_statements(inp: IO[bytes], fmt: str) -> Iterator[Triple | Quad]:
+    if fmt == "jelly":
+        return jelly_statements(inp)
+    return ntriples.parse_lines(ntriples.iter_lines(inp), quads=fmt == "nq")
+
+
+def write_statements(
+    statements: Iterator[Triple | Quad],
+    out: IO[bytes],
+    fmt: str,
+    args: argparse.Namespace,
+) -> None:
+    if fmt != "jelly":
+        text = io.TextIOWrapper(out, encoding="utf-8", newline="\n")
+        try:
+            ntriples.write_statements(statements, text, quads=fmt == "nq")
+            text.flush()
+        finally:
+            text.detach()
+        return
+    first = next(statements, None)
+    if first is None:
+        return
+    quads = isinstance(first, Quad)
+    flat_stream_to_file(
+        uniform_statements(chain((first,), statements), quads=quads),
+        out,
+        serializer_options(args, quads=quads),
+    )
+
+
+def uniform_statements(
+    statements: Iterable[Triple | Quad], *, quads: bool
+) -> Generator[Triple | Quad]:
+    for statement in statements:
+        if isinstance(statement, Quad) == quads:
+            yield statement
+        elif isinstance(statement, Triple):
+            yield Quad(*statement, DefaultGraph)
+        else:
+            msg = "input mixes triples and quads, list a quad stream first"
+            raise CommandError(msg)
+
+
+def convert_with_rdflib(
+    inp: IO[bytes], out: IO[bytes], source: str, target: str, args: argparse.Namespace
+) -> None:
+    import rdflib  # noqa: PLC0415
+
+    import pyjelly.integrations.rdflib  # noqa: F401, PLC0415
+
+    dataset = rdflib.Dataset()
+    dataset.parse(inp, format=RDFLIB_FORMATS.get(source, source))
+    target = RDFLIB_FORMATS.get(target, target)
+    graph: rdflib.Graph = dataset
+    if target not in RDFLIB_QUAD_FORMATS:
+        graph = dataset.default_context
+    kwargs: dict[str, Any] = {}
+    if target == "jelly":
+        kwargs["options"] = serializer_options(args, quads=True)
+    graph.serialize(out, format=target, **kwargs)
+
+
+def command_convert(args: argparse.Namespace) -> None:
+    source = guess_format(args.input, args.source)
+    target = guess_format(args.output, args.target)
+    with ExitStack() as stack:
+        inp = open_input(args.input, stack)
+        out = open_output(args.output, stack)
+        if source == "jelly" and target in ("nt", "nq"):
+            ntriples.jelly_to_ntriples(inp, out, quads=target == "nq")
+        elif source == target == "jelly":
+            transcode(
+                inp,
+                out,
+                frame_size=args.frame_size,
+                lookup_preset=lookup_preset(args),
+            )
+        elif source in NATIVE_FORMATS and target in NATIVE_FORMATS:
+            write_statements(read_statements(inp, source), out, target, args)
+        else:
+            convert_with_rdflib(inp, out, source, target, args)
+        out.flush()
+
+
+def bnode_prefix(index: int, count: int) -> str:
+    # Blank node labels are local to a stream, keep them apart when merging
+    return f"f{index}_" if count > 1 else ""
+
+
+def rename_blank_nodes(term: Any, prefix: str) -> Any:
+    if isinstance(term, BlankNode):
+        return BlankNode(prefix + str(term)[2:])
+    if isinstance(term, Triple):
+        return Triple(*(rename_blank_nodes(node, prefix) for node in term))
+    return term
+
+
+def renamed_blank_nodes(
+    statements: Iterable[Triple | Quad], prefix: str
+) -> Generator[Triple | Quad]:
+    if not prefix:
+        yield from statements
+        return
+    for statement in statements:
+        yield type(statement)(*(rename_blank_nodes(term, prefix) for term in statement))
+
+
+def merged_parameters(inputs: Sequence[ParserOptions]) -> StreamParameters:
+    first = inputs[0].params
+    return replace(
+        first,
+        generalized_statements=any(
+            options.params.generalized_statements for options in inputs
+        ),
+        rdf_star=any(options.params.rdf_star for options in inputs),
+        namespace_declarations=any(
+            options.params.namespace_declarations for options in inputs
+        ),
+        delimited=True,
+    )
+
+
+def transcode_all(
+    streams: Sequence[tuple[ParserOptions, Iterable[jelly.RdfStreamFrame]]],
+    out: IO[bytes],
+    args: argparse.Namespace,
+) -> None:
+    inputs = [options for options, _ in streams]
+    stream_types = {options.stream_types for options in inputs}
+    transcoder = Transcoder(
+        stream_types.pop()
+        if len(stream_types) == 1
+        # Mixed logical types, e.g. graphs and flat triples
+        else StreamTypes(physical_type=inputs[0].stream_types.physical_type),
+        merged_parameters(inputs),
+        frame_size=args.frame_size,
+        lookup_preset=lookup_preset(args),
+    )
+    for index, (options, frames) in enumerate(streams):
+        for frame in transcoder.transcode(
+            frames, options, bnode_prefix=bnode_prefix(index, len(streams))
+        ):
+            write_delimited(frame, out)
+    if last := transcoder.finish():
+        write_delimited(last, out)
+
+
+def command_cat(args: argparse.Namespace) -> None:
+    with ExitStack() as stack:
+        inputs = [open_input(path, stack) for path in args.inputs]
+        streams = [get_options_and_frames(inp) for inp in inputs]
+        out = open_output(args.output, stack)
+        physical_types = {options.stream_types.physical_type for options, _ in streams}
+        if len(physical_types) == 1:
+            transcode_all(streams, out, args)
+        else:
+            statements = chain.from_iterable(
+                renamed_blank_nodes(
+                    jelly_statements(inp, frames, options),
+                    bnode_prefix(index, len(streams)),
+                )
+                for index, (inp, (options, frames)) in enumerate(
+                    zip(inputs, streams, strict=True)
+                )
+            )
+            write_statements(statements, out, "jelly", args)
+        out.flush()
+
+
+def format_statistics(path: str, statistics: StreamStatistics) -> Iterable[str]:
+    options = statistics.options
+    totals = statistics.totals
+    frames = len(statistics.frames)
+    preset = options.lookup_preset
+    yield f"{path}:"
+    yield (
+        "  stream types:    "
+        f"{jelly.PhysicalStreamType.Name(options.stream_types.physical_type)}, "
+        f"{jelly.LogicalStreamType.Name(options.stream_types.logical_type)}"
+    )
+    yield (
+        f"  lookup sizes:    names {preset.max_names}, "
+        f"prefixes {preset.max_prefixes}, datatypes {preset.max_datatypes}"
+    )
+    yield f"  frames:          {frames}"
+    yield f"  rows:            {totals.rows} ({totals.rows / max(frames, 1):.1f}/frame)"
+    yield f"  statements:      {totals.statements}"
+    yield f"  graph starts:    {statistics.graph_starts}"
+    if statistics.graphs is not None:
+        yield f"  graphs:          {len(statistics.graphs)}"
+    yield f"  namespaces:      {statistics.namespaces}"
+    yield (
+        f"  lookup entries:  names {totals.name_entries}, "
+        f"prefixes {totals.prefix_entries}, datatypes {totals.datatype_entries}"
+    )
+    if statistics.predicates is not None:
+        yield f"  predicates:      {len(statistics.predicates)}"
+
+
+def command_stats(args: argparse.Namespace) -> None:
+    with ExitStack() as stack:
+        inp = open_input(args.input, stack)
+        statistics = scan_stream(inp, predicates=args.predicates, graphs=args.graphs)
+    if args.json:
+        options = statistics.options
+        result = {
+            "physical_type": jelly.PhysicalStreamType.Name(
+                options.stream_types.physical_type
+            ),
+            "logical_type": jelly.LogicalStreamType.Name(
+                options.stream_types.logical_type
+            ),
+            "lookup_preset": asdict(options.lookup_preset),
+            "totals": asdict(statistics.totals),
+            "frames": [asdict(frame) for frame in statistics.frames]
+            if args.frames
+            else len(statistics.frames),
+        }
+        if statistics.predicates is not None:
+            result["predicates"] = sorted(statistics.predicates)
+        if statistics.graphs is not None:
+            result["graphs"] = len(statistics.graphs)
+        json.dump(result, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return
+    for line in format_statistics(args.input, statistics):
+        print(line)  # noqa: T201
+    if args.frames:
+        for index, frame in enumerate(statistics.frames):
+            print(  # noqa: T201
+                f"  frame {index}: {frame.rows} rows, {frame.statements} "
+                f"statements, {frame.entries} lookup entries"
+            )
+
+
+def command_validate(args: argparse.Namespace) -> int:
+    failures = 0
+    for path in args.inputs:
+        with ExitStack() as stack:
+            try:
+                statistics = validate_stream(open_input(path, stack))
+            except (JellyConformanceError, JellyAssertionError, DecodeError) as error:
+                failures += 1
+                print(f"{path}: invalid: {error}", file=sys.stderr)  # noqa: T201
+                continue
+        if not args.quiet:
+            print(f"{path}: ok, {statistics.statements} statements")  # noqa: T201
+    return 1 if failures else 0
+
+
+def add_framing_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group("Jelly output")
+    group.add_argument("--frame-size", type=int, default=DEFAULT_FRAME_SIZE)
+    group.add_argument("--preset", choices=sorted(PRESETS), default="default")
+    group.add_argument("--max-names", type=int)
+    group.add_argument("--max-prefixes", type=int)
+    group.add_argument("--max-datatypes", type=int)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="pyjelly", description="Work with Jelly RDF streams."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert = commands.add_parser("convert", help="convert between RDF formats")
+    convert.add_argument("input", nargs="?", default=STDIO)
+    convert.add_argument("output", nargs="?", default=STDIO)
+    convert.add_argument(
+        "-f", "--from", dest="source", help="input format (default: by extension)"
+    )
+    convert.add_argument(
+        "-t", "--to", dest="target", help="output format (default: by extension)"
+    )
+    add_framing_arguments(convert)
+
+    cat = commands.add_parser("cat", help="concatenate Jelly streams")
+    cat.add_argument("inputs", nargs="+")
+    cat.add_argument("-o", "--output", default=STDIO)
+    add_framing_arguments(cat)
+
+    stats = commands.add_parser("stats", help="print statistics of a Jelly stream")
+    stats.add_argument("input", nargs="?", default=STDIO)
+    stats.add_argument("--frames", action="store_true", help="per-frame counts")
+    stats.add_argument(
+        "--predicates", action="store_true", help="count distinct predicates"
+    )
+    stats.add_argument(
+        "--graphs",
+        action="store_true",
+        help="count distinct graphs (graph starts only counts graph start rows)",
+    )
+    stats.add_argument("--json", action="store_true", help="print JSON")
+
+    validate = commands.add_parser("validate", help="check Jelly streams")
+    validate.add_argument("inputs", nargs="*", default=[STDIO])
+    validate.add_argument("-q", "--quiet", action="store_true")
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Run the command-line interface.
+
+    Args:
+        argv (Sequence[str] | None): arguments, defaults to `sys.argv[1:]`
+
+    Returns:
+        int: exit code
+
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    commands = {
+        "convert": command_convert,
+        "cat": command_cat,
+        "stats": command_stats,
+        "validate": command_validate,
+    }
+    try:
+        return commands[args.command](args) or 0
+    except (
+        CommandError,
+        ValueError,
+        JellyConformanceError,
+        JellyAssertionError,
+        DecodeError,
+    ) as error:
+        print(f"pyjelly {args.command}: {error}", file=sys.stderr)  # noqa: T201
+        return 2
+    except BrokenPipeError:
+        # Output closed early, e.g. piped to `head`
+        sys.stderr.close()
+        return 0
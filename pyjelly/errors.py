@@ -8,3 +8,11 @@ class JellyAssertionError(AssertionError):
 
 class JellyNotImplementedError(NotImplementedError):
     """Raised when a future feature is not yet implemented."""
+
+
+class JellyMemoryError(MemoryError):
+    """Raised when a stream holds more memory than its configured ceiling."""
+
+
+class JellyMemoryWarning(RuntimeWarning):
+    """Warned when a stream holds more memory than its configured ceiling."""
@@ -1,23 +1,56 @@
 from __future__ import annotations
 
-from collections import deque
-from collections.abc import Generator
-from typing import IO, NamedTuple, Union
+import os
+from collections import OrderedDict, deque
+from collections.abc import Callable, Generator, Hashable, Iterable, Iterator
+from contextlib import contextmanager
+from itertools import chain
+from pathlib import Path
+from typing import IO, Final, NamedTuple, Protocol, Union
+
+from pyjelly import jelly
+from pyjelly.parse.ioutils import get_options_and_frames
+from pyjelly.parse.scan import scan_stream
 
 
 class _DefaultGraph:
     def __repr__(self) -> str:
         return ""
 
+    def __reduce__(self) -> str:
+        # Unpickle to the DefaultGraph singleton
+        return "DefaultGraph"
+
 
 DefaultGraph = _DefaultGraph()
 
 
-class BlankNode:
+class _Term:
+    """Base for immutable terms with a hash computed once, on construction."""
+
+    __slots__ = ("_hash",)
+
+    _hash: int
+
+    def __setattr__(self, name: str, value: object) -> None:
+        msg = f"{type(self).__name__} is immutable"
+        raise AttributeError(msg)
+
+    def __delattr__(self, name: str) -> None:
+        msg = f"{type(self).__name__} is immutable"
+        raise AttributeError(msg)
+
+
+class BlankNode(_Term):
     """Class for blank nodes, storing BN's identifier as a string."""
 
+    __slots__ = ("_identifier",)
+
+    _identifier: str
+
     def __init__(self, identifier: str) -> None:
-        self._identifier: str = identifier
+        object.__setattr__(self, "_identifier", identifier)
+        object.__setattr__(self, "_hash", hash(identifier))
 
     def __str__(self) -> str:
         return f"_:{self._identifier}"
@@ -25,20 +58,30 @@ class BlankNode:
     def __repr__(self) -> str:
         return f"BlankNode(identifier={self._identifier})"
 
+    def __reduce__(self) -> tuple[type[BlankNode], tuple[str]]:
+        return BlankNode, (self._identifier,)
+
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if isinstance(other, BlankNode):
             return self._identifier == other._identifier
         return False
 
     def __hash__(self) -> int:
-        return hash(self._identifier)
+        return self._hash
 
 
-class IRI:
+class IRI(_Term):
     """Class for IRIs, storing IRI as a string."""
 
+    __slots__ = ("_iri",)
+
+    _iri: str
+
     def __init__(self, iri: str) -> None:
-        self._iri: str = iri
+        object.__setattr__(self, "_iri", iri)
+        object.__setattr__(self, "_hash", hash(iri))
 
     def __str__(self) -> str:
         return f"<{self._iri}>"
@@ -46,16 +89,21 @@ class IRI:
     def __repr__(self) -> str:
         return f"IRI({self._iri})"
 
+    def __reduce__(self) -> tuple[type[IRI], tuple[str]]:
+        return IRI, (self._iri,)
+
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if isinstance(other, IRI):
             return self._iri == other._iri
         return False
 
     def __hash__(self) -> int:
-        return hash(self._iri)
+        return self._hash
 
 
-class Literal:
+class Literal(_Term):
     """
     Class for literals.
 
@@ -65,12 +113,19 @@ class Literal:
 
     """
 
+    __slots__ = ("_datatype", "_langtag", "_lex")
+
+    _lex: str
+    _langtag: str | None
+    _datatype: str | None
+
     def __init__(
         self, lex: str, langtag: str | None = None, datatype: str | None = None
     ) -> None:
-        self._lex: str = lex
-        self._langtag: str | None = langtag
-        self._datatype: str | None = datatype
+        object.__setattr__(self, "_lex", lex)
+        object.__setattr__(self, "_langtag", langtag)
+        object.__setattr__(self, "_datatype", datatype)
+        object.__setattr__(self, "_hash", hash((lex, langtag, datatype)))
 
     def __str__(self) -> str:
         suffix = ""
@@ -86,17 +141,98 @@ class Literal:
             f"datatype={self._datatype!r})"
         )
 
+    def __reduce__(
+        self,
+    ) -> tuple[type[Literal], tuple[str, str | None, str | None]]:
+        return Literal, (self._lex, self._langtag, self._datatype)
+
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if isinstance(other, Literal):
             return (
-                self._lex == other._lex
+                self._hash == other._hash
+                and self._lex == other._lex
                 and self._langtag == other._langtag
                 and self._datatype == other._datatype
             )
         return False
 
     def __hash__(self) -> int:
-        return hash((self._lex, self._langtag, self._datatype))
+        return self._hash
+
+
+DEFAULT_TERM_CACHE_SIZE = 1 << 16
+
+
+class TermFactory:
+    """
+    Flyweight factory returning one shared instance per distinct term.
+
+    Notes:
+        Parsed streams repeat the same IRIs, blank nodes and literals many
+        times; interning them keeps a single object per term in memory.
+        Each cache keeps at most `max_size` terms and evicts the least
+        recently used one first, which bounds memory when parsing long
+        streams with many unique terms while frequent terms stay shared.
+
+    Args:
+        max_size (int | None): maximum number of cached terms of each kind,
+            None for no limit. Defaults to DEFAULT_TERM_CACHE_SIZE.
+
+    """
+
+    __slots__ = ("_bnodes", "_iris", "_literals", "max_size")
+
+    def __init__(self, max_size: int | None = DEFAULT_TERM_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._iris = OrderedDict[str, IRI]()
+        self._bnodes = OrderedDict[str, BlankNode]()
+        self._literals = OrderedDict[tuple[str, str | None, str | None], Literal]()
+
+    def iri(self, iri: str) -> IRI:
+        iris = self._iris
+        term = iris.get(iri)
+        if term is None:
+            term = iris[iri] = IRI(iri)
+            if self.max_size is not None and len(iris) > self.max_size:
+                iris.popitem(last=False)
+        else:
+            iris.move_to_end(iri)
+        return term
+
+    def bnode(self, identifier: str) -> BlankNode:
+        bnodes = self._bnodes
+        term = bnodes.get(identifier)
+        if term is None:
+            term = bnodes[identifier] = BlankNode(identifier)
+            if self.max_size is not None and len(bnodes) > self.max_size:
+                bnodes.popitem(last=False)
+        else:
+            bnodes.move_to_end(identifier)
+        return term
+
+    def literal(
+        self, lex: str, langtag: str | None = None, datatype: str | None = None
+    ) -> Literal:
+        key = (lex, langtag, datatype)
+        literals = self._literals
+        term = literals.get(key)
+        if term is None:
+            term = literals[key] = Literal(lex, langtag, datatype)
+            if self.max_size is not None and len(literals) > self.max_size:
+                literals.popitem(last=False)
+        else:
+            literals.move_to_end(key)
+        return term
+
+    def __len__(self) -> int:
+        return len(self._iris) + len(self._bnodes) + len(self._literals)
+
+    def clear(self) -> None:
+        self._iris.clear()
+        self._bnodes.clear()
+        self._literals.clear()
 
 
 Node = Union[BlankNode, IRI, Literal, "Triple"]
@@ -130,27 +266,115 @@ class Prefix(NamedTuple):
     iri: IRI
 
 
+TriplePattern = tuple[Node | None, Node | None, Node | None]
+QuadPattern = tuple[Node | None, Node | None, Node | None, GraphName | None]
+
+_NestedIndex = dict[object, dict[object, list["Triple | Quad"]]]
+
+# Positions of the (outer key, inner key) of each two-level index
+INDEX_KEYS: Final[dict[str, tuple[int, int]]] = {
+    "spo": (0, 1),
+    "pos": (1, 2),
+    "osp": (2, 0),
+}
+
+
+def graph_of(statement: Triple | Quad) -> GraphName:
+    """Return the graph name of a statement; triples are in the default graph."""
+    return statement.g if isinstance(statement, Quad) else DefaultGraph
+
+
+class StatementStore(Protocol):
+    """
+    Storage backend of GenericStatementSink.
+
+    Notes:
+        Must preserve insertion order. `collections.deque` (the default)
+        and `pyjelly.integrations.generic.stores.ColumnarStore` implement it.
+        A store may also define `statement_key(statement) -> Hashable`,
+        a compact key used by deduplicating sinks instead of the statement.
+
+    """
+
+    def append(self, statement: Triple | Quad, /) -> None: ...
+
+    def __getitem__(self, index: int, /) -> Triple | Quad: ...
+
+    def __iter__(self) -> Iterator[Triple | Quad]: ...
+
+    def __len__(self) -> int: ...
+
+    def clear(self) -> None: ...
+
+
+def _statement_as_key(statement: Triple | Quad) -> Hashable:
+    return statement
+
+
 class GenericStatementSink:
-    _store: deque[Triple | Quad]
+    _store: StatementStore
+    _indexes: dict[str, _NestedIndex]
+    _graph_index: dict[GraphName, list[Triple | Quad]] | None
+    _seen: set[Hashable] | None
+    _statement_key: Callable[[Triple | Quad], Hashable]
 
-    def __init__(self, identifier: GraphName = DefaultGraph) -> None:
+    def __init__(
+        self,
+        identifier: GraphName = DefaultGraph,
+        store: StatementStore | None = None,
+        *,
+        deduplicate: bool = False,
+    ) -> None:
         """
         Initialize statements storage, namespaces dictionary, and parser.
 
         Notes:
             _store preserves the order of statements.
+            With `deduplicate`, a set of seen statements (or of compact keys,
+            if the store provides them) is kept next to the store.
 
         Args:
             identifier (str, optional): Identifier for a sink.
                 Defaults to DefaultGraph.
+            store (StatementStore | None, optional): empty storage backend,
+                e.g. a ColumnarStore for large datasets. Defaults to a deque.
+            deduplicate (bool, optional): skip statements that were already
+                added, keeping the first-seen order. Defaults to False.
 
         """
-        self._store: deque[Triple | Quad] = deque()
+        self._store = deque() if store is None else store
         self._namespaces: dict[str, IRI] = {}
         self._identifier = identifier
+        self._indexes = {}
+        self._graph_index = None
+        self._seen = set() if deduplicate else None
+        self._statement_key = getattr(self._store, "statement_key", _statement_as_key)
+        self._duplicates = 0
+
+    @property
+    def deduplicate(self) -> bool:
+        return self._seen is not None
+
+    @property
+    def duplicates(self) -> int:
+        """Number of duplicate statements skipped by `add` (in deduplicate mode)."""
+        return self._duplicates
 
     def add(self, statement: Triple | Quad) -> None:
+        if self._seen is not None:
+            key = self._statement_key(statement)
+            if key in self._seen:
+                self._duplicates += 1
+                return
+            self._seen.add(key)
         self._store.append(statement)
+        for name, index in self._indexes.items():
+            outer, inner = INDEX_KEYS[name]
+            index.setdefault(statement[outer], {}).setdefault(
+                statement[inner], []
+            ).append(statement)
+        if self._graph_index is not None:
+            self._graph_index.setdefault(graph_of(statement), []).append(statement)
 
     def bind(self, prefix: str, namespace: IRI) -> None:
         self._namespaces.update({prefix: namespace})
@@ -184,15 +408,114 @@ class GenericStatementSink:
         """
         return bool(self._store) and len(self._store[0]) == TRIPLE_ARITY
 
+    def _index(self, name: str) -> _NestedIndex:
+        """Return the named index, building it from the store on first use."""
+        index = self._indexes.get(name)
+        if index is None:
+            index = {}
+            outer, inner = INDEX_KEYS[name]
+            for statement in self:
+                index.setdefault(statement[outer], {}).setdefault(
+                    statement[inner], []
+                ).append(statement)
+            self._indexes[name] = index
+        return index
+
+    def _graph_statements(self, graph: GraphName) -> list[Triple | Quad]:
+        if self._graph_index is None:
+            self._graph_index = {}
+            for statement in self:
+                self._graph_index.setdefault(graph_of(statement), []).append(statement)
+        return self._graph_index.get(graph, [])
+
+    def drop_indexes(self) -> None:
+        """Free all built indexes; they are rebuilt lazily on the next query."""
+        self._indexes = {}
+        self._graph_index = None
+
+    def _match(
+        self, s: Node | None, p: Node | None, o: Node | None
+    ) -> Iterable[Triple | Quad]:
+        """Select candidate statements with the most specific index available."""
+        name: str
+        outer: Node
+        inner: Node | None
+        if s is not None:
+            name, outer, inner = (
+                ("osp", o, s) if p is None and o is not None else ("spo", s, p)
+            )
+        elif p is not None:
+            name, outer, inner = "pos", p, o
+        elif o is not None:
+            name, outer, inner = "osp", o, None
+        else:
+            return self
+        by_inner = self._index(name).get(outer, {})
+        candidates: Iterable[Triple | Quad] = (
+            chain.from_iterable(by_inner.values())
+            if inner is None
+            else by_inner.get(inner, [])
+        )
+        if s is not None and p is not None and o is not None:
+            return (statement for statement in candidates if statement[2] == o)
+        return candidates
+
+    def triples(self, pattern: TriplePattern) -> Generator[Triple | Quad]:
+        """
+        Yield statements matching an s/p/o pattern, in any graph.
+
+        Notes:
+            Indexes needed for the pattern are built on the first query
+            and maintained incrementally by `add` afterwards.
+            Statements are yielded as stored, quads included.
+
+        Args:
+            pattern (TriplePattern): (s, p, o) terms, None matches any term
+
+        Yields:
+            Triple | Quad: matching statements
+
+        """
+        s, p, o = pattern
+        yield from self._match(s, p, o)
+
+    def quads(self, pattern: QuadPattern) -> Generator[Triple | Quad]:
+        """
+        Yield statements matching an s/p/o/g pattern.
+
+        Notes:
+            Triples belong to the default graph (`DefaultGraph`).
+
+        Args:
+            pattern (QuadPattern): (s, p, o, g) terms, None matches any term
+
+        Yields:
+            Triple | Quad: matching statements
+
+        """
+        s, p, o, g = pattern
+        if g is None:
+            yield from self._match(s, p, o)
+        elif s is None and p is None and o is None:
+            yield from self._graph_statements(g)
+        else:
+            for statement in self._match(s, p, o):
+                if graph_of(statement) == g:
+                    yield statement
+
     def parse(self, input_file: IO[bytes]) -> None:
         from pyjelly.integrations.generic.parse import (  # noqa: PLC0415
             parse_jelly_to_graph,
         )
 
-        parsed_result = parse_jelly_to_graph(input_file)
-        self._store = parsed_result._store
-        self._namespaces = parsed_result._namespaces
-        self._identifier = parsed_result._identifier
+        self._store.clear()
+        self._namespaces = {}
+        self._identifier = DefaultGraph
+        self.drop_indexes()
+        if self._seen is not None:
+            self._seen.clear()
+        self._duplicates = 0
+        parse_jelly_to_graph(input_file, sink_factory=lambda: self)
 
     def serialize(self, output_file: IO[bytes]) -> None:
         from pyjelly.integrations.generic.serialize import (  # noqa: PLC0415
@@ -200,3 +523,95 @@ class GenericStatementSink:
         )
 
         grouped_stream_to_file((sink for sink in [self]), output_file)
+
+
+class LazyStatementSink(GenericStatementSink):
+    """
+    Read-only sink backed by a Jelly file, decoding statements on demand.
+
+    Notes:
+        Only the path (or file object) is kept; every iteration re-reads
+        and decodes the file frame by frame, so memory use does not grow
+        with the file size. Namespaces declared in the stream are available
+        after the first full pass. `len()` is computed without decoding terms.
+        Pattern queries still build in-memory indexes.
+
+    Args:
+        source (str | os.PathLike[str] | IO[bytes]): path of a Jelly file,
+            or a seekable binary file object positioned at the stream start
+        identifier (GraphName, optional): Identifier for a sink.
+            Defaults to DefaultGraph.
+
+    """
+
+    def __init__(
+        self,
+        source: str | os.PathLike[str] | IO[bytes],
+        identifier: GraphName = DefaultGraph,
+    ) -> None:
+        super().__init__(identifier)
+        self._source: str | os.PathLike[str] | IO[bytes] = source
+        self._start = 0
+        self._length: int | None = None
+        self._physical_type: int | None = None
+        self.parse_from(source)
+
+    def parse_from(self, source: str | os.PathLike[str] | IO[bytes]) -> None:
+        """Point the sink at another Jelly file; nothing is read yet."""
+        self._source = source
+        self._start = 0 if isinstance(source, (str, os.PathLike)) else source.tell()
+        self._length = None
+        self._physical_type = None
+        self._namespaces = {}
+        self.drop_indexes()
+
+    @contextmanager
+    def _open(self) -> Generator[IO[bytes]]:
+        if isinstance(self._source, (str, os.PathLike)):
+            with Path(self._source).open("rb") as file:
+                yield file
+        else:
+            self._source.seek(self._start)
+            yield self._source
+
+    def __iter__(self) -> Generator[Triple | Quad]:
+        from pyjelly.integrations.generic.parse import (  # noqa: PLC0415
+            parse_jelly_flat,
+        )
+
+        count = 0
+        with self._open() as inp:
+            for item in parse_jelly_flat(inp):
+                if isinstance(item, Prefix):
+                    self._namespaces[item.prefix] = item.iri
+                else:
+                    count += 1
+                    yield item
+        self._length = count
+
+    def __len__(self) -> int:
+        if self._length is None:
+            with self._open() as inp:
+                self._length = scan_stream(inp).statements
+        return self._length
+
+    @property
+    def store(self) -> Generator[Triple | Quad]:
+        yield from self
+
+    @property
+    def is_triples_sink(self) -> bool:
+        if self._physical_type is None:
+            with self._open() as inp:
+                options, _ = get_options_and_frames(inp)
+            self._physical_type = options.stream_types.physical_type
+        return (
+            self._physical_type == jelly.PHYSICAL_STREAM_TYPE_TRIPLES and len(self) > 0
+        )
+
+    def add(self, statement: Triple | Quad) -> None:  # noqa: ARG002
+        msg = "LazyStatementSink is read-only"
+        raise TypeError(msg)
+
+    def parse(self, input_file: IO[bytes]) -> None:
+        self.parse_from(input_file)
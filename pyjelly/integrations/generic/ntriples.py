@@ -0,0 +1,946 @@
+"""
+Streaming N-Triples and N-Quads reader and writer for the generic API.
+
+The reader works one line at a time, so memory use does not grow with the
+input, and supports quoted triples (RDF-star). Parsed statements can be
+passed straight to `flat_stream_to_frames`:
+
+>>> lines = ['<http://example.com/s> <http://example.com/p> "o"@en .']
+>>> for statement in parse_lines(lines):
+...     print(*statement)
+<http://example.com/s> <http://example.com/p> "o"@en
+>>> list(split_lines(lines))
+[('<http://example.com/s>', '<http://example.com/p>', '"o"@en')]
+
+In the other direction, `jelly_to_ntriples` writes a Jelly stream as
+N-Triples or N-Quads without creating term objects.
+"""
+
+from __future__ import annotations
+
+import io
+import re
+from collections.abc import Generator, Iterable
+from time import perf_counter_ns
+from typing import IO, Any, Final, cast
+
+from mypy_extensions import mypyc_attr
+
+from pyjelly import jelly
+from pyjelly.errors import JellyConformanceError
+from pyjelly.integrations.generic.generic_sink import (
+    DEFAULT_TERM_CACHE_SIZE,
+    IRI,
+    BlankNode,
+    DefaultGraph,
+    GraphName,
+    Literal,
+    Node,
+    Quad,
+    TermFactory,
+    Triple,
+)
+from pyjelly.memory import MemoryTracker
+from pyjelly.parse.decode import Adapter, Decoder, ParserOptions
+from pyjelly.parse.ioutils import get_options_and_frames
+from pyjelly.parse.lookup import LookupDecoder, TrustedLookupDecoder
+from pyjelly.profiling import DECODE_LOOKUP
+
+MAX_LINE_LENGTH: Final = 1 << 24
+MAX_NESTING: Final = 64
+ERROR_CONTEXT: Final = 200
+CHUNK_SIZE: Final = 1 << 20
+
+_UCHAR = r"\\u[0-9A-Fa-f]{4}|\\U[0-9A-Fa-f]{8}"
+# Absolute IRI: a scheme, then characters allowed in IRIREF and escapes.
+# Runs of plain characters are matched as in "unrolling the loop", which
+# keeps matching linear when a line turns out to be invalid.
+_IRI_CHARS = r"[^\x00-\x20<>\"{}|^`\\]*"
+_IRI = rf"<([A-Za-z][A-Za-z0-9+.-]*:{_IRI_CHARS}(?:(?:{_UCHAR}){_IRI_CHARS})*)>"
+_PN_CHARS_U = (
+    "A-Za-z_:\u00c0-\u00d6\u00d8-\u00f6\u00f8-\u02ff\u0370-\u037d"
+    "\u037f-\u1fff\u200c-\u200d\u2070-\u218f\u2c00-\u2fef\u3001-\ud7ff"
+    "\uf900-\ufdcf\ufdf0-\ufffd\U00010000-\U000effff"
+)
+_PN_CHARS = _PN_CHARS_U + "\\-0-9\u00b7\u0300-\u036f\u203f-\u2040"
+_BNODE = rf"_:([{_PN_CHARS_U}0-9](?:[{_PN_CHARS}.]*[{_PN_CHARS}])?)"
+_STRING_CHARS = r'[^"\\\n\r]*'
+_LANGUAGE_TAG = "[a-zA-Z]+(?:-[a-zA-Z0-9]+)*"
+_LITERAL = (
+    rf'"({_STRING_CHARS}(?:(?:\\[tbnrf"\'\\]|{_UCHAR}){_STRING_CHARS})*)"'
+    rf"(?:@({_LANGUAGE_TAG})|\^\^{_IRI})?"
+)
+_WS = "[ \t]*"
+
+# Fast path for statements without quoted triples, groups:
+# subject 1 (IRI 2, blank node 3), predicate 4 (IRI 5),
+# object 6 (IRI 7, blank node 8, literal 9 with language 10 or datatype 11),
+# graph 12 (IRI 13, blank node 14)
+_STATEMENT = re.compile(
+    rf"{_WS}({_IRI}|{_BNODE}){_WS}({_IRI}){_WS}({_IRI}|{_BNODE}|{_LITERAL})"
+    rf"{_WS}(?:({_IRI}|{_BNODE}){_WS})?\.{_WS}(?:#.*)?"
+)
+# One term or quoted triple delimiter, groups: term 1 (<< 2, >> 3, IRI 4,
+# blank node 5, literal 6 with language 7 or datatype 8)
+_TOKEN = re.compile(rf"{_WS}((<<)|(>>)|{_IRI}|{_BNODE}|{_LITERAL})")
+_END = re.compile(rf"{_WS}\.{_WS}(?:#.*)?")
+_SKIP = re.compile(rf"{_WS}(?:#.*)?")
+
+_ESCAPE = re.compile(r"\\(?:u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|(.))")
+_ECHARS = {"t": "\t", "b": "\b", "n": "\n", "r": "\r", "f": "\f"}
+
+# Canonical N-Triples escapes: ECHAR where one exists, UCHAR for the other
+# control characters; IRIs escape every character not allowed in IRIREF.
+_LEX_UNSAFE = re.compile(r'[\x00-\x1f"\\\x7f]')
+_LEX_ESCAPES = {
+    **{code: f"\\u{code:04X}" for code in (*range(0x20), 0x7F)},
+    **{ord(char): f"\\{escape}" for escape, char in _ECHARS.items()},
+    ord('"'): '\\"',
+    ord("\\"): "\\\\",
+}
+_IRI_UNSAFE = re.compile(r'[\x00-\x20<>"{}|^`\\]')
+_IRI_ESCAPES = {
+    code: f"\\u{code:04X}" for code in (*range(0x21), *map(ord, '<>"{}|^`\\'))
+}
+_BNODE_LABEL = re.compile(_BNODE[2:])
+_LANGUAGE = re.compile(_LANGUAGE_TAG)
+
+_QUOTED, _IRI_KIND, _BNODE_KIND, _LITERAL_KIND = (
+    "quoted triple",
+    "IRI",
+    "blank node",
+    "literal",
+)
+_ROLES = {
+    "subject": (_IRI_KIND, _BNODE_KIND, _QUOTED),
+    "predicate": (_IRI_KIND,),
+    "object": (_IRI_KIND, _BNODE_KIND, _LITERAL_KIND, _QUOTED),
+    "graph label": (_IRI_KIND, _BNODE_KIND),
+}
+
+
+def _unescape_match(match: re.Match[str]) -> str:
+    code = match.group(1) or match.group(2)
+    if code is None:
+        char = match.group(3)
+        return _ECHARS.get(char, char)
+    point = int(code, 16)
+    if point > 0x10FFFF or 0xD800 <= point <= 0xDFFF:  # noqa: PLR2004
+        msg = f"invalid code point escape \\{match.group(0)[1:]}"
+        raise ValueError(msg)
+    return chr(point)
+
+
+def _unescape(text: str) -> str:
+    return _ESCAPE.sub(_unescape_match, text) if "\\" in text else text
+
+
+def _kind(token: re.Match[str]) -> str:
+    if token.group(2) is not None:
+        return _QUOTED
+    if token.group(4) is not None:
+        return _IRI_KIND
+    if token.group(5) is not None:
+        return _BNODE_KIND
+    return _LITERAL_KIND
+
+
+class NTriplesParser:
+    """
+    Line parser for N-Triples and N-Quads, including quoted triples.
+
+    Notes:
+        Statements without quoted triples are matched with one regular
+        expression; other lines go through a small recursive parser, which
+        also reports the column of syntax errors.
+
+    Args:
+        quads (bool): return statements in the default graph as quads, so
+            that all statements of an N-Quads document are of one type
+        terms (TermFactory | None): factory used to create (and share)
+            terms, a new bounded one if omitted
+
+    """
+
+    __slots__ = ("quads", "terms")
+
+    def __init__(
+        self, *, quads: bool = False, terms: TermFactory | None = None
+    ) -> None:
+        self.quads = quads
+        self.terms = TermFactory() if terms is None else terms
+
+    def parse_line(self, line: str) -> Triple | Quad | None:
+        """
+        Parse one line into a statement.
+
+        Args:
+            line (str): line of the document, with or without the line break
+
+        Raises:
+            ValueError: if the line is not a valid statement
+
+        Returns:
+            Triple | Quad | None: statement, None for blank and comment lines
+
+        """
+        text = line.rstrip("\r\n")
+        match = _STATEMENT.fullmatch(text)
+        if match is None:
+            nodes = self.parse_general(text)
+            return None if nodes is None else self.statement(nodes)
+        (
+            _,
+            s_iri,
+            s_bnode,
+            _,
+            p_iri,
+            _,
+            o_iri,
+            o_bnode,
+            lex,
+            langtag,
+            datatype,
+            graph,
+            g_iri,
+            g_bnode,
+        ) = match.groups()
+        if "\\" in text:
+            s_iri, p_iri, o_iri, lex, datatype, g_iri = (
+                None if value is None else _unescape(value)
+                for value in (s_iri, p_iri, o_iri, lex, datatype, g_iri)
+            )
+        terms = self.terms
+        s: Node = terms.bnode(s_bnode) if s_iri is None else terms.iri(s_iri)
+        p = terms.iri(p_iri)
+        o: Node
+        if lex is not None:
+            o = terms.literal(lex, langtag, datatype)
+        elif o_iri is not None:
+            o = terms.iri(o_iri)
+        else:
+            o = terms.bnode(o_bnode)
+        if graph is not None:
+            g = terms.bnode(g_bnode) if g_iri is None else terms.iri(g_iri)
+            return Quad(s, p, o, g)
+        if self.quads:
+            return Quad(s, p, o, DefaultGraph)
+        return Triple(s, p, o)
+
+    def statement(self, nodes: list[Any]) -> Triple | Quad:
+        s, p, o, *graph = nodes
+        if graph:
+            return Quad(s, p, o, graph[0])
+        return Quad(s, p, o, DefaultGraph) if self.quads else Triple(s, p, o)
+
+    def split_line(self, line: str) -> tuple[str, ...] | None:
+        """
+        Split one line into its terms as written, without creating terms.
+
+        Args:
+            line (str): line of the document, with or without the line break
+
+        Raises:
+            ValueError: if the line is not a valid statement
+
+        Returns:
+            tuple[str, ...] | None: subject, predicate, object and, if
+                present, graph label in N-Triples syntax (escapes are not
+                decoded), None for blank and comment lines
+
+        """
+        text = line.rstrip("\r\n")
+        match = _STATEMENT.fullmatch(text)
+        if match is None:
+            raw = self.parse_general(text, raw=True)
+            return None if raw is None else tuple(raw)
+        graph = match.group(12)
+        if graph is None:
+            return match.group(1, 4, 6)
+        return match.group(1, 4, 6, 12)
+
+    def parse_general(self, text: str, *, raw: bool = False) -> list[Any] | None:
+        """
+        Parse the terms of a line the fast path did not match.
+
+        Args:
+            text (str): line without the line break
+            raw (bool): return terms as written instead of term objects
+
+        Raises:
+            ValueError: if the line is not a valid statement
+
+        Returns:
+            list[Any] | None: terms of the statement, None for blank and
+                comment lines
+
+        """
+        if _SKIP.fullmatch(text):
+            return None
+        terms = []
+        pos = 0
+        for role in ("subject", "predicate", "object"):
+            term, pos = self.parse_term(text, pos, role, raw=raw)
+            terms.append(term)
+        if not _END.fullmatch(text, pos):
+            graph, pos = self.parse_term(text, pos, "graph label", raw=raw)
+            terms.append(graph)
+            if not _END.fullmatch(text, pos):
+                raise self.error(text, pos, "expected '.' at the end of the statement")
+        return terms
+
+    def parse_term(
+        self, text: str, pos: int, role: str, *, raw: bool, depth: int = 0
+    ) -> tuple[Any, int]:
+        """
+        Parse one term, recursing into quoted triples.
+
+        Args:
+            text (str): line without the line break
+            pos (int): position to start at, before any whitespace
+            role (str): position of the term in its statement
+            raw (bool): return the term as written instead of a term object
+            depth (int): nesting depth of quoted triples
+
+        Raises:
+            ValueError: if there is no valid term for the role at `pos`
+
+        Returns:
+            tuple[Any, int]: term and the position after it
+
+        """
+        token = _TOKEN.match(text, pos)
+        if token is None or token.group(3) is not None:
+            raise self.error(text, pos, f"expected {role}")
+        kind = _kind(token)
+        if kind not in _ROLES[role]:
+            raise self.error(text, token.start(1), f"{kind} cannot be {role}")
+        end = token.end()
+        if kind == _QUOTED:
+            if depth == MAX_NESTING:
+                raise self.error(text, pos, "quoted triples nested too deeply")
+            depth += 1
+            s, end = self.parse_term(text, end, "subject", raw=raw, depth=depth)
+            p, end = self.parse_term(text, end, "predicate", raw=raw, depth=depth)
+            o, end = self.parse_term(text, end, "object", raw=raw, depth=depth)
+            close = _TOKEN.match(text, end)
+            if close is None or close.group(3) is None:
+                raise self.error(text, end, "expected '>>'")
+            end = close.end()
+            if raw:
+                return text[token.start(1) : end], end
+            return Triple(s, p, o), end
+        if raw:
+            return token.group(1), end
+        try:
+            return self.make_term(token, kind), end
+        except ValueError as error:
+            raise self.error(text, token.start(1), str(error)) from None
+
+    def make_term(self, token: re.Match[str], kind: str) -> Node:
+        terms = self.terms
+        if kind == _IRI_KIND:
+            return terms.iri(_unescape(token.group(4)))
+        if kind == _BNODE_KIND:
+            return terms.bnode(token.group(5))
+        lex, langtag, datatype = token.group(6, 7, 8)
+        return terms.literal(
+            _unescape(lex), langtag, None if datatype is None else _unescape(datatype)
+        )
+
+    @staticmethod
+    def error(text: str, pos: int, reason: str) -> ValueError:
+        if len(text) > ERROR_CONTEXT:
+            text = text[:ERROR_CONTEXT] + "..."
+        return ValueError(f"{reason} at column {pos + 1}: {text!r}")
+
+
+def parse_line(line: str) -> Triple | Quad | None:
+    """
+    Parse one N-Triples or N-Quads line.
+
+    Args:
+        line (str): line of the document
+
+    Raises:
+        ValueError: if the line is not a valid statement
+
+    Returns:
+        Triple | Quad | None: statement, None for blank and comment lines
+
+    """
+    return NTriplesParser(terms=TermFactory(max_size=None)).parse_line(line)
+
+
+def parse_lines(
+    lines: Iterable[str], *, quads: bool = False, terms: TermFactory | None = None
+) -> Generator[Triple | Quad]:
+    """
+    Parse N-Triples or N-Quads lines into statements, one line at a time.
+
+    Args:
+        lines (Iterable[str]): lines of the document, e.g. from `iter_lines`
+        quads (bool): yield statements in the default graph as quads
+            (N-Quads), so that all statements are of one type
+        terms (TermFactory | None): factory used to create (and share)
+            terms, a new bounded one if omitted
+
+    Raises:
+        ValueError: on an invalid line, with its line number
+
+    Yields:
+        Triple | Quad: parsed statements
+
+    """
+    parse = NTriplesParser(quads=quads, terms=terms).parse_line
+    number = 0
+    try:
+        for number, line in enumerate(lines, start=1):  # noqa: B007
+            statement = parse(line)
+            if statement is not None:
+                yield statement
+    except ValueError as error:
+        msg = f"line {number}: {error}"
+        raise ValueError(msg) from None
+
+
+def split_lines(lines: Iterable[str]) -> Generator[tuple[str, ...]]:
+    """
+    Split N-Triples or N-Quads lines into terms as plain strings.
+
+    Notes:
+        Lines are checked against the grammar, but no term objects are
+        created and escapes are not decoded, which makes this the cheapest
+        way to filter, count or route statements.
+        Use `parse_term` to turn a string back into a term.
+
+    Args:
+        lines (Iterable[str]): lines of the document, e.g. from `iter_lines`
+
+    Raises:
+        ValueError: on an invalid line, with its line number
+
+    Yields:
+        tuple[str, ...]: subject, predicate, object and graph label, if any
+
+    """
+    split = NTriplesParser().split_line
+    number = 0
+    try:
+        for number, line in enumerate(lines, start=1):  # noqa: B007
+            terms = split(line)
+            if terms is not None:
+                yield terms
+    except ValueError as error:
+        msg = f"line {number}: {error}"
+        raise ValueError(msg) from None
+
+
+def parse_term(text: str) -> Node:
+    """
+    Parse one term in N-Triples syntax, e.g. as returned by `split_lines`.
+
+    Args:
+        text (str): IRI, blank node, literal or quoted triple
+
+    Raises:
+        ValueError: if the text is not exactly one valid term
+
+    Returns:
+        Node: parsed term
+
+    """
+    parser = NTriplesParser(terms=TermFactory(max_size=None))
+    term, pos = parser.parse_term(text, 0, "object", raw=False)
+    if not _SKIP.fullmatch(text, pos):
+        raise parser.error(text, pos, "expected the end of the term")
+    return term  # type: ignore[no-any-return]
+
+
+def iter_lines(
+    inp: IO[str] | IO[bytes], *, max_line_length: int | None = MAX_LINE_LENGTH
+) -> Generator[str]:
+    """
+    Read lines from a text or binary (UTF-8) input, holding one at a time.
+
+    Args:
+        inp (IO[str] | IO[bytes]): input to read from; binary inputs are
+            left open
+        max_line_length (int | None): maximum line length in characters,
+            which bounds memory on malformed input, None for no limit
+
+    Raises:
+        ValueError: if a line is longer than `max_line_length`
+
+    Yields:
+        str: lines, with line breaks
+
+    """
+    binary = not isinstance(inp, io.TextIOBase)
+    text = (
+        io.TextIOWrapper(cast(IO[bytes], inp), encoding="utf-8")
+        if binary
+        else cast(IO[str], inp)
+    )
+    try:
+        if max_line_length is None:
+            yield from text
+            return
+        limit = max_line_length + 1
+        number = 0
+        while line := text.readline(limit):
+            number += 1
+            if len(line) == limit and line[-1] != "\n":
+                msg = f"line {number}: longer than {max_line_length} characters"
+                raise ValueError(msg)
+            yield line
+    finally:
+        # Leave the binary stream open, it may be stdin
+        if binary and not inp.closed:
+            cast(io.TextIOWrapper, text).detach()
+
+
+def format_iri(iri: str) -> str:
+    """
+    Return an IRI in N-Triples syntax.
+
+    Characters that cannot appear in an IRI reference are written as
+    numeric escapes, so the output can always be read back.
+
+    Args:
+        iri (str): IRI
+
+    Returns:
+        str: IRI in angle brackets
+
+    """
+    if _IRI_UNSAFE.search(iri):
+        iri = iri.translate(_IRI_ESCAPES)
+    return f"<{iri}>"
+
+
+def format_bnode(label: str) -> str:
+    """
+    Return a blank node in N-Triples syntax.
+
+    Jelly does not restrict blank node labels, so labels that are not valid
+    in N-Triples are replaced by "x" and the hex digits of their UTF-8 form.
+
+    Args:
+        label (str): blank node label
+
+    Returns:
+        str: blank node, prefixed with "_:"
+
+    """
+    if _BNODE_LABEL.fullmatch(label):
+        return f"_:{label}"
+    return f"_:x{label.encode().hex()}"
+
+
+def format_literal(
+    lex: str, language: str | None = None, datatype: str | None = None
+) -> str:
+    """
+    Return a literal in canonical N-Triples syntax.
+
+    Args:
+        lex (str): lexical form
+        language (str | None): language tag
+        datatype (str | None): datatype IRI, ignored if `language` is set
+
+    Raises:
+        ValueError: if the language tag is not well-formed
+
+    Returns:
+        str: quoted (and escaped) lexical form with its tag or datatype
+
+    """
+    if _LEX_UNSAFE.search(lex):
+        lex = lex.translate(_LEX_ESCAPES)
+    if language:
+        return f'"{lex}"{format_language(language)}'
+    if datatype:
+        return f'"{lex}"^^{format_iri(datatype)}'
+    return f'"{lex}"'
+
+
+def format_language(language: str) -> str:
+    """
+    Return the "@tag" suffix of a literal with the language tag.
+
+    Args:
+        language (str): language tag
+
+    Raises:
+        ValueError: if the language tag is not well-formed
+
+    Returns:
+        str: language tag suffix
+
+    """
+    if not _LANGUAGE.fullmatch(language):
+        msg = f"invalid language tag {language!r}"
+        raise ValueError(msg)
+    return f"@{language}"
+
+
+def term_to_nt(term: Node | GraphName) -> str:
+    """
+    Return the N-Triples form of a term.
+
+    Args:
+        term (Node | GraphName): IRI, blank node, literal or quoted triple
+
+    Returns:
+        str: term in N-Triples syntax
+
+    """
+    if isinstance(term, IRI):
+        return format_iri(term._iri)
+    if isinstance(term, Literal):
+        return format_literal(term._lex, term._langtag, term._datatype)
+    if isinstance(term, BlankNode):
+        return format_bnode(term._identifier)
+    if isinstance(term, Triple):
+        return f"<< {' '.join(map(term_to_nt, term))} >>"
+    return str(term)
+
+
+def statement_to_nt(statement: Triple | Quad) -> str:
+    """
+    Return one N-Triples/N-Quads line (with the line break) for a statement.
+
+    Notes:
+        Quads in the default graph are written without the graph term.
+
+    Args:
+        statement (Triple | Quad): statement to write
+
+    Returns:
+        str: statement line
+
+    """
+    s, p, o = map(term_to_nt, statement[:3])
+    if isinstance(statement, Quad) and statement.g is not DefaultGraph:
+        return f"{s} {p} {o} {term_to_nt(statement.g)} .\n"
+    return f"{s} {p} {o} .\n"
+
+
+def write_statements(
+    statements: Iterable[Triple | Quad], output: IO[str], *, quads: bool = True
+) -> int:
+    """
+    Write statements as N-Triples or N-Quads lines.
+
+    Args:
+        statements (Iterable[Triple | Quad]): statements to write
+        output (IO[str]): text output
+        quads (bool): allow named graphs (N-Quads); if False, a quad in
+            a named graph raises ValueError
+
+    Raises:
+        ValueError: if `quads` is False and a statement is in a named graph
+
+    Returns:
+        int: number of statements written
+
+    """
+    count = 0
+    for count, statement in enumerate(statements, start=1):  # noqa: B007
+        if (
+            not quads
+            and isinstance(statement, Quad)
+            and statement.g is not DefaultGraph
+        ):
+            msg = "N-Triples cannot hold statements in named graphs, use N-Quads"
+            raise ValueError(msg)
+        output.write(statement_to_nt(statement))
+    return count
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class NTriplesAdapter(Adapter):
+    """
+    Adapter that decodes terms and statements to N-Triples text.
+
+    Notes:
+        Terms are decoded to their N-Triples form and statements to whole
+        lines, so a frame can be written with one `str.join`. Namespace
+        declarations decode to None, as N-Triples has no prefixes.
+
+    Args:
+        options (ParserOptions): stream options
+        quads (bool): write statements in named graphs as N-Quads lines;
+            if False, such statements raise ValueError
+
+    """
+
+    def __init__(self, options: ParserOptions, *, quads: bool = True) -> None:
+        super().__init__(options=options)
+        self.quads = quads
+        self.graphs = (
+            options.stream_types.physical_type == jelly.PHYSICAL_STREAM_TYPE_GRAPHS
+        )
+        self.graph: str | None = None
+        self.bnodes: dict[str, str] = {}
+
+    def iri(self, iri: str) -> str:
+        return format_iri(iri)
+
+    def default_graph(self) -> str:
+        return ""
+
+    def bnode(self, bnode: str) -> str:
+        formatted = self.bnodes.get(bnode)
+        if formatted is None:
+            if len(self.bnodes) >= DEFAULT_TERM_CACHE_SIZE:
+                self.bnodes.clear()
+            formatted = self.bnodes[bnode] = format_bnode(bnode)
+        return formatted
+
+    def literal(
+        self,
+        lex: str,
+        language: str | None = None,
+        datatype: str | None = None,
+    ) -> str:
+        return format_literal(lex, language, datatype)
+
+    def triple(self, terms: Iterable[Any]) -> str:
+        if self.graphs:
+            if self.graph is None:
+                msg = "new graph was not started"
+                raise JellyConformanceError(msg)
+            return self.quad([*terms, self.graph])
+        s, p, o = terms
+        return f"{s} {p} {o} .\n"
+
+    def quad(self, terms: Iterable[Any]) -> str:
+        s, p, o, g = terms
+        if not g:
+            return f"{s} {p} {o} .\n"
+        if not self.quads:
+            msg = "N-Triples cannot hold statements in named graphs, use N-Quads"
+            raise ValueError(msg)
+        return f"{s} {p} {o} {g} .\n"
+
+    def quoted_triple(self, terms: Iterable[Any]) -> str:
+        s, p, o = terms
+        return f"<< {s} {p} {o} >>"
+
+    def graph_start(self, graph_id: str) -> None:
+        self.graph = graph_id
+
+    def graph_end(self) -> None:
+        self.graph = None
+
+    def namespace_declaration(self, name: str, iri: str) -> None:  # noqa: ARG002
+        return None
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class NTriplesDecoder(Decoder):
+    """
+    Decoder that formats IRIs and datatypes once per lookup entry.
+
+    Notes:
+        Each name table slot caches the last IRI formatted from it, together
+        with the prefix it was formatted with, and each datatype table slot
+        caches its datatype suffix. A slot's cache is dropped when the stream
+        assigns a new entry to it, so the caches hold at most one string per
+        name and datatype table slot.
+
+    Args:
+        adapter (NTriplesAdapter): adapter producing the N-Triples text
+        trusted (bool): skip conformance checks of the lookups and stream
+            options, see `TrustedDecoder`.
+        memory (MemoryTracker | None): track (and limit) the memory held by
+            the decoder, see `MemoryTracker`.
+
+    """
+
+    def __init__(
+        self,
+        adapter: NTriplesAdapter,
+        *,
+        trusted: bool = False,
+        memory: MemoryTracker | None = None,
+    ) -> None:
+        self.trusted = trusted
+        super().__init__(adapter, memory)
+        self.iris: list[tuple[str, str] | None] = [None] * self.names.lookup_size
+        self.datatype_suffixes: list[str | None] = [None] * self.datatypes.lookup_size
+        self.languages: dict[str, str] = {}
+
+    def make_lookup(self, lookup_size: int) -> LookupDecoder:
+        if self.trusted:
+            return TrustedLookupDecoder(lookup_size=lookup_size)
+        return LookupDecoder(lookup_size=lookup_size)
+
+    def validate_stream_options(self, options: jelly.RdfStreamOptions) -> None:
+        if not self.trusted:
+            super().validate_stream_options(options)
+
+    def ingest_name_entry(self, entry: jelly.RdfNameEntry) -> None:
+        super().ingest_name_entry(entry)
+        self.iris[self.names.last_assigned_index - 1] = None
+
+    def ingest_datatype_entry(self, entry: jelly.RdfDatatypeEntry) -> None:
+        super().ingest_datatype_entry(entry)
+        self.datatype_suffixes[self.datatypes.last_assigned_index - 1] = None
+
+    def decode_iri(self, iri: jelly.RdfIri) -> str:
+        profiler = self.profiler
+        start = perf_counter_ns() if profiler is not None else 0
+        names = self.names
+        name = names.decode_name_term_index(iri.name_id)
+        prefix = self.prefixes.decode_prefix_term_index(iri.prefix_id)
+        if profiler is not None:
+            profiler.add(DECODE_LOOKUP, perf_counter_ns() - start)
+        index = names.last_reused_index - 1
+        cached = self.iris[index]
+        if cached is not None and cached[0] == prefix:
+            return cached[1]
+        formatted = format_iri(prefix + name)
+        self.iris[index] = (prefix, formatted)
+        return formatted
+
+    def decode_literal(self, literal: jelly.RdfLiteral) -> str:
+        lex = literal.lex
+        if _LEX_UNSAFE.search(lex):
+            lex = lex.translate(_LEX_ESCAPES)
+        if literal.langtag:
+            language = self.languages.get(literal.langtag)
+            if language is None:
+                if len(self.languages) >= DEFAULT_TERM_CACHE_SIZE:
+                    self.languages.clear()
+                language = self.languages[literal.langtag] = format_language(
+                    literal.langtag
+                )
+            return f'"{lex}"{language}'
+        if self.datatypes.lookup_size and literal.HasField("datatype"):
+            profiler = self.profiler
+            start = perf_counter_ns() if profiler is not None else 0
+            datatype = self.datatypes.decode_datatype_term_index(literal.datatype)
+            if profiler is not None:
+                profiler.add(DECODE_LOOKUP, perf_counter_ns() - start)
+            index = literal.datatype - 1
+            suffix = self.datatype_suffixes[index]
+            if suffix is None:
+                suffix = f"^^{format_iri(cast(str, datatype))}"
+                self.datatype_suffixes[index] = suffix
+            return f'"{lex}"{suffix}'
+        return f'"{lex}"'
+
+
+def ntriples_chunks(  # noqa: PLR0913
+    frames: Iterable[jelly.RdfStreamFrame],
+    options: ParserOptions,
+    *,
+    quads: bool | None = None,
+    trusted: bool = False,
+    memory: MemoryTracker | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Generator[str]:
+    """
+    Decode Jelly frames to N-Triples or N-Quads text in large chunks.
+
+    Notes:
+        Each frame is formatted into one string, and frames are joined
+        until the chunk has at least `chunk_size` characters. A chunk
+        always ends with a whole line.
+
+    Args:
+        frames (Iterable[jelly.RdfStreamFrame]): frames of the stream
+        options (ParserOptions): stream options
+        quads (bool | None): write N-Quads; if False, statements in named
+            graphs raise ValueError. Defaults to N-Quads for quad and graph
+            streams and to N-Triples for triple streams.
+        trusted (bool): skip conformance checks for input from a trusted
+            producer, see `TrustedDecoder`.
+        memory (MemoryTracker | None): track (and limit) the memory held by
+            the decoder, see `MemoryTracker`.
+        chunk_size (int): minimum number of characters in a chunk, except
+            the last one
+
+    Raises:
+        NotImplementedError: if the physical type is not supported
+
+    Yields:
+        str: N-Triples/N-Quads lines
+
+    """
+    physical_type = options.stream_types.physical_type
+    if physical_type not in (
+        jelly.PHYSICAL_STREAM_TYPE_TRIPLES,
+        jelly.PHYSICAL_STREAM_TYPE_QUADS,
+        jelly.PHYSICAL_STREAM_TYPE_GRAPHS,
+    ):
+        physical_type_name = jelly.PhysicalStreamType.Name(physical_type)
+        msg = f"the stream type {physical_type_name} is not supported "
+        raise NotImplementedError(msg)
+    if quads is None:
+        quads = physical_type != jelly.PHYSICAL_STREAM_TYPE_TRIPLES
+    adapter = NTriplesAdapter(options, quads=quads)
+    decoder = NTriplesDecoder(adapter, trusted=trusted, memory=memory)
+    pending: list[str] = []
+    size = 0
+    for frame in frames:
+        # Namespace declarations decode to None and are dropped here
+        text = "".join(filter(None, decoder.iter_rows(frame)))
+        pending.append(text)
+        size += len(text)
+        if size >= chunk_size:
+            yield "".join(pending)
+            pending.clear()
+            size = 0
+    if size:
+        yield "".join(pending)
+
+
+def jelly_to_ntriples(  # noqa: PLR0913
+    inp: IO[bytes],
+    output: IO[bytes],
+    *,
+    quads: bool | None = None,
+    trusted: bool = False,
+    memory: MemoryTracker | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> int:
+    """
+    Convert a Jelly stream to N-Triples or N-Quads.
+
+    Writes the UTF-8 encoded output in chunks of about `chunk_size`
+    characters, see `ntriples_chunks`.
+
+    Args:
+        inp (IO[bytes]): Jelly input
+        output (IO[bytes]): binary output
+        quads (bool | None): write N-Quads; if False, statements in named
+            graphs raise ValueError. Defaults to N-Quads for quad and graph
+            streams and to N-Triples for triple streams.
+        trusted (bool): skip conformance checks for input from a trusted
+            producer, see `TrustedDecoder`.
+        memory (MemoryTracker | None): track (and limit) the memory held by
+            the decoder, see `MemoryTracker`.
+        chunk_size (int): minimum number of characters written at once
+
+    Returns:
+        int: number of statements written
+
+    """
+    options, frames = get_options_and_frames(inp)
+    count = 0
+    for chunk in ntriples_chunks(
+        frames,
+        options,
+        quads=quads,
+        trusted=trusted,
+        memory=memory,
+        chunk_size=chunk_size,
+    ):
+        # Escaping leaves no line breaks inside terms
+        count += chunk.count("\n")
+        output.write(chunk.encode())
+    return count
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Generator, Iterable, MutableMapping
+from collections.abc import (
+    AsyncGenerator,
+    Callable,
+    Generator,
+    Iterable,
+    MutableMapping,
+)
 from contextvars import ContextVar
 from itertools import chain
 from typing import IO, Any
@@ -19,10 +25,20 @@ from pyjelly.integrations.generic.generic_sink import (
     Literal,
     Prefix,
     Quad,
+    TermFactory,
     Triple,
 )
-from pyjelly.parse.decode import Adapter, Decoder, ParserOptions
-from pyjelly.parse.ioutils import get_options_and_frames
+from pyjelly.memory import MemoryTracker
+from pyjelly.options import check_logical_type
+from pyjelly.parse.aioutils import AsyncByteSource, async_get_options_and_frames
+from pyjelly.parse.decode import (
+    Adapter,
+    Decoder,
+    ParserOptions,
+    ParsingMode,
+    create_decoder,
+)
+from pyjelly.parse.ioutils import get_options_and_frames, read_ahead_frames
 
 Statement = Triple | Quad
 
@@ -35,19 +51,32 @@ class GenericStatementSinkAdapter(Adapter):
     Notes:
         Returns custom RDF terms expected by GenericStatementSink,
         handles namespace declarations, and quoted triples.
+        Terms are interned through a TermFactory, so repeated terms
+        share one instance.
 
     Args:
         Adapter (_type_): base Adapter class
 
     """
 
+    terms: TermFactory
+
+    def __init__(
+        self,
+        options: ParserOptions,
+        parsing_mode: ParsingMode = ParsingMode.FLAT,
+        terms: TermFactory | None = None,
+    ) -> None:
+        super().__init__(options=options, parsing_mode=parsing_mode)
+        self.terms = TermFactory() if terms is None else terms
+
     @override
     def iri(self, iri: str) -> IRI:
-        return IRI(iri)
+        return self.terms.iri(iri)
 
     @override
     def bnode(self, bnode: str) -> BlankNode:
-        return BlankNode(bnode)
+        return self.terms.bnode(bnode)
 
     @override
     def default_graph(self) -> GraphName:
@@ -60,11 +89,12 @@ class GenericStatementSinkAdapter(Adapter):
         language: str | None = None,
         datatype: str | None = None,
     ) -> Literal:
-        return Literal(lex, language, datatype)
+        return self.terms.literal(lex, language, datatype)
 
     @override
-    def namespace_declaration(self, name: str, iri: str) -> Prefix:
-        return Prefix(name, self.iri(iri))
+    def namespace_declaration(self, name: str, iri: IRI | str) -> Prefix:
+        # The decoder passes the IRI term it already decoded
+        return Prefix(name, iri if isinstance(iri, IRI) else self.iri(iri))
 
     @override
     def quoted_triple(self, terms: Iterable[Any]) -> Triple:
@@ -164,6 +194,9 @@ def parse_triples_stream(
     frames: Iterable[jelly.RdfStreamFrame],
     options: ParserOptions,
     frame_metadata: ContextVar[MutableMapping[str, bytes]] | None = None,
+    *,
+    trusted: bool = False,
+    memory: MemoryTracker | None = None,
 ) -> Generator[Iterable[Triple | Prefix]]:
     """
     Parse flat triple stream.
@@ -173,6 +206,10 @@ def parse_triples_stream(
         options (ParserOptions): stream options
         frame_metadata: (ContextVar[ScalarMap[str, bytes]]): context variable
                 used for extracting frame metadata
+        trusted (bool): skip per-row conformance checks for input from
+            a trusted producer, see `TrustedDecoder`.
+        memory (MemoryTracker | None): track (and limit) the memory held by
+            the decoder, see `MemoryTracker`.
 
     Yields:
         Generator[Iterable[Triple | Prefix]]:
@@ -181,7 +218,7 @@ def parse_triples_stream(
 
     """
     adapter = GenericTriplesAdapter(options)
-    decoder = Decoder(adapter=adapter)
+    decoder = create_decoder(adapter, trusted=trusted, memory=memory)
     for frame in frames:
         if frame_metadata is not None:
             frame_metadata.set(
@@ -195,6 +232,9 @@ def parse_quads_stream(
     frames: Iterable[jelly.RdfStreamFrame],
     options: ParserOptions,
     frame_metadata: ContextVar[MutableMapping[str, bytes]] | None = None,
+    *,
+    trusted: bool = False,
+    memory: MemoryTracker | None = None,
 ) -> Generator[Iterable[Quad | Prefix]]:
     """
     Parse flat quads stream.
@@ -204,6 +244,10 @@ def parse_quads_stream(
         options (ParserOptions): stream options
         frame_metadata: (ContextVar[ScalarMap[str, bytes]]): context variable
                 used for extracting frame metadata
+        trusted (bool): skip per-row conformance checks for input from
+            a trusted producer, see `TrustedDecoder`.
+        memory (MemoryTracker | None): track (and limit) the memory held by
+            the decoder, see `MemoryTracker`.
 
     Yields:
         Generator[Iterable[Quad | Prefix]]:
@@ -217,7 +261,7 @@ def parse_quads_stream(
     else:
         adapter_class = GenericGraphsAdapter
     adapter = adapter_class(options=options)
-    decoder = Decoder(adapter=adapter)
+    decoder = create_decoder(adapter, trusted=trusted, memory=memory)
     for frame in frames:
         if frame_metadata is not None:
             frame_metadata.set(
@@ -227,12 +271,15 @@ def parse_quads_stream(
     return
 
 
-def parse_jelly_grouped(
+def parse_jelly_grouped(  # noqa: PLR0913
     inp: IO[bytes],
     sink_factory: Callable[[], GenericStatementSink] = lambda: GenericStatementSink(),
     *,
     logical_type_strict: bool = False,
     frame_metadata: ContextVar[MutableMapping[str, bytes]] | None = None,
+    read_ahead: int = 0,
+    trusted: bool = False,
+    memory: MemoryTracker | None = None,
 ) -> Generator[GenericStatementSink]:
     """
     Take a jelly file and return generators of generic statements sinks.
@@ -248,6 +295,12 @@ def parse_jelly_grouped(
             Otherwise, only the physical type is used to route parsing.
         frame_metadata: (ContextVar[ScalarMap[str, bytes]]): context variable
                 used for extracting frame metadata
+        read_ahead (int): number of frames to read and parse ahead
+            on a background thread while decoding; 0 disables it.
+        trusted (bool): skip per-row conformance checks for input from
+            a trusted producer, see `TrustedDecoder`.
+        memory (MemoryTracker | None): track (and limit) the memory held by
+            the decoder, see `MemoryTracker`.
 
     Raises:
         NotImplementedError: is raised if a physical type is not implemented
@@ -258,31 +311,18 @@ def parse_jelly_grouped(
 
     """
     options, frames = get_options_and_frames(inp)
+    frames = read_ahead_frames(iter(frames), read_ahead)
 
-    st = getattr(options, "stream_types", None)
-    if logical_type_strict and (
-        st is None
-        or st.logical_type == jelly.LOGICAL_STREAM_TYPE_UNSPECIFIED
-        or st.flat
-    ):
-        lt_name = (
-            "UNSPECIFIED"
-            if st is None
-            else jelly.LogicalStreamType.Name(st.logical_type)
-        )
-
-        msg = (
-            "strict logical type check requires options.stream_types"
-            if st is None
-            else f"expected GROUPED logical type, got {lt_name}"
-        )
-        raise JellyConformanceError(msg)
+    if logical_type_strict:
+        check_logical_type(options.stream_types, grouped=True)
 
     if options.stream_types.physical_type == jelly.PHYSICAL_STREAM_TYPE_TRIPLES:
         for graph in parse_triples_stream(
             frames=frames,
             options=options,
             **{"frame_metadata": frame_metadata} if frame_metadata is not None else {},
+            trusted=trusted,
+            memory=memory,
         ):
             sink = sink_factory()
             for graph_item in graph:
@@ -300,6 +340,8 @@ def parse_jelly_grouped(
             frames=frames,
             options=options,
             **{"frame_metadata": frame_metadata} if frame_metadata is not None else {},
+            trusted=trusted,
+            memory=memory,
         ):
             sink = sink_factory()
             for item in dataset:
@@ -320,6 +362,10 @@ def parse_jelly_grouped(
 def parse_jelly_to_graph(
     inp: IO[bytes],
     sink_factory: Callable[[], GenericStatementSink] = lambda: GenericStatementSink(),
+    *,
+    read_ahead: int = 0,
+    trusted: bool = False,
+    memory: MemoryTracker | None = None,
 ) -> GenericStatementSink:
     """
     Add statements from Generator to GenericStatementSink.
@@ -331,16 +377,28 @@ def parse_jelly_to_graph(
             By default creates an empty in-memory GenericStatementSink.
             Has no division for datasets/graphs,
             utilizes the same underlying data structures.
+        read_ahead (int): number of frames to read and parse ahead
+            on a background thread while decoding; 0 disables it.
+        trusted (bool): skip per-row conformance checks for input from
+            a trusted producer, see `TrustedDecoder`.
+        memory (MemoryTracker | None): track (and limit) the memory held by
+            the decoder, see `MemoryTracker`.
 
     Returns:
         GenericStatementSink: GenericStatementSink with statements.
 
     """
     options, frames = get_options_and_frames(inp)
+    frames = read_ahead_frames(iter(frames), read_ahead)
     sink = sink_factory()
 
     for item in parse_jelly_flat(
-        inp=inp, frames=frames, options=options, logical_type_strict=False
+        inp=inp,
+        frames=frames,
+        options=options,
+        logical_type_strict=False,
+        trusted=trusted,
+        memory=memory,
     ):
         if isinstance(item, Prefix):
             sink.bind(item.prefix, item.iri)  # type: ignore[union-attr, unused-ignore]
@@ -349,12 +407,15 @@ def parse_jelly_to_graph(
     return sink
 
 
-def parse_jelly_flat(
+def parse_jelly_flat(  # noqa: PLR0913
     inp: IO[bytes],
     frames: Iterable[jelly.RdfStreamFrame] | None = None,
     options: ParserOptions | None = None,
     *,
     logical_type_strict: bool = False,
+    read_ahead: int = 0,
+    trusted: bool = False,
+    memory: MemoryTracker | None = None,
 ) -> Generator[Statement | Prefix]:  # type: ignore[valid-type, unused-ignore]
     """
     Parse jelly file with FLAT logical type into a Generator of stream events.
@@ -368,6 +429,13 @@ def parse_jelly_flat(
         logical_type_strict (bool): If True, validate the *logical* type
             in stream options and require FLAT (TRIPLES/QUADS).
             Otherwise, only the physical type is used to route parsing.
+        read_ahead (int): number of frames to read and parse ahead
+            on a background thread while decoding; 0 disables it.
+            Ignored if `frames` and `options` are given.
+        trusted (bool): skip per-row conformance checks for input from
+            a trusted producer, see `TrustedDecoder`.
+        memory (MemoryTracker | None): track (and limit) the memory held by
+            the decoder, see `MemoryTracker`.
 
     Raises:
         NotImplementedError: if physical type is not supported
@@ -378,31 +446,24 @@ def parse_jelly_flat(
     """
     if frames is None or options is None:
         options, frames = get_options_and_frames(inp)
+        frames = read_ahead_frames(iter(frames), read_ahead)
 
-    st = getattr(options, "stream_types", None)
-    if logical_type_strict and (st is None or not st.flat):
-        lt_name = (
-            "UNSPECIFIED"
-            if st is None
-            else jelly.LogicalStreamType.Name(st.logical_type)
-        )
-
-        msg = (
-            "strict logical type check requires options.stream_types"
-            if st is None
-            else f"expected FLAT logical type (TRIPLES/QUADS), got {lt_name}"
-        )
-        raise JellyConformanceError(msg)
+    if logical_type_strict:
+        check_logical_type(options.stream_types, grouped=False)
 
     if options.stream_types.physical_type == jelly.PHYSICAL_STREAM_TYPE_TRIPLES:
-        for triples in parse_triples_stream(frames=frames, options=options):
+        for triples in parse_triples_stream(
+            frames=frames, options=options, trusted=trusted, memory=memory
+        ):
             yield from triples
         return
     if options.stream_types.physical_type in (
         jelly.PHYSICAL_STREAM_TYPE_QUADS,
         jelly.PHYSICAL_STREAM_TYPE_GRAPHS,
     ):
-        for quads in parse_quads_stream(frames=frames, options=options):
+        for quads in parse_quads_stream(
+            frames=frames, options=options, trusted=trusted, memory=memory
+        ):
             yield from quads
         return
     physical_type_name = jelly.PhysicalStreamType.Name(
@@ -410,3 +471,128 @@ def parse_jelly_flat(
     )
     msg = f"the stream type {physical_type_name} is not supported "
     raise NotImplementedError(msg)
+
+
+def make_decoder(
+    options: ParserOptions,
+    *,
+    trusted: bool = False,
+    memory: MemoryTracker | None = None,
+) -> Decoder:
+    """
+    Create a decoder with the generic adapter matching the physical stream type.
+
+    Args:
+        options (ParserOptions): stream options
+        trusted (bool): skip per-row conformance checks for input from
+            a trusted producer, see `TrustedDecoder`.
+        memory (MemoryTracker | None): track (and limit) the memory held by
+            the decoder, see `MemoryTracker`.
+
+    Raises:
+        NotImplementedError: if physical type is not supported
+
+    Returns:
+        Decoder: decoder producing generic statements
+
+    """
+    physical_type = options.stream_types.physical_type
+    adapter: GenericStatementSinkAdapter
+    if physical_type == jelly.PHYSICAL_STREAM_TYPE_TRIPLES:
+        adapter = GenericTriplesAdapter(options)
+    elif physical_type == jelly.PHYSICAL_STREAM_TYPE_QUADS:
+        adapter = GenericQuadsAdapter(options)
+    elif physical_type == jelly.PHYSICAL_STREAM_TYPE_GRAPHS:
+        adapter = GenericGraphsAdapter(options)
+    else:
+        physical_type_name = jelly.PhysicalStreamType.Name(physical_type)
+        msg = f"the stream type {physical_type_name} is not supported "
+        raise NotImplementedError(msg)
+    return create_decoder(adapter, trusted=trusted, memory=memory)
+
+
+async def parse_jelly_flat_async(
+    inp: AsyncByteSource,
+    *,
+    logical_type_strict: bool = False,
+    trusted: bool = False,
+    memory: MemoryTracker | None = None,
+) -> AsyncGenerator[Statement | Prefix]:
+    """
+    Parse an asynchronous jelly byte source into an async generator of stream events.
+
+    Async counterpart of `parse_jelly_flat`.
+
+    Args:
+        inp (AsyncByteSource): `asyncio.StreamReader` or async iterable of bytes
+        logical_type_strict (bool): If True, validate the *logical* type
+            in stream options and require FLAT (TRIPLES/QUADS).
+        trusted (bool): skip per-row conformance checks for input from
+            a trusted producer, see `TrustedDecoder`.
+        memory (MemoryTracker | None): track (and limit) the memory held by
+            the decoder, see `MemoryTracker`.
+
+    Raises:
+        NotImplementedError: if physical type is not supported
+
+    Yields:
+        Statement | Prefix: stream events
+
+    """
+    options, frames = await async_get_options_and_frames(inp)
+    if logical_type_strict:
+        check_logical_type(options.stream_types, grouped=False)
+    decoder = make_decoder(options, trusted=trusted, memory=memory)
+    async for frame in frames:
+        for item in decoder.iter_rows(frame):
+            yield item
+
+
+async def parse_jelly_grouped_async(  # noqa: PLR0913
+    inp: AsyncByteSource,
+    sink_factory: Callable[[], GenericStatementSink] = lambda: GenericStatementSink(),
+    *,
+    logical_type_strict: bool = False,
+    frame_metadata: ContextVar[MutableMapping[str, bytes]] | None = None,
+    trusted: bool = False,
+    memory: MemoryTracker | None = None,
+) -> AsyncGenerator[GenericStatementSink]:
+    """
+    Parse an asynchronous jelly byte source into generic statement sinks.
+
+    Async counterpart of `parse_jelly_grouped`, yields one sink per frame.
+
+    Args:
+        inp (AsyncByteSource): `asyncio.StreamReader` or async iterable of bytes
+        sink_factory (Callable): lambda to construct a statement sink.
+            By default, creates an empty in-memory GenericStatementSink.
+        logical_type_strict (bool): If True, validate the *logical* type
+            in stream options and require a grouped logical type.
+        frame_metadata: (ContextVar[ScalarMap[str, bytes]]): context variable
+                used for extracting frame metadata
+        trusted (bool): skip per-row conformance checks for input from
+            a trusted producer, see `TrustedDecoder`.
+        memory (MemoryTracker | None): track (and limit) the memory held by
+            the decoder, see `MemoryTracker`.
+
+    Raises:
+        NotImplementedError: if physical type is not supported
+
+    Yields:
+        GenericStatementSink: one sink per frame
+
+    """
+    options, frames = await async_get_options_and_frames(inp)
+    if logical_type_strict:
+        check_logical_type(options.stream_types, grouped=True)
+    decoder = make_decoder(options, trusted=trusted, memory=memory)
+    async for frame in frames:
+        if frame_metadata is not None:
+            frame_metadata.set(dict(frame.metadata))
+        sink = sink_factory()
+        for item in decoder.iter_rows(frame):
+            if isinstance(item, Prefix):
+                sink.bind(item.prefix, item.iri)
+            else:
+                sink.add(item)
+        yield sink
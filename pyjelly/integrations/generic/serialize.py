@@ -1,7 +1,8 @@
 # ruff: noqa: I001
 from __future__ import annotations
+import asyncio
 from typing import cast
-from collections.abc import Generator
+from collections.abc import AsyncIterable, Generator
 from functools import singledispatch
 from typing import Any, IO
 from itertools import chain
@@ -19,6 +20,12 @@ from pyjelly.integrations.generic.generic_sink import (
 
 from pyjelly import jelly
 from pyjelly.serialize.encode import Rows, Slot, TermEncoder, HasGraph, Statement
+from pyjelly.serialize.aioutils import (
+    prepend_async,
+    write_frames_async,
+    write_statements_async,
+)
+from pyjelly.serialize.sort import group_by_graph, sort_statements
 from pyjelly.serialize.ioutils import write_delimited
 from pyjelly.serialize.streams import (
     GraphStream,
@@ -105,7 +112,7 @@ class GenericSinkTermEncoder(TermEncoder):
 
 def namespace_declarations(store: GenericStatementSink, stream: Stream) -> None:
     for prefix, namespace in store.namespaces:
-        stream.namespace_declaration(name=prefix, iri=str(namespace))
+        stream.namespace_declaration(name=prefix, iri=namespace._iri)
 
 
 @singledispatch
@@ -198,9 +205,9 @@ def graphs_stream_frames(
     Notes:
         If flow of DatasetsFrameFlow type, the whole dataset
         will be encoded into one frame.
-        Graphs are generated from the GenericStatementSink by
-        iterating over statements and yielding one new GenericStatementSink
-        per a sequence of quads with the same g term.
+        Quads are grouped by graph with `group_by_graph`, so every graph
+        is emitted once, buffering at most `options.graph_buffer`
+        triples in memory.
 
     Args:
         stream (GraphStream): stream that specifies graphs processing
@@ -217,13 +224,12 @@ def graphs_stream_frames(
     statements: Generator[Quad]
     if isinstance(data, GenericStatementSink):
         statements = cast(Generator[Quad], data.store)
-        graphs = split_to_graphs(statements)
-    elif iter(data):
+    else:
         statements = data
-        graphs = split_to_graphs(statements)
 
-    for graph in graphs:
-        yield from stream.graph(graph_id=graph.identifier, graph=graph)
+    graphs = group_by_graph(statements, max_in_memory=stream.options.graph_buffer)
+    for graph_id, triples in graphs:
+        yield from stream.graph(graph_id=graph_id, graph=triples)
 
     if frame := stream.flow.frame_from_dataset():
         yield frame
@@ -353,6 +359,8 @@ def grouped_stream_to_file(
 def flat_stream_to_frames(
     statements: Generator[Triple | Quad],
     options: SerializerOptions | None = None,
+    *,
+    sort_buffer: int | None = None,
 ) -> Generator[jelly.RdfStreamFrame]:
     """
     Serialize a stream of raw GenericStatementSink's triples or quads into Jelly frames.
@@ -362,11 +370,17 @@ def flat_stream_to_frames(
           s/p/o triples or s/p/o/g quads to serialize.
         options (SerializerOptions | None, optional):
             if omitted, guessed based on the first tuple.
+        sort_buffer (int | None, optional): if set, statements are first sorted
+            by graph, subject and predicate (see `sort_statements`), holding
+            at most this many in memory. Sorted input lets the encoder elide
+            more repeated terms. Defaults to None (keep input order).
 
     Yields:
         Generator[jelly.RdfStreamFrame]: generated frames.
 
     """
+    if sort_buffer is not None:
+        statements = sort_statements(statements, max_in_memory=sort_buffer)
     first = next(statements, None)
     if first is None:
         return
@@ -388,6 +402,8 @@ def flat_stream_to_file(
     statements: Generator[Triple | Quad],
     output_file: IO[bytes],
     options: SerializerOptions | None = None,
+    *,
+    sort_buffer: int | None = None,
 ) -> None:
     """
     Write Triple or Quad events to a binary file.
@@ -396,7 +412,79 @@ def flat_stream_to_file(
         statements (Generator[Triple | Quad]): statements to serialize.
         output_file (IO[bytes]): output buffered writer.
         options (SerializerOptions | None, optional): stream options.
+        sort_buffer (int | None, optional): see `flat_stream_to_frames`.
 
     """
-    for frame in flat_stream_to_frames(statements, options):
+    for frame in flat_stream_to_frames(statements, options, sort_buffer=sort_buffer):
         write_delimited(frame, output_file)
+
+
+async def grouped_stream_to_file_async(
+    stream: AsyncIterable[GenericStatementSink],
+    writer: asyncio.StreamWriter,
+    options: SerializerOptions | None = None,
+    *,
+    offload: bool = False,
+) -> None:
+    """
+    Write an async stream of GenericStatementSinks to an asyncio stream writer.
+
+    Async counterpart of `grouped_stream_to_file`. The writer is drained
+    after every frame, so slow consumers apply backpressure.
+
+    Args:
+        stream (AsyncIterable[GenericStatementSink]): GenericStatementSinks
+            to serialize.
+        writer (asyncio.StreamWriter): output stream writer.
+        options (SerializerOptions | None, optional): stream options to use.
+            Options are guessed based on the first sink. Defaults to None.
+        offload (bool): encode each sink in a worker thread,
+            so the event loop is not blocked.
+
+    """
+    jelly_stream = None
+    async for sink in stream:
+        if not jelly_stream:
+            if options is None:
+                options = guess_options(sink)
+            jelly_stream = guess_stream(options, sink)
+        await write_frames_async(
+            stream_frames(jelly_stream, sink), writer, offload=offload
+        )
+
+
+async def flat_stream_to_file_async(
+    statements: AsyncIterable[Triple | Quad],
+    writer: asyncio.StreamWriter,
+    options: SerializerOptions | None = None,
+    *,
+    offload: bool = False,
+) -> None:
+    """
+    Write Triple or Quad events from an async iterator to an asyncio stream writer.
+
+    Async counterpart of `flat_stream_to_file`. The writer is drained
+    after every frame, so slow consumers apply backpressure.
+
+    Args:
+        statements (AsyncIterable[Triple | Quad]): statements to serialize.
+        writer (asyncio.StreamWriter): output stream writer.
+        options (SerializerOptions | None, optional): stream options.
+            If omitted, guessed based on the first statement.
+        offload (bool): encode batches of statements in a worker thread,
+            so the event loop is not blocked.
+
+    """
+    iterator = aiter(statements)
+    first = await anext(iterator, None)
+    if first is None:
+        return
+
+    sink = GenericStatementSink()
+    sink.add(first)
+    if options is None:
+        options = guess_options(sink)
+    stream = guess_stream(options, sink)
+
+    combined = prepend_async(first, iterator)
+    await write_statements_async(stream, combined, writer, offload=offload)
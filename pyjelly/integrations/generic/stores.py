@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import io
+import os
+import tempfile
+from array import array
+from collections.abc import Generator
+from itertools import groupby, islice
+from typing import IO, Any, Final
+
+from pyjelly.integrations.generic.generic_sink import (
+    TRIPLE_ARITY,
+    GraphName,
+    Node,
+    Prefix,
+    Quad,
+    Triple,
+)
+from pyjelly.integrations.generic.parse import parse_jelly_flat
+from pyjelly.integrations.generic.serialize import flat_stream_to_file
+
+COLUMN_TYPECODES: Final = ("I", "L", "Q")
+NO_GRAPH: Final = 0
+DEFAULT_MAX_IN_MEMORY: Final = 1_000_000
+
+
+class TermDictionary:
+    """
+    Two-way mapping between terms and integer ids.
+
+    Notes:
+        Id 0 is reserved (`NO_GRAPH`), so term ids start at 1.
+
+    """
+
+    __slots__ = ("_ids", "_terms")
+
+    def __init__(self) -> None:
+        self._terms: list[Node | GraphName | None] = [None]
+        self._ids: dict[Node | GraphName, int] = {}
+
+    def encode(self, term: Node | GraphName) -> int:
+        term_id = self._ids.get(term)
+        if term_id is None:
+            term_id = self._ids[term] = len(self._terms)
+            self._terms.append(term)
+        return term_id
+
+    def decode(self, term_id: int) -> Node | GraphName | None:
+        return self._terms[term_id]
+
+    def __len__(self) -> int:
+        return len(self._terms) - 1
+
+
+class ColumnarStore:
+    """
+    Dictionary-encoded, column-oriented statement storage for GenericStatementSink.
+
+    Notes:
+        Every distinct term is stored once in a TermDictionary; statements are
+        kept as parallel `array` columns of term ids, in insertion order.
+        The graph column is only allocated once the first quad is added.
+        Triple/Quad tuples are materialized on iteration.
+        With the default "I" typecode a triple costs 12 bytes (16 for a quad)
+        plus its share of the term dictionary.
+
+    Args:
+        terms (TermDictionary | None): term dictionary to use, e.g. shared
+            between stores. Defaults to a new one.
+        typecode (str): `array` typecode of the id columns, one of "I", "L", "Q".
+            Defaults to "I" (up to 2**32 - 1 distinct terms).
+
+    Raises:
+        ValueError: if the typecode is not an unsigned integer typecode
+
+    """
+
+    __slots__ = ("_graphs", "_objects", "_predicates", "_subjects", "terms")
+
+    def __init__(
+        self, terms: TermDictionary | None = None, typecode: str = "I"
+    ) -> None:
+        if typecode not in COLUMN_TYPECODES:
+            msg = f"typecode must be one of {COLUMN_TYPECODES}, got {typecode!r}"
+            raise ValueError(msg)
+        self.terms = TermDictionary() if terms is None else terms
+        self._subjects = array(typecode)
+        self._predicates = array(typecode)
+        self._objects = array(typecode)
+        self._graphs: array[int] | None = None
+
+    @property
+    def typecode(self) -> str:
+        return self._subjects.typecode
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the id columns in bytes (the term dictionary excluded)."""
+        columns = 4 if self._graphs is not None else 3
+        return columns * len(self._subjects) * self._subjects.itemsize
+
+    def append(self, statement: Triple | Quad) -> None:
+        encode = self.terms.encode
+        graph = NO_GRAPH
+        if len(statement) > TRIPLE_ARITY:
+            graph = encode(statement[3])  # type: ignore[misc]
+            if self._graphs is None:
+                self._graphs = array(self.typecode, [NO_GRAPH]) * len(self._subjects)
+        self._subjects.append(encode(statement[0]))
+        self._predicates.append(encode(statement[1]))
+        self._objects.append(encode(statement[2]))
+        if self._graphs is not None:
+            self._graphs.append(graph)
+
+    def statement_key(self, statement: Triple | Quad) -> int:
+        """
+        Return the term ids of a statement packed into a single integer.
+
+        Notes:
+            Used by deduplicating sinks: an int key is much smaller than
+            a tuple of terms, and its terms are interned here anyway.
+
+        """
+        encode = self.terms.encode
+        width = self._subjects.itemsize * 8
+        key = (
+            encode(statement[0])
+            | encode(statement[1]) << width
+            | encode(statement[2]) << 2 * width
+        )
+        if len(statement) > TRIPLE_ARITY:
+            key |= encode(statement[3]) << 3 * width  # type: ignore[misc]
+        return key
+
+    def _statement(self, s: int, p: int, o: int, g: int = NO_GRAPH) -> Triple | Quad:
+        decode = self.terms.decode
+        if g == NO_GRAPH:
+            return Triple(decode(s), decode(p), decode(o))  # type: ignore[arg-type]
+        return Quad(decode(s), decode(p), decode(o), decode(g))  # type: ignore[arg-type]
+
+    def __getitem__(self, index: int) -> Triple | Quad:
+        graph = NO_GRAPH if self._graphs is None else self._graphs[index]
+        return self._statement(
+            self._subjects[index], self._predicates[index], self._objects[index], graph
+        )
+
+    def __iter__(self) -> Generator[Triple | Quad]:
+        terms: list[Any] = self.terms._terms
+        columns = zip(self._subjects, self._predicates, self._objects, strict=True)
+        if self._graphs is None:
+            for s, p, o in columns:
+                yield Triple(terms[s], terms[p], terms[o])
+            return
+        for (s, p, o), g in zip(columns, self._graphs, strict=True):
+            if g == NO_GRAPH:
+                yield Triple(terms[s], terms[p], terms[o])
+            else:
+                yield Quad(terms[s], terms[p], terms[o], terms[g])
+
+    def __len__(self) -> int:
+        return len(self._subjects)
+
+    def clear(self) -> None:
+        """Remove all statements; the term dictionary is kept."""
+        typecode = self.typecode
+        self._subjects = array(typecode)
+        self._predicates = array(typecode)
+        self._objects = array(typecode)
+        self._graphs = None
+
+
+class SpillingStore:
+    """
+    Statement storage that spills to a temporary Jelly file over a memory budget.
+
+    Notes:
+        Up to `max_in_memory` statements are buffered in memory; when the
+        buffer is full, it is serialized with the generic Jelly serializer
+        as a segment of a temporary file, and a new buffer is started.
+        Iteration replays the segments in order, then the buffer, decoding
+        one segment at a time. The temporary file is removed on `close()`
+        or when the store is garbage collected.
+        The budget counts statements, not bytes: measuring the exact size
+        of every statement would cost more than storing it.
+        Indexes and deduplication of the owning sink still keep statements
+        in memory.
+
+    Args:
+        max_in_memory (int): maximum number of statements kept in memory.
+            Defaults to DEFAULT_MAX_IN_MEMORY.
+        directory (str | None): directory for the temporary file,
+            see `tempfile.TemporaryFile`. Defaults to None.
+
+    Raises:
+        ValueError: if `max_in_memory` is not positive
+
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_file",
+        "_segments",
+        "_spilled",
+        "directory",
+        "max_in_memory",
+    )
+
+    def __init__(
+        self, max_in_memory: int = DEFAULT_MAX_IN_MEMORY, directory: str | None = None
+    ) -> None:
+        if max_in_memory < 1:
+            msg = f"max_in_memory must be positive, got {max_in_memory}"
+            raise ValueError(msg)
+        self.max_in_memory = max_in_memory
+        self.directory = directory
+        self._buffer: list[Triple | Quad] = []
+        self._file: IO[bytes] | None = None
+        # (offset, size, statement count) of every segment in the file
+        self._segments: list[tuple[int, int, int]] = []
+        self._spilled = 0
+
+    @property
+    def spilled(self) -> int:
+        """Number of statements written to disk."""
+        return self._spilled
+
+    def append(self, statement: Triple | Quad) -> None:
+        self._buffer.append(statement)
+        if len(self._buffer) >= self.max_in_memory:
+            self.spill()
+
+    def spill(self) -> None:
+        """Write all buffered statements to the temporary file."""
+        if not self._buffer:
+            return
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(dir=self.directory)  # noqa: SIM115
+        file = self._file
+        file.seek(0, os.SEEK_END)
+        # A Jelly stream holds either triples or quads, so mixed buffers
+        # are written as several segments
+        for _, group in groupby(self._buffer, key=len):
+            run = list(group)
+            offset = file.tell()
+            flat_stream_to_file((statement for statement in run), file)
+            self._segments.append((offset, file.tell() - offset, len(run)))
+        self._spilled += len(self._buffer)
+        self._buffer = []
+
+    def _read_segment(self, offset: int, size: int) -> Generator[Triple | Quad]:
+        assert self._file is not None
+        self._file.seek(offset)
+        data = self._file.read(size)
+        for item in parse_jelly_flat(io.BytesIO(data)):
+            if not isinstance(item, Prefix):
+                yield item
+
+    def __iter__(self) -> Generator[Triple | Quad]:
+        for offset, size, _ in self._segments:
+            yield from self._read_segment(offset, size)
+        yield from self._buffer
+
+    def __getitem__(self, index: int) -> Triple | Quad:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = "statement index out of range"
+            raise IndexError(msg)
+        if index >= self._spilled:
+            return self._buffer[index - self._spilled]
+        for offset, size, count in self._segments:
+            if index < count:
+                return next(islice(self._read_segment(offset, size), index, None))
+            index -= count
+        msg = "statement index out of range"
+        raise IndexError(msg)
+
+    def __len__(self) -> int:
+        return self._spilled + len(self._buffer)
+
+    def clear(self) -> None:
+        self._buffer = []
+        self._segments = []
+        self._spilled = 0
+        if self._file is not None:
+            self._file.seek(0)
+            self._file.truncate()
+
+    def close(self) -> None:
+        """Remove all statements and delete the temporary file."""
+        self.clear()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Generator, Iterable, MutableMapping
+from collections.abc import (
+    AsyncGenerator,
+    Callable,
+    Generator,
+    Iterable,
+    MutableMapping,
+)
 from contextvars import ContextVar
 from itertools import chain
-from typing import IO, Any, TypeAlias, cast
+from typing import IO, Any, Final, TypeAlias, cast
 from typing_extensions import Never, Self, override
 
 import rdflib
@@ -14,12 +20,23 @@ from rdflib.parser import Parser as RDFLibParser
 
 from pyjelly import jelly
 from pyjelly.errors import JellyConformanceError
-from pyjelly.options import StreamTypes
-from pyjelly.parse.decode import Adapter, Decoder, ParserOptions
-from pyjelly.parse.ioutils import get_options_and_frames
+from pyjelly.memory import MemoryTracker
+from pyjelly.options import StreamTypes, check_logical_type
+from pyjelly.parse.aioutils import AsyncByteSource, async_get_options_and_frames
+from pyjelly.parse.decode import (
+    Adapter,
+    Decoder,
+    ParserOptions,
+    ParsingMode,
+    create_decoder,
+)
+from pyjelly.parse.ioutils import get_options_and_frames, read_ahead_frames
 
 GraphName: TypeAlias = URIRef | BNode | str
 
+DEFAULT_BATCH_SIZE: Final = 10_000
+CONTEXT_CACHE_SIZE: Final = 1024
+
 
 class Triple(tuple[Node, Node, Node]):
     """
@@ -38,6 +55,9 @@ class Triple(tuple[Node, Node, Node]):
     def __new__(cls, s: Node, p: Node, o: Node) -> Self:
         return tuple.__new__(cls, (s, p, o))
 
+    def __getnewargs__(self) -> tuple[Node, Node, Node]:
+        return (self[0], self[1], self[2])
+
     @property
     def s(self) -> Node:
         return self[0]
@@ -69,6 +89,9 @@ class Quad(tuple[Node, Node, Node, GraphName]):
     def __new__(cls, s: Node, p: Node, o: Node, g: GraphName) -> Self:
         return tuple.__new__(cls, (s, p, o, g))
 
+    def __getnewargs__(self) -> tuple[Node, Node, Node, GraphName]:
+        return (self[0], self[1], self[2], self[3])
+
     @property
     def s(self) -> Node:
         return self[0]
@@ -116,17 +139,61 @@ class Prefix(tuple[str, rdflib.URIRef]):
         return self[1]
 
 
+class TrustedLiteral(rdflib.Literal):
+    """
+    RDFLib literal built from a trusted lexical form.
+
+    Notes:
+        Construction skips language tag validation and lexical normalization,
+        the Python value (`value`, `ill_typed`) is computed on first access.
+        Compares and hashes equal to the `rdflib.Literal` with the same
+        lexical form, language and datatype.
+
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in ("_value", "_ill_typed"):
+            raise AttributeError(name)
+        literal = rdflib.Literal(
+            str(self), lang=self._language, datatype=self._datatype, normalize=False
+        )
+        self._value = literal.value
+        self._ill_typed = literal.ill_typed
+        return getattr(self, name)
+
+
 class RDFLibAdapter(Adapter):
     """
     RDFLib adapter class, is extended by triples and quads implementations.
 
+    Notes:
+        With `trusted=True` terms are built through the cheapest path:
+        IRIs are not validated, datatype IRIs are cached and literals are
+        `TrustedLiteral`s. Only use it for input produced by a conforming
+        serializer (e.g. files written by pyjelly).
+
     Args:
         Adapter (): abstract adapter class
 
     """
 
+    def __init__(
+        self,
+        options: ParserOptions,
+        parsing_mode: ParsingMode = ParsingMode.FLAT,
+        *,
+        trusted: bool = False,
+    ) -> None:
+        super().__init__(options=options, parsing_mode=parsing_mode)
+        self.trusted = trusted
+        self._datatypes: dict[str, rdflib.URIRef] = {}
+
     @override
     def iri(self, iri: str) -> rdflib.URIRef:
+        if self.trusted:
+            return str.__new__(rdflib.URIRef, iri)
         return rdflib.URIRef(iri)
 
     @override
@@ -144,7 +211,19 @@ class RDFLibAdapter(Adapter):
         language: str | None = None,
         datatype: str | None = None,
     ) -> rdflib.Literal:
-        return rdflib.Literal(lex, lang=language, datatype=datatype)
+        if not self.trusted:
+            return rdflib.Literal(lex, lang=language, datatype=datatype)
+        literal = str.__new__(TrustedLiteral, lex)
+        literal._language = language or None
+        if datatype is None:
+            literal._datatype = None
+        else:
+            literal._datatype = self._datatypes.get(datatype)
+            if literal._datatype is None:
+                literal._datatype = self._datatypes[datatype] = str.__new__(
+                    rdflib.URIRef, datatype
+                )
+        return literal
 
     @override
     def namespace_declaration(self, name: str, iri: str) -> Prefix:
@@ -184,11 +263,8 @@ class RDFLibTriplesAdapter(RDFLibAdapter):
     Notes: returns triple/namespace declaration as soon as receives them.
     """
 
-    def __init__(
-        self,
-        options: ParserOptions,
-    ) -> None:
-        super().__init__(options=options)
+    def __init__(self, options: ParserOptions, *, trusted: bool = False) -> None:
+        super().__init__(options=options, trusted=trusted)
 
     @override
     def triple(self, terms: Iterable[Any]) -> Triple:
@@ -196,8 +272,8 @@ class RDFLibTriplesAdapter(RDFLibAdapter):
 
 
 class RDFLibQuadsBaseAdapter(RDFLibAdapter):
-    def __init__(self, options: ParserOptions) -> None:
-        super().__init__(options=options)
+    def __init__(self, options: ParserOptions, *, trusted: bool = False) -> None:
+        super().__init__(options=options, trusted=trusted)
 
 
 class RDFLibQuadsAdapter(RDFLibQuadsBaseAdapter):
@@ -231,11 +307,8 @@ class RDFLibGraphsAdapter(RDFLibQuadsBaseAdapter):
 
     _graph_id: str | None
 
-    def __init__(
-        self,
-        options: ParserOptions,
-    ) -> None:
-        super().__init__(options=options)
+    def __init__(self, options: ParserOptions, *, trusted: bool = False) -> None:
+        super().__init__(options=options, trusted=trusted)
         self._graph_id = None
 
     @property
@@ -261,6 +334,9 @@ def parse_triples_stream(
     frames: Iterable[jelly.RdfStreamFrame],
     options: ParserOptions,
     frame_metadata: ContextVar[MutableMapping[str, bytes]] | None = None,
+    *,
+    trusted: bool = False,
+    memory: MemoryTracker | None = None,
 ) -> Generator[Iterable[Triple | Prefix]]:
     """
     Parse flat triple stream.
@@ -270,6 +346,9 @@ def parse_triples_stream(
         options (ParserOptions): stream options
         frame_metadata: (ContextVar[ScalarMap[str, bytes]]): context variable
             used for extracting frame metadata
+        trusted (bool): skip validation, see `RDFLibAdapter` and `TrustedDecoder`.
+        memory (MemoryTracker | None): track (and limit) the memory held by
+            the decoder, see `MemoryTracker`.
 
     Yields:
         Generator[Iterable[Triple | Prefix]]:
@@ -277,8 +356,8 @@ def parse_triples_stream(
             one iterable per frame.
 
     """
-    adapter = RDFLibTriplesAdapter(options)
-    decoder = Decoder(adapter=adapter)
+    adapter = RDFLibTriplesAdapter(options, trusted=trusted)
+    decoder = create_decoder(adapter, trusted=trusted, memory=memory)
     for frame in frames:
         if frame_metadata is not None:
             frame_metadata.set(
@@ -292,6 +371,9 @@ def parse_quads_stream(
     frames: Iterable[jelly.RdfStreamFrame],
     options: ParserOptions,
     frame_metadata: ContextVar[MutableMapping[str, bytes]] | None = None,
+    *,
+    trusted: bool = False,
+    memory: MemoryTracker | None = None,
 ) -> Generator[Iterable[Quad | Prefix]]:
     """
     Parse flat quads stream.
@@ -301,6 +383,9 @@ def parse_quads_stream(
         options (ParserOptions): stream options
         frame_metadata: (ContextVar[ScalarMap[str, bytes]]): context variable
             used for extracting frame metadata
+        trusted (bool): skip validation, see `RDFLibAdapter` and `TrustedDecoder`.
+        memory (MemoryTracker | None): track (and limit) the memory held by
+            the decoder, see `MemoryTracker`.
 
     Yields:
         Generator[Iterable[Quad | Prefix]]:
@@ -313,8 +398,8 @@ def parse_quads_stream(
         adapter_class = RDFLibQuadsAdapter
     else:
         adapter_class = RDFLibGraphsAdapter
-    adapter = adapter_class(options=options)
-    decoder = Decoder(adapter=adapter)
+    adapter = adapter_class(options=options, trusted=trusted)
+    decoder = create_decoder(adapter, trusted=trusted, memory=memory)
     for frame in frames:
         if frame_metadata is not None:
             frame_metadata.set(
@@ -324,13 +409,74 @@ def parse_quads_stream(
     return
 
 
-def parse_jelly_grouped(
+def add_statements(
+    sink: Graph,
+    statements: Iterable[Statement | Prefix],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> None:
+    """
+    Add parsed statements to a Graph/Dataset in batches.
+
+    Notes:
+        Statements are passed to `sink.store.addN` in batches of `batch_size`,
+        skipping the per-statement overhead of `Graph.add`
+        (term validation, context lookup). Quads are added to the
+        contexts of a Dataset sink, which are cached by graph name.
+        Stores that implement `addN` natively (e.g. remote stores)
+        receive one call per batch.
+
+    Args:
+        sink (Graph): Graph for triples or Dataset for quads
+        statements (Iterable[Statement | Prefix]): parsed stream events
+        batch_size (int): number of statements per `addN` call.
+            Defaults to DEFAULT_BATCH_SIZE.
+
+    Raises:
+        ValueError: if `batch_size` is not positive
+
+    """
+    if batch_size < 1:
+        msg = f"batch_size must be positive, got {batch_size}"
+        raise ValueError(msg)
+    store = sink.store
+    contexts: dict[GraphName, Graph] = {}
+    batch: list[tuple[Node, Node, Node, Graph]] = []
+    for item in statements:
+        if isinstance(item, Prefix):
+            sink.bind(item.prefix, item.iri)
+            continue
+        if isinstance(item, Quad):
+            s, p, o, graph_name = item
+            context = contexts.get(graph_name)
+            if context is None:
+                if len(contexts) >= CONTEXT_CACHE_SIZE:
+                    contexts.clear()
+                context = contexts[graph_name] = cast(Dataset, sink).get_context(
+                    graph_name
+                )
+            batch.append((s, p, o, context))
+        else:
+            s, p, o = item
+            batch.append((s, p, o, sink))
+        if len(batch) >= batch_size:
+            store.addN(batch)
+            batch = []
+    if batch:
+        store.addN(batch)
+
+
+def parse_jelly_grouped(  # noqa: PLR0913
     inp: IO[bytes],
     graph_factory: Callable[[], Graph] = lambda: Graph(),
     dataset_factory: Callable[[], Dataset] = lambda: Dataset(),
     *,
     logical_type_strict: bool = False,
     frame_metadata: ContextVar[MutableMapping[str, bytes]] | None = None,
+    read_ahead: int = 0,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    trusted: bool = False,
+    memory: MemoryTracker | None = None,
 ) -> Generator[Graph] | Generator[Dataset]:
     """
     Take jelly file and return generators based on the detected physical type.
@@ -350,8 +496,14 @@ def parse_jelly_grouped(
             physical type is used to route parsing.
         frame_metadata: (ContextVar[ScalarMap[str, bytes]]): context variable
             used for extracting frame metadata
-
-
+        read_ahead (int): number of frames to read and parse ahead
+            on a background thread while decoding; 0 disables it.
+        batch_size (int): number of statements added to the store at once,
+            see `add_statements`.
+        trusted (bool): skip validation for input from a trusted producer,
+            see `RDFLibAdapter` and `TrustedDecoder`.
+        memory (MemoryTracker | None): track (and limit) the memory held by
+            the decoder, see `MemoryTracker`.
 
     Raises:
         NotImplementedError: is raised if a physical type is not implemented
@@ -362,38 +514,21 @@ def parse_jelly_grouped(
 
     """
     options, frames = get_options_and_frames(inp)
+    frames = read_ahead_frames(iter(frames), read_ahead)
 
-    st = getattr(options, "stream_types", None)
-    if logical_type_strict and (
-        st is None
-        or st.logical_type == jelly.LOGICAL_STREAM_TYPE_UNSPECIFIED
-        or st.flat
-    ):
-        lt_name = (
-            "UNSPECIFIED"
-            if st is None
-            else jelly.LogicalStreamType.Name(st.logical_type)
-        )
-
-        msg = (
-            "strict logical type check requires options.stream_types"
-            if st is None
-            else f"expected GROUPED logical type, got {lt_name}"
-        )
-        raise JellyConformanceError(msg)
+    if logical_type_strict:
+        check_logical_type(options.stream_types, grouped=True)
 
     if options.stream_types.physical_type == jelly.PHYSICAL_STREAM_TYPE_TRIPLES:
         for graph in parse_triples_stream(
             frames=frames,
             options=options,
             frame_metadata=frame_metadata,
+            trusted=trusted,
+            memory=memory,
         ):
             sink = graph_factory()
-            for graph_item in graph:
-                if isinstance(graph_item, Prefix):
-                    sink.bind(graph_item.prefix, graph_item.iri)
-                else:
-                    sink.add(graph_item)
+            add_statements(sink, graph, batch_size=batch_size)
             yield sink
         return
     elif options.stream_types.physical_type in (
@@ -401,16 +536,14 @@ def parse_jelly_grouped(
         jelly.PHYSICAL_STREAM_TYPE_GRAPHS,
     ):
         for dataset in parse_quads_stream(
-            frames=frames, options=options, frame_metadata=frame_metadata
+            frames=frames,
+            options=options,
+            frame_metadata=frame_metadata,
+            trusted=trusted,
+            memory=memory,
         ):
             sink = dataset_factory()
-            for item in dataset:
-                if isinstance(item, Prefix):
-                    sink.bind(item.prefix, item.iri)
-                else:
-                    s, p, o, graph_name = item
-                    context = sink.get_context(graph_name)
-                    sink.add((s, p, o, context))
+            add_statements(sink, dataset, batch_size=batch_size)
             yield sink
         return
 
@@ -421,10 +554,15 @@ def parse_jelly_grouped(
     raise NotImplementedError(msg)
 
 
-def parse_jelly_to_graph(
+def parse_jelly_to_graph(  # noqa: PLR0913
     inp: IO[bytes],
     graph_factory: Callable[[], Graph] = lambda: Graph(),
     dataset_factory: Callable[[], Dataset] = lambda: Dataset(),
+    *,
+    read_ahead: int = 0,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    trusted: bool = False,
+    memory: MemoryTracker | None = None,
 ) -> Graph | Dataset:
     """
     Add statements from Generator to provided Graph/Dataset.
@@ -437,12 +575,21 @@ def parse_jelly_to_graph(
         dataset_factory (Callable[[], Dataset]): factory to create Dataset.
             By default creates an empty in-memory Dataset,
             but you can pass something else here.
+        read_ahead (int): number of frames to read and parse ahead
+            on a background thread while decoding; 0 disables it.
+        batch_size (int): number of statements added to the store at once,
+            see `add_statements`.
+        trusted (bool): skip validation for input from a trusted producer,
+            see `RDFLibAdapter` and `TrustedDecoder`.
+        memory (MemoryTracker | None): track (and limit) the memory held by
+            the decoder, see `MemoryTracker`.
 
     Returns:
         Dataset | Graph: Dataset or Graph with statements.
 
     """
     options, frames = get_options_and_frames(inp)
+    frames = read_ahead_frames(iter(frames), read_ahead)
 
     if options.stream_types.physical_type == jelly.PHYSICAL_STREAM_TYPE_TRIPLES:
         sink = graph_factory()
@@ -450,27 +597,24 @@ def parse_jelly_to_graph(
         jelly.PHYSICAL_STREAM_TYPE_QUADS,
         jelly.PHYSICAL_STREAM_TYPE_GRAPHS,
     ):
-        quad_sink = dataset_factory()
-        sink = quad_sink
+        sink = dataset_factory()
 
-    for item in parse_jelly_flat(inp=inp, frames=frames, options=options):
-        if isinstance(item, Prefix):
-            sink.bind(item.prefix, item.iri)
-        if isinstance(item, Triple):
-            sink.add(item)
-        if isinstance(item, Quad):
-            s, p, o, graph_name = item
-            context = quad_sink.get_context(graph_name)
-            quad_sink.add((s, p, o, context))
+    statements = parse_jelly_flat(
+        inp=inp, frames=frames, options=options, trusted=trusted, memory=memory
+    )
+    add_statements(sink, statements, batch_size=batch_size)
     return sink
 
 
-def parse_jelly_flat(
+def parse_jelly_flat(  # noqa: PLR0913
     inp: IO[bytes],
     frames: Iterable[jelly.RdfStreamFrame] | None = None,
     options: ParserOptions | None = None,
     *,
     logical_type_strict: bool = False,
+    read_ahead: int = 0,
+    trusted: bool = False,
+    memory: MemoryTracker | None = None,
 ) -> Generator[Statement | Prefix]:
     """
     Parse jelly file with FLAT logical type into a Generator of stream events.
@@ -484,6 +628,13 @@ def parse_jelly_flat(
         logical_type_strict (bool): If True, validate the *logical* type in
             stream options and require FLAT_(TRIPLES|QUADS). Otherwise, only the
             physical type is used to route parsing.
+        read_ahead (int): number of frames to read and parse ahead
+            on a background thread while decoding; 0 disables it.
+            Ignored if `frames` and `options` are given.
+        trusted (bool): skip validation for input from a trusted producer,
+            see `RDFLibAdapter` and `TrustedDecoder`.
+        memory (MemoryTracker | None): track (and limit) the memory held by
+            the decoder, see `MemoryTracker`.
 
     Raises:
         NotImplementedError: if physical type is not supported
@@ -494,30 +645,24 @@ def parse_jelly_flat(
     """
     if frames is None or options is None:
         options, frames = get_options_and_frames(inp)
+        frames = read_ahead_frames(iter(frames), read_ahead)
 
-    st = getattr(options, "stream_types", None)
-    if logical_type_strict and (st is None or not st.flat):
-        lt_name = (
-            "UNSPECIFIED"
-            if st is None
-            else jelly.LogicalStreamType.Name(st.logical_type)
-        )
-        msg = (
-            "strict logical type check requires options.stream_types"
-            if st is None
-            else f"expected FLAT logical type (TRIPLES/QUADS), got {lt_name}"
-        )
-        raise JellyConformanceError(msg)
+    if logical_type_strict:
+        check_logical_type(options.stream_types, grouped=False)
 
     if options.stream_types.physical_type == jelly.PHYSICAL_STREAM_TYPE_TRIPLES:
-        for triples in parse_triples_stream(frames=frames, options=options):
+        for triples in parse_triples_stream(
+            frames=frames, options=options, trusted=trusted, memory=memory
+        ):
             yield from triples
         return
     if options.stream_types.physical_type in (
         jelly.PHYSICAL_STREAM_TYPE_QUADS,
         jelly.PHYSICAL_STREAM_TYPE_GRAPHS,
     ):
-        for quads in parse_quads_stream(frames=frames, options=options):
+        for quads in parse_quads_stream(
+            frames=frames, options=options, trusted=trusted, memory=memory
+        ):
             yield from quads
         return
     physical_type_name = jelly.PhysicalStreamType.Name(
@@ -528,10 +673,15 @@ def parse_jelly_flat(
 
 
 class RDFLibJellyParser(RDFLibParser):
-    def parse(
+    def parse(  # noqa: PLR0913
         self,
         source: InputSource,
         sink: Graph,
+        *,
+        read_ahead: int = 0,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        trusted: bool = False,
+        memory: MemoryTracker | None = None,
     ) -> None:
         """
         Parse jelly file into provided RDFLib Graph.
@@ -539,6 +689,14 @@ class RDFLibJellyParser(RDFLibParser):
         Args:
             source (InputSource): jelly file as buffered binary stream InputSource obj
             sink (Graph): RDFLib Graph
+            read_ahead (int): number of frames to read and parse ahead
+                on a background thread while decoding; 0 disables it.
+            batch_size (int): number of statements added to the sink's store
+                at once, see `add_statements`.
+            trusted (bool): skip validation for input from a trusted
+                producer, see `RDFLibAdapter` and `TrustedDecoder`.
+            memory (MemoryTracker | None): track (and limit) the memory held by
+                the decoder, see `MemoryTracker`.
 
         Raises:
             TypeError: raises error if invalid input
@@ -557,4 +715,131 @@ class RDFLibJellyParser(RDFLibParser):
             inp,
             graph_factory=lambda: Graph(store=sink.store, identifier=sink.identifier),
             dataset_factory=lambda: Dataset(store=sink.store),
+            read_ahead=read_ahead,
+            batch_size=batch_size,
+            trusted=trusted,
+            memory=memory,
         )
+
+
+def make_decoder(
+    options: ParserOptions,
+    *,
+    trusted: bool = False,
+    memory: MemoryTracker | None = None,
+) -> Decoder:
+    """
+    Create a decoder with the RDFLib adapter matching the physical stream type.
+
+    Args:
+        options (ParserOptions): stream options
+        trusted (bool): skip validation for input from a trusted producer,
+            see `RDFLibAdapter` and `TrustedDecoder`.
+        memory (MemoryTracker | None): track (and limit) the memory held by
+            the decoder, see `MemoryTracker`.
+
+    Raises:
+        NotImplementedError: if physical type is not supported
+
+    Returns:
+        Decoder: decoder producing RDFLib statements
+
+    """
+    physical_type = options.stream_types.physical_type
+    adapter: RDFLibAdapter
+    if physical_type == jelly.PHYSICAL_STREAM_TYPE_TRIPLES:
+        adapter = RDFLibTriplesAdapter(options, trusted=trusted)
+    elif physical_type == jelly.PHYSICAL_STREAM_TYPE_QUADS:
+        adapter = RDFLibQuadsAdapter(options, trusted=trusted)
+    elif physical_type == jelly.PHYSICAL_STREAM_TYPE_GRAPHS:
+        adapter = RDFLibGraphsAdapter(options, trusted=trusted)
+    else:
+        physical_type_name = jelly.PhysicalStreamType.Name(physical_type)
+        msg = f"the stream type {physical_type_name} is not supported "
+        raise NotImplementedError(msg)
+    return create_decoder(adapter, trusted=trusted, memory=memory)
+
+
+async def parse_jelly_flat_async(
+    inp: AsyncByteSource,
+    *,
+    logical_type_strict: bool = False,
+    trusted: bool = False,
+    memory: MemoryTracker | None = None,
+) -> AsyncGenerator[Statement | Prefix]:
+    """
+    Parse an asynchronous jelly byte source into an async generator of stream events.
+
+    Async counterpart of `parse_jelly_flat`.
+
+    Args:
+        inp (AsyncByteSource): `asyncio.StreamReader` or async iterable of bytes
+        logical_type_strict (bool): If True, validate the *logical* type in
+            stream options and require FLAT_(TRIPLES|QUADS).
+        trusted (bool): skip validation for input from a trusted producer,
+            see `RDFLibAdapter` and `TrustedDecoder`.
+        memory (MemoryTracker | None): track (and limit) the memory held by
+            the decoder, see `MemoryTracker`.
+
+    Raises:
+        NotImplementedError: if physical type is not supported
+
+    Yields:
+        Statement | Prefix: stream events
+
+    """
+    options, frames = await async_get_options_and_frames(inp)
+    if logical_type_strict:
+        check_logical_type(options.stream_types, grouped=False)
+    decoder = make_decoder(options, trusted=trusted, memory=memory)
+    async for frame in frames:
+        for item in decoder.iter_rows(frame):
+            yield item
+
+
+async def parse_jelly_grouped_async(  # noqa: PLR0913
+    inp: AsyncByteSource,
+    graph_factory: Callable[[], Graph] = lambda: Graph(),
+    dataset_factory: Callable[[], Dataset] = lambda: Dataset(),
+    *,
+    logical_type_strict: bool = False,
+    frame_metadata: ContextVar[MutableMapping[str, bytes]] | None = None,
+    trusted: bool = False,
+    memory: MemoryTracker | None = None,
+) -> AsyncGenerator[Graph | Dataset]:
+    """
+    Parse an asynchronous jelly byte source into graphs or datasets.
+
+    Async counterpart of `parse_jelly_grouped`, yields one graph/dataset per frame.
+
+    Args:
+        inp (AsyncByteSource): `asyncio.StreamReader` or async iterable of bytes
+        graph_factory (Callable): lambda to construct a Graph.
+        dataset_factory (Callable): lambda to construct a Dataset.
+        logical_type_strict (bool): If True, validate the *logical* type in
+            stream options and require a grouped logical type.
+        frame_metadata: (ContextVar[ScalarMap[str, bytes]]): context variable
+            used for extracting frame metadata
+        trusted (bool): skip validation for input from a trusted producer,
+            see `RDFLibAdapter` and `TrustedDecoder`.
+        memory (MemoryTracker | None): track (and limit) the memory held by
+            the decoder, see `MemoryTracker`.
+
+    Raises:
+        NotImplementedError: if physical type is not supported
+
+    Yields:
+        Graph | Dataset: graphs for triple streams, datasets otherwise
+
+    """
+    options, frames = await async_get_options_and_frames(inp)
+    if logical_type_strict:
+        check_logical_type(options.stream_types, grouped=True)
+    decoder = make_decoder(options, trusted=trusted, memory=memory)
+    triples = options.stream_types.physical_type == jelly.PHYSICAL_STREAM_TYPE_TRIPLES
+    async for frame in frames:
+        if frame_metadata is not None:
+            frame_metadata.set(dict(frame.metadata))
+        sink = graph_factory() if triples else dataset_factory()
+        add_statements(sink, decoder.iter_rows(frame))
+        yield sink
@@ -1,7 +1,8 @@
 # ruff: noqa: I001
 from __future__ import annotations
+import asyncio
 from typing import cast
-from collections.abc import Generator
+from collections.abc import AsyncIterable, Generator
 from functools import singledispatch
 from typing import Any, IO
 from typing_extensions import override
@@ -18,6 +19,12 @@ from mypy_extensions import mypyc_attr
 
 from pyjelly import jelly
 from pyjelly.serialize.encode import Rows, Slot, TermEncoder, Statement, HasGraph
+from pyjelly.serialize.aioutils import (
+    prepend_async,
+    write_frames_async,
+    write_statements_async,
+)
+from pyjelly.serialize.sort import group_by_graph, sort_statements
 from pyjelly.serialize.ioutils import write_delimited, write_single
 from pyjelly.serialize.streams import (
     GraphStream,
@@ -188,6 +195,10 @@ def graphs_stream_frames(
     Notes:
         If flow of DatasetsFrameFlow type, the whole dataset
         will be encoded into one frame.
+        A generator of quads is grouped by graph with `group_by_graph`,
+        buffering at most `options.graph_buffer` triples in memory.
+        Unlike a Dataset, the generator is not deduplicated: a quad
+        repeated in it is written once per occurrence.
 
     Args:
         stream (GraphStream): stream that specifies graphs processing
@@ -202,16 +213,12 @@ def graphs_stream_frames(
         namespace_declarations(data, stream)  # type: ignore[arg-type]
 
     if isinstance(data, Dataset):
-        graphs = data.graphs()
+        for graph in data.graphs():
+            yield from stream.graph(graph_id=graph.identifier, graph=graph)
     else:
-        ds = Dataset()
-        for quad in data:
-            ctx = ds.get_context(quad.g)
-            ctx.add((quad.s, quad.p, quad.o))
-        graphs = ds.graphs()
-
-    for graph in graphs:
-        yield from stream.graph(graph_id=graph.identifier, graph=graph)
+        graphs = group_by_graph(data, max_in_memory=stream.options.graph_buffer)
+        for graph_id, triples in graphs:
+            yield from stream.graph(graph_id=graph_id, graph=triples)
 
     if frame := stream.flow.frame_from_dataset():
         yield frame
@@ -360,6 +367,8 @@ def grouped_stream_to_file(
 def flat_stream_to_frames(
     statements: Generator[Triple | Quad],
     options: SerializerOptions | None = None,
+    *,
+    sort_buffer: int | None = None,
 ) -> Generator[jelly.RdfStreamFrame]:
     """
     Serialize a stream of raw triples or quads into Jelly frames.
@@ -369,11 +378,17 @@ def flat_stream_to_frames(
           s/p/o triples or s/p/o/g quads to serialize.
         options (SerializerOptions | None, optional):
             if omitted, guessed based on the first tuple.
+        sort_buffer (int | None, optional): if set, statements are first sorted
+            by graph, subject and predicate (see `sort_statements`), holding
+            at most this many in memory. Sorted input lets the encoder elide
+            more repeated terms. Defaults to None (keep input order).
 
     Yields:
         Generator[jelly.RdfStreamFrame]: generated frames.
 
     """
+    if sort_buffer is not None:
+        statements = sort_statements(statements, max_in_memory=sort_buffer)
     first = next(statements, None)
     if first is None:
         return
@@ -394,6 +409,8 @@ def flat_stream_to_file(
     statements: Generator[Triple | Quad],
     output_file: IO[bytes],
     options: SerializerOptions | None = None,
+    *,
+    sort_buffer: int | None = None,
 ) -> None:
     """
     Write Triple or Quad events to a binary file in Jelly flat format.
@@ -402,7 +419,78 @@ def flat_stream_to_file(
         statements (Generator[Triple | Quad]): statements to serialize.
         output_file (IO[bytes]): output buffered writer.
         options (SerializerOptions | None, optional): stream options.
+        sort_buffer (int | None, optional): see `flat_stream_to_frames`.
 
     """
-    for frame in flat_stream_to_frames(statements, options):
+    for frame in flat_stream_to_frames(statements, options, sort_buffer=sort_buffer):
         write_delimited(frame, output_file)
+
+
+async def grouped_stream_to_file_async(
+    stream: AsyncIterable[Graph] | AsyncIterable[Dataset],
+    writer: asyncio.StreamWriter,
+    options: SerializerOptions | None = None,
+    *,
+    offload: bool = False,
+) -> None:
+    """
+    Write an async stream of Graphs/Datasets to an asyncio stream writer.
+
+    Async counterpart of `grouped_stream_to_file`. The writer is drained
+    after every frame, so slow consumers apply backpressure.
+
+    Args:
+        stream (AsyncIterable[Graph] | AsyncIterable[Dataset]): Graphs/Datasets
+            to serialize.
+        writer (asyncio.StreamWriter): output stream writer.
+        options (SerializerOptions | None, optional): stream options to use.
+            Options are guessed based on the first sink. Defaults to None.
+        offload (bool): encode each Graph/Dataset in a worker thread,
+            so the event loop is not blocked.
+
+    """
+    jelly_stream = None
+    async for sink in stream:
+        if not jelly_stream:
+            if options is None:
+                options = guess_options(sink)
+            jelly_stream = guess_stream(options, sink)
+        await write_frames_async(
+            stream_frames(jelly_stream, sink), writer, offload=offload
+        )
+
+
+async def flat_stream_to_file_async(
+    statements: AsyncIterable[Triple | Quad],
+    writer: asyncio.StreamWriter,
+    options: SerializerOptions | None = None,
+    *,
+    offload: bool = False,
+) -> None:
+    """
+    Write Triple or Quad events from an async iterator to an asyncio stream writer.
+
+    Async counterpart of `flat_stream_to_file`. The writer is drained
+    after every frame, so slow consumers apply backpressure.
+
+    Args:
+        statements (AsyncIterable[Triple | Quad]): statements to serialize.
+        writer (asyncio.StreamWriter): output stream writer.
+        options (SerializerOptions | None, optional): stream options.
+            If omitted, guessed based on the first tuple.
+        offload (bool): encode batches of statements in a worker thread,
+            so the event loop is not blocked.
+
+    """
+    iterator = aiter(statements)
+    first = await anext(iterator, None)
+    if first is None:
+        return
+
+    sink = Dataset() if len(first) == QUAD_ARITY else Graph()
+    if options is None:
+        options = guess_options(sink)
+    stream = guess_stream(options, sink)
+
+    combined = prepend_async(first, iterator)
+    await write_statements_async(stream, combined, writer, offload=offload)
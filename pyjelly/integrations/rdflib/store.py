@@ -0,0 +1,562 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+from array import array
+from collections.abc import Generator, Iterable, Iterator
+from pathlib import Path
+from typing import IO, Any, Final, TypeAlias
+from typing_extensions import override
+
+import rdflib
+from rdflib import RDF, XSD, BNode, Graph, URIRef
+from rdflib.graph import DATASET_DEFAULT_GRAPH_ID
+from rdflib.store import VALID_STORE, Store
+from rdflib.term import Node
+
+from pyjelly import jelly
+from pyjelly.errors import JellyNotImplementedError
+from pyjelly.parse.decode import Adapter, Decoder, ParserOptions
+from pyjelly.parse.ioutils import get_options_and_frames
+
+TermKey: TypeAlias = tuple[Any, ...]
+Index: TypeAlias = "tuple[array[int], dict[int, tuple[int, int]]]"
+
+IRI_KEY: Final = 0
+BNODE_KEY: Final = 1
+LITERAL_KEY: Final = 2
+DEFAULT_GRAPH_ID: Final = 0
+INDEX_SUFFIX: Final = ".idx"
+INDEX_MAGIC: Final = b"PYJELLYIDX2\n"
+INDEX_TYPECODE: Final = "I"
+QUAD_ARITY: Final = 4
+# Datatypes whose lexical forms rdflib keeps as they are
+VERBATIM_DATATYPES: Final = frozenset((None, str(XSD.string), str(RDF.langString)))
+
+
+class _TermIdAdapter(Adapter):
+    """Adapter decoding terms to integer ids of a JellyStore."""
+
+    def __init__(self, options: ParserOptions, store: JellyStore) -> None:
+        super().__init__(options=options)
+        self.store = store
+        self.graph_id = DEFAULT_GRAPH_ID
+
+    @override
+    def iri(self, iri: str) -> int:
+        return self.store._term_id((IRI_KEY, iri))
+
+    @override
+    def bnode(self, bnode: str) -> int:
+        return self.store._term_id((BNODE_KEY, bnode))
+
+    @override
+    def default_graph(self) -> int:
+        return DEFAULT_GRAPH_ID
+
+    @override
+    def literal(
+        self,
+        lex: str,
+        language: str | None = None,
+        datatype: str | None = None,
+    ) -> int:
+        return self.store._literal_id(lex, language, datatype)
+
+    @override
+    def quoted_triple(self, terms: Iterable[Any]) -> Any:
+        msg = "JellyStore does not support quoted triples (RDF-star)"
+        raise JellyNotImplementedError(msg)
+
+    @override
+    def triple(self, terms: Iterable[Any]) -> None:
+        if self.store._has_graphs:
+            self.store._append(*terms, self.graph_id)
+        else:
+            self.store._append(*terms)
+
+    @override
+    def quad(self, terms: Iterable[Any]) -> None:
+        self.store._append(*terms)
+
+    @override
+    def graph_start(self, graph_id: int) -> None:
+        self.graph_id = graph_id
+
+    @override
+    def graph_end(self) -> None:
+        self.graph_id = DEFAULT_GRAPH_ID
+
+    @override
+    def namespace_declaration(self, name: str, iri: int) -> None:
+        namespace = self.store._term(iri)
+        self.store._declared.append((name, str(namespace)))
+        self.store.bind(name, namespace)  # type: ignore[arg-type]
+
+
+def _normalized_key(key: TermKey) -> TermKey:
+    """Return the literal key with the lexical form rdflib gives the literal."""
+    _, lex, language, datatype = key
+    if datatype in VERBATIM_DATATYPES:
+        return key
+    normalized = str(rdflib.Literal(lex, datatype=datatype))
+    return key if normalized == lex else (LITERAL_KEY, normalized, language, datatype)
+
+
+def _build_index(column: array[int]) -> Index:
+    """
+    Return the rows of a column grouped by term id, and where each group is.
+
+    Term ids are dense, so the rows are placed with a counting sort into
+    arrays, without building a Python list of the rows.
+    Rows of one term id keep their order in the column.
+    """
+    if not column:
+        return array(column.typecode), {}
+    # Next free position of every term id, starting at the end of its count
+    positions = array(column.typecode, bytes(column.itemsize * (max(column) + 1)))
+    for term_id in column:
+        positions[term_id] += 1
+    bounds: dict[int, tuple[int, int]] = {}
+    start = 0
+    for term_id, count in enumerate(positions):
+        if count:
+            bounds[term_id] = (start, start + count)
+            positions[term_id] = start
+            start += count
+    order = array(column.typecode, bytes(column.itemsize * len(column)))
+    for row, term_id in enumerate(column):
+        order[positions[term_id]] = row
+        positions[term_id] += 1
+    return order, bounds
+
+
+def _index_starts(index: Index) -> tuple[array[int], array[int]]:
+    """Return the term ids of an index and the rows where each of them starts."""
+    _, bounds = index
+    return (
+        array(INDEX_TYPECODE, bounds),
+        array(INDEX_TYPECODE, (start for start, _ in bounds.values())),
+    )
+
+
+def _index_from_starts(
+    order: array[int], term_ids: array[int], starts: array[int]
+) -> Index:
+    stops = [*starts[1:], len(order)] if starts else []
+    return order, dict(zip(term_ids, zip(starts, stops, strict=True), strict=True))
+
+
+class JellyStore(Store):
+    """
+    Read-only rdflib store answering queries directly from a Jelly file.
+
+    Notes:
+        On `open()`, the file is decoded once into integer columns
+        (one id per distinct term) and sorted per-position indexes;
+        rdflib terms are only created for query results, once per term.
+        Sorting the indexes takes about as long as decoding the file.
+        With `persist=True`, the columns and indexes are saved next to the
+        file (with the ".idx" suffix) and reused while the file is
+        unchanged, so later opens only read them back.
+        Use a `Graph` for triple streams and a `Dataset` for quad streams.
+        Quoted triples (RDF-star) are not supported, as rdflib has no terms
+        for them.
+        Statements are returned as stored: a triple repeated in the stream
+        (or stored in several graphs, when querying without a context)
+        is returned once per occurrence.
+
+    Args:
+        configuration (str | None): path of the Jelly file to open.
+            Defaults to None (call `open()` later).
+        identifier (rdflib.term.Identifier | None): store identifier.
+        persist (bool): save and reuse the decoded columns.
+            Defaults to False.
+
+    """
+
+    context_aware = True
+    formula_aware = False
+    transaction_aware = False
+    graph_aware = True
+
+    def __init__(
+        self,
+        configuration: str | None = None,
+        identifier: rdflib.term.Identifier | None = None,
+        *,
+        persist: bool = False,
+    ) -> None:
+        self.persist = persist
+        self._reset()
+        self._namespaces: dict[str, URIRef] = {}
+        self._prefixes: dict[URIRef, str] = {}
+        super().__init__(configuration, identifier)
+
+    def _reset(self) -> None:
+        self._keys: list[TermKey | None] = [None]
+        self._ids: dict[TermKey, int] = {}
+        self._terms: dict[int, Node] = {DEFAULT_GRAPH_ID: DATASET_DEFAULT_GRAPH_ID}
+        self._contexts: dict[int, Graph] = {}
+        self._columns = tuple(array(INDEX_TYPECODE) for _ in range(QUAD_ARITY))
+        self._indexes: list[Index] = []
+        self._has_graphs = False
+        # Namespaces declared in the stream (persisted with the index)
+        self._declared: list[tuple[str, str]] = []
+
+    @override
+    def open(self, configuration: str | tuple[str, str], create: bool = False) -> int:
+        """
+        Decode (or load the persisted index of) a Jelly file.
+
+        Args:
+            configuration (str | tuple[str, str]): path of the Jelly file
+            create (bool): ignored, the store is read-only
+
+        Raises:
+            TypeError: if the configuration is not a path
+            JellyNotImplementedError: if the file contains quoted triples
+
+        Returns:
+            int: VALID_STORE
+
+        """
+        if not isinstance(configuration, (str, os.PathLike)):
+            msg = "JellyStore configuration must be a path to a Jelly file"
+            raise TypeError(msg)
+        path = Path(configuration)
+        self._reset()
+        index_path = path.with_name(path.name + INDEX_SUFFIX)
+        if not (self.persist and self._load_index(path, index_path)):
+            with path.open("rb") as file:
+                self._decode(file)
+            # Triple streams have no graph column, nor a graph index
+            self._indexes = [_build_index(column) for column in self._columns]
+            if self.persist:
+                self._save_index(path, index_path)
+        return VALID_STORE
+
+    @override
+    def close(self, commit_pending_transaction: bool = False) -> None:
+        self._reset()
+
+    def _decode(self, file: IO[bytes]) -> None:
+        options, frames = get_options_and_frames(file)
+        self._has_graphs = (
+            options.stream_types.physical_type != jelly.PHYSICAL_STREAM_TYPE_TRIPLES
+        )
+        decoder = Decoder(adapter=_TermIdAdapter(options, self))
+        for frame in frames:
+            for _ in decoder.iter_rows(frame):
+                pass
+
+    def _source_stamp(self, path: Path) -> list[int]:
+        stat = path.stat()
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def _save_index(self, path: Path, index_path: Path) -> None:
+        header = json.dumps(
+            {
+                "source": self._source_stamp(path),
+                "byteorder": sys.byteorder,
+                "graphs": self._has_graphs,
+                "keys": self._keys[1:],
+                "namespaces": self._declared,
+            }
+        ).encode()
+        with index_path.open("wb") as out:
+            out.write(INDEX_MAGIC)
+            out.write(len(header).to_bytes(8, "little"))
+            out.write(header)
+            for column in self._columns:
+                out.write(len(column).to_bytes(8, "little"))
+                column.tofile(out)
+            for index in self._indexes:
+                for part in (index[0], *_index_starts(index)):
+                    out.write(len(part).to_bytes(8, "little"))
+                    part.tofile(out)
+
+    def _load_index(self, path: Path, index_path: Path) -> bool:
+        if not index_path.exists():
+            return False
+        with index_path.open("rb") as inp:
+            if inp.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+                return False
+            header = json.loads(inp.read(int.from_bytes(inp.read(8), "little")))
+            if header["source"] != self._source_stamp(path):
+                return False
+            swap = header["byteorder"] != sys.byteorder
+
+            def read_array() -> array[int]:
+                part = array(INDEX_TYPECODE)
+                part.fromfile(inp, int.from_bytes(inp.read(8), "little"))
+                if swap:
+                    part.byteswap()
+                return part
+
+            self._columns = tuple(read_array() for _ in range(QUAD_ARITY))
+            self._indexes = [
+                _index_from_starts(read_array(), read_array(), read_array())
+                for _ in range(QUAD_ARITY)
+            ]
+        self._has_graphs = header["graphs"]
+        self._keys.extend(tuple(key) for key in header["keys"])
+        self._ids = {key: term_id for term_id, key in enumerate(self._keys) if key}
+        for prefix, namespace in header["namespaces"]:
+            self.bind(prefix, URIRef(namespace))
+        return True
+
+    def _term_id(self, key: TermKey) -> int:
+        term_id = self._ids.get(key)
+        if term_id is None:
+            term_id = self._ids[key] = len(self._keys)
+            self._keys.append(key)
+        return term_id
+
+    def _literal_id(self, lex: str, language: str | None, datatype: str | None) -> int:
+        key: TermKey = (LITERAL_KEY, lex, language, datatype)
+        term_id = self._ids.get(key)
+        if term_id is None:
+            # Keyed by the lexical form rdflib would give the term, so that
+            # query literals are found directly; the original form is an alias
+            term_id = self._ids[key] = self._term_id(_normalized_key(key))
+        return term_id
+
+    def _append(self, *ids: int) -> None:
+        for column, term_id in zip(self._columns, ids, strict=False):
+            column.append(term_id)
+
+    def _term(self, term_id: int) -> Node:
+        term = self._terms.get(term_id)
+        if term is None:
+            key = self._keys[term_id]
+            assert key is not None
+            if key[0] == IRI_KEY:
+                term = URIRef(key[1])
+            elif key[0] == BNODE_KEY:
+                term = BNode(key[1])
+            else:
+                term = rdflib.Literal(key[1], lang=key[2], datatype=key[3])
+            self._terms[term_id] = term
+        return term
+
+    def _lookup(self, term: Node) -> int | None:
+        if isinstance(term, rdflib.Literal):
+            datatype = str(term.datatype) if term.datatype is not None else None
+            key: TermKey = (LITERAL_KEY, str(term), term.language, datatype)
+            term_id = self._ids.get(key)
+            if term_id is None:
+                # Literals created with normalization turned off
+                term_id = self._ids.get(_normalized_key(key))
+            return term_id
+        if isinstance(term, BNode):
+            return self._ids.get((BNODE_KEY, str(term)))
+        if isinstance(term, URIRef):
+            return self._ids.get((IRI_KEY, str(term)))
+        return None
+
+    def _graph_id(self, context: Graph | None) -> int | None:
+        """Return the id of the context, -1 if unknown, None to match any."""
+        if context is None or not self._has_graphs:
+            return None
+        identifier = context.identifier
+        if identifier == DATASET_DEFAULT_GRAPH_ID:
+            return DEFAULT_GRAPH_ID
+        term_id = self._lookup(identifier)
+        if term_id is None or term_id not in self._indexes[3][1]:
+            return -1
+        return term_id
+
+    def _context(self, graph_id: int) -> Graph:
+        context = self._contexts.get(graph_id)
+        if context is None:
+            identifier = self._term(graph_id)
+            context = self._contexts[graph_id] = Graph(
+                store=self,
+                identifier=identifier,  # type: ignore[arg-type]
+            )
+        return context
+
+    def _match(self, ids: list[int | None]) -> Iterator[int]:
+        """Yield the rows matching term ids, None matching any term."""
+        best: tuple[int, int, int] | None = None
+        checks: list[tuple[array[int], int]] = []
+        for position, term_id in enumerate(ids):
+            if term_id is None:
+                continue
+            bounds = self._indexes[position][1].get(term_id)
+            if bounds is None:
+                return iter(())
+            start, stop = bounds
+            if best is None or stop - start < best[2] - best[1]:
+                if best is not None:
+                    checks.append((self._columns[best[0]], ids[best[0]]))  # type: ignore[arg-type]
+                best = (position, start, stop)
+            else:
+                checks.append((self._columns[position], term_id))
+        rows: Iterable[int]
+        if best is None:
+            rows = range(len(self._columns[0]))
+        else:
+            position, start, stop = best
+            rows = self._indexes[position][0][start:stop]
+        if not checks:
+            return iter(rows)
+        return (
+            row
+            for row in rows
+            if all(column[row] == term_id for column, term_id in checks)
+        )
+
+    def _pattern_ids(self, pattern: Iterable[Node | None]) -> list[int | None] | None:
+        ids: list[int | None] = []
+        for term in pattern:
+            if term is None:
+                ids.append(None)
+                continue
+            term_id = self._lookup(term)
+            if term_id is None:
+                return None
+            ids.append(term_id)
+        return ids
+
+    @override
+    def triples(
+        self,
+        triple_pattern: tuple[Node | None, Node | None, Node | None],
+        context: Graph | None = None,
+    ) -> Generator[tuple[tuple[Node, Node, Node], Iterator[Graph]]]:
+        ids = self._pattern_ids(triple_pattern)
+        graph_id = self._graph_id(context)
+        if ids is None or graph_id == -1:
+            return
+        ids.append(graph_id)
+        subjects, predicates, objects, graphs = self._columns
+        term = self._term
+        for row in self._match(ids):
+            triple = (term(subjects[row]), term(predicates[row]), term(objects[row]))
+            graph_id = graphs[row] if self._has_graphs else DEFAULT_GRAPH_ID
+            yield triple, iter((self._context(graph_id),))
+
+    def quads(
+        self,
+        quad_pattern: tuple[Node | None, Node | None, Node | None, Node | None] = (
+            None,
+            None,
+            None,
+            None,
+        ),
+    ) -> Generator[tuple[Node, Node, Node, Node]]:
+        """
+        Yield s/p/o/g quads matching a pattern, None matching any term.
+
+        Args:
+            quad_pattern (tuple): s/p/o/g pattern, the graph name
+                of the default graph is DATASET_DEFAULT_GRAPH_ID.
+
+        Yields:
+            tuple[Node, Node, Node, Node]: matching quads
+
+        """
+        *spo, graph_name = quad_pattern
+        ids = self._pattern_ids(spo)
+        if ids is None:
+            return
+        graph_id: int | None = None
+        if graph_name == DATASET_DEFAULT_GRAPH_ID:
+            graph_id = DEFAULT_GRAPH_ID
+        elif graph_name is not None:
+            graph_id = self._lookup(graph_name)
+            if graph_id is None:
+                return
+        if not self._has_graphs:
+            if graph_id not in (None, DEFAULT_GRAPH_ID):
+                return
+            graph_id = None
+        ids.append(graph_id)
+        subjects, predicates, objects, graphs = self._columns
+        term = self._term
+        for row in self._match(ids):
+            graph = graphs[row] if self._has_graphs else DEFAULT_GRAPH_ID
+            yield (
+                term(subjects[row]),
+                term(predicates[row]),
+                term(objects[row]),
+                term(graph),
+            )
+
+    @override
+    def __len__(self, context: Graph | None = None) -> int:
+        graph_id = self._graph_id(context)
+        if graph_id is None:
+            return len(self._columns[0])
+        start, stop = self._indexes[3][1].get(graph_id, (0, 0))
+        return stop - start
+
+    @override
+    def contexts(self, triple: Any = None) -> Generator[Graph]:
+        if not self._has_graphs:
+            if self._indexes:
+                yield self._context(DEFAULT_GRAPH_ID)
+            return
+        if triple is None:
+            graph_ids: Iterable[int] = self._indexes[3][1] if self._indexes else ()
+        else:
+            ids = self._pattern_ids(triple)
+            if ids is None:
+                return
+            graphs = self._columns[3]
+            graph_ids = dict.fromkeys(graphs[row] for row in self._match([*ids, None]))
+        for graph_id in graph_ids:
+            yield self._context(graph_id)
+
+    @override
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        if not override and (prefix in self._namespaces or namespace in self._prefixes):
+            return
+        old_namespace = self._namespaces.pop(prefix, None)
+        if old_namespace is not None:
+            self._prefixes.pop(old_namespace, None)
+        old_prefix = self._prefixes.pop(namespace, None)
+        if old_prefix is not None:
+            self._namespaces.pop(old_prefix, None)
+        self._namespaces[prefix] = namespace
+        self._prefixes[namespace] = prefix
+
+    @override
+    def namespace(self, prefix: str) -> URIRef | None:
+        return self._namespaces.get(prefix)
+
+    @override
+    def prefix(self, namespace: URIRef) -> str | None:
+        return self._prefixes.get(namespace)
+
+    @override
+    def namespaces(self) -> Iterator[tuple[str, URIRef]]:
+        return iter(list(self._namespaces.items()))
+
+    @override
+    def add_graph(self, graph: Graph) -> None:
+        # Dataset registers its default graph on creation, nothing to store
+        return
+
+    @override
+    def add(self, triple: Any, context: Any, quoted: bool = False) -> None:
+        msg = "JellyStore is read-only"
+        raise TypeError(msg)
+
+    @override
+    def addN(self, quads: Iterable[Any]) -> None:
+        msg = "JellyStore is read-only"
+        raise TypeError(msg)
+
+    @override
+    def remove(self, triple: Any, context: Any = None) -> None:
+        msg = "JellyStore is read-only"
+        raise TypeError(msg)
+
+    @override
+    def remove_graph(self, graph: Graph) -> None:
+        msg = "JellyStore is read-only"
+        raise TypeError(msg)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import warnings
+
+from pyjelly.errors import JellyMemoryError, JellyMemoryWarning
+
+
+def utf8_size(value: str) -> int:
+    """Return the size of `value` encoded as UTF-8, as it is sent in rows."""
+    return len(value) if value.isascii() else len(value.encode())
+
+
+class MemoryTracker:
+    """
+    Approximate memory held by one stream, with an optional ceiling.
+
+    Notes:
+        Serializer streams account for the encoded size of the rows buffered
+        in their flow (a whole graph or dataset for grouped flows, the whole
+        stream for non-delimited output) after every statement. Decoders
+        account for the encoded size of the frame being decoded (which is
+        what grouped parsing turns into one graph) before decoding it.
+        Both add the UTF-8 encoded size of their lookup tables, which they
+        keep up to date only while a tracker is attached.
+
+        A tracker measures one stream at a time: every stream overwrites its
+        readings. Streams that share a tracker, for example through one
+        `SerializerOptions` object, neither get separate readings nor a
+        combined total, so give each stream its own tracker.
+
+        Sizes are the protobuf-encoded sizes of rows and strings, so the
+        resident memory of the Python objects built from them is larger;
+        set the ceiling with that in mind.
+
+    Args:
+        ceiling (int | None): maximum accounted bytes, None to only track
+        warn (bool): emit `JellyMemoryWarning` (once per crossing) instead
+            of raising `JellyMemoryError` when the ceiling is crossed
+
+    >>> memory = MemoryTracker(ceiling=100)
+    >>> memory.buffered = 80
+    >>> memory.check()
+    >>> memory.buffered = 20
+    >>> memory.check()
+    >>> memory.current, memory.high_water_mark
+    (20, 80)
+
+    """
+
+    def __init__(self, ceiling: int | None = None, *, warn: bool = False) -> None:
+        self.ceiling = ceiling
+        self.warn = warn
+        self.buffered = 0
+        self.lookups = 0
+        self.high_water_mark = 0
+        self.exceeded = False
+
+    @property
+    def current(self) -> int:
+        return self.buffered + self.lookups
+
+    def check(self) -> None:
+        """
+        Record the high-water mark and enforce the ceiling.
+
+        Raises:
+            JellyMemoryError: if the ceiling is crossed and `warn` is not set
+
+        """
+        current = self.buffered + self.lookups
+        self.high_water_mark = max(self.high_water_mark, current)
+        if self.ceiling is None or current <= self.ceiling:
+            self.exceeded = False
+            return
+        msg = (
+            f"stream holds about {current} bytes ({self.buffered} in buffered "
+            f"rows, {self.lookups} in lookups), over the ceiling of {self.ceiling}"
+        )
+        if not self.warn:
+            raise JellyMemoryError(msg)
+        if not self.exceeded:
+            self.exceeded = True
+            warnings.warn(msg, JellyMemoryWarning, stacklevel=2)
+
+    def __repr__(self) -> str:
+        return (
+            f"MemoryTracker(ceiling={self.ceiling!r}, current={self.current!r}, "
+            f"high_water_mark={self.high_water_mark!r})"
+        )
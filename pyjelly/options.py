@@ -139,3 +139,37 @@ def validate_type_compatibility(
         logical_type_name = jelly.LogicalStreamType.Name(logical_type)
         msg = f"{physical_type_name} is not compatible with {logical_type_name}"
         raise JellyAssertionError(msg)
+
+
+def check_logical_type(stream_types: StreamTypes | None, *, grouped: bool) -> None:
+    """
+    Check that the stream declares a FLAT or a grouped logical type.
+
+    Args:
+        stream_types (StreamTypes | None): stream types declared in the options
+        grouped (bool): require a grouped logical type if True,
+            a FLAT (TRIPLES/QUADS) one otherwise
+
+    Raises:
+        JellyConformanceError: if the logical type is not the expected one
+
+    """
+    st = stream_types
+    if grouped:
+        ok = (
+            st is not None
+            and st.logical_type != jelly.LOGICAL_STREAM_TYPE_UNSPECIFIED
+            and not st.flat
+        )
+        expected = "GROUPED logical type"
+    else:
+        ok = st is not None and st.flat
+        expected = "FLAT logical type (TRIPLES/QUADS)"
+    if ok:
+        return
+    if st is None:
+        msg = "strict logical type check requires options.stream_types"
+    else:
+        lt_name = jelly.LogicalStreamType.Name(st.logical_type)
+        msg = f"expected {expected}, got {lt_name}"
+    raise JellyConformanceError(msg)
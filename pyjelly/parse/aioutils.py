@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator
+from typing import TypeAlias
+
+from google.protobuf.proto import parse
+
+from pyjelly import jelly
+from pyjelly.errors import JellyConformanceError
+from pyjelly.parse.decode import ParserOptions, options_from_frame
+from pyjelly.parse.ioutils import delimited_jelly_hint
+
+AsyncByteSource: TypeAlias = asyncio.StreamReader | AsyncIterable[bytes]
+
+READ_CHUNK_SIZE = 64 * 1024
+VARINT_CONTINUATION_BIT = 0x80
+VARINT_PAYLOAD_MASK = 0x7F
+MAX_VARINT_SHIFT = 64
+
+
+class AsyncByteReader:
+    """
+    Buffered reader over an `asyncio.StreamReader` or an async byte iterator.
+
+    Args:
+        source (AsyncByteSource): stream reader or async iterable of byte chunks
+
+    """
+
+    def __init__(self, source: AsyncByteSource) -> None:
+        self._reader: asyncio.StreamReader | None = None
+        self._chunks: AsyncIterator[bytes] | None = None
+        if isinstance(source, asyncio.StreamReader):
+            self._reader = source
+        else:
+            self._chunks = aiter(source)
+        self._buffer = bytearray()
+        self._position = 0
+        self._eof = False
+
+    @property
+    def buffered(self) -> int:
+        return len(self._buffer) - self._position
+
+    async def _fill(self) -> bool:
+        """Read the next chunk into the buffer; return False on EOF."""
+        if self._eof:
+            return False
+        if self._reader is not None:
+            chunk = await self._reader.read(READ_CHUNK_SIZE)
+        else:
+            assert self._chunks is not None
+            chunk = await anext(self._chunks, b"")
+        if not chunk:
+            self._eof = True
+            return False
+        if self._position:
+            del self._buffer[: self._position]
+            self._position = 0
+        self._buffer += chunk
+        return True
+
+    async def peek(self, size: int) -> bytes:
+        """Return up to `size` bytes without consuming them."""
+        while self.buffered < size and await self._fill():
+            pass
+        return bytes(self._buffer[self._position : self._position + size])
+
+    async def read_exactly(self, size: int) -> bytes:
+        """
+        Consume exactly `size` bytes.
+
+        Raises:
+            JellyConformanceError: if the stream ends before `size` bytes are read
+
+        """
+        while self.buffered < size:
+            if not await self._fill():
+                msg = f"unexpected end of stream, expected {size} bytes"
+                raise JellyConformanceError(msg)
+        start = self._position
+        self._position += size
+        return bytes(self._buffer[start : self._position])
+
+    async def read_all(self) -> bytes:
+        """Consume all remaining bytes."""
+        while await self._fill():
+            pass
+        data = bytes(self._buffer[self._position :])
+        self._buffer.clear()
+        self._position = 0
+        return data
+
+    async def read_varint(self) -> int | None:
+        """
+        Consume a base-128 varint.
+
+        Returns:
+            int | None: decoded value, or None if the stream ended cleanly
+
+        """
+        result = shift = 0
+        while True:
+            if not self.buffered and not await self._fill():
+                if shift == 0:
+                    return None
+                msg = "unexpected end of stream inside a varint"
+                raise JellyConformanceError(msg)
+            byte = self._buffer[self._position]
+            self._position += 1
+            result |= (byte & VARINT_PAYLOAD_MASK) << shift
+            if not byte & VARINT_CONTINUATION_BIT:
+                return result
+            shift += 7
+            if shift >= MAX_VARINT_SHIFT:
+                msg = "varint is too long"
+                raise JellyConformanceError(msg)
+
+
+async def async_frame_iterator(
+    inp: AsyncByteSource | AsyncByteReader,
+) -> AsyncGenerator[jelly.RdfStreamFrame]:
+    """
+    Yield frames from a delimited Jelly stream read asynchronously.
+
+    Args:
+        inp (AsyncByteSource | AsyncByteReader): async source of stream bytes
+
+    Yields:
+        jelly.RdfStreamFrame: parsed frames
+
+    """
+    reader = inp if isinstance(inp, AsyncByteReader) else AsyncByteReader(inp)
+    while (size := await reader.read_varint()) is not None:
+        data = await reader.read_exactly(size)
+        yield parse(jelly.RdfStreamFrame, data)
+
+
+async def _chain_frames(
+    first_frames: list[jelly.RdfStreamFrame],
+    frames: AsyncIterator[jelly.RdfStreamFrame] | None = None,
+) -> AsyncGenerator[jelly.RdfStreamFrame]:
+    for frame in first_frames:
+        yield frame
+    if frames is not None:
+        async for frame in frames:
+            yield frame
+
+
+async def async_get_options_and_frames(
+    inp: AsyncByteSource,
+) -> tuple[ParserOptions, AsyncIterator[jelly.RdfStreamFrame]]:
+    """
+    Return stream options and frames from an asynchronous byte source.
+
+    Async counterpart of `pyjelly.parse.ioutils.get_options_and_frames`.
+
+    Args:
+        inp (AsyncByteSource): `asyncio.StreamReader` or async iterable of bytes
+
+    Raises:
+        JellyConformanceError: if no non-empty frames detected in the delimited stream
+        JellyConformanceError: if non-delimited,
+            error is raised if no rows are detected (empty frame)
+
+    Returns:
+        tuple[ParserOptions, AsyncIterator[jelly.RdfStreamFrame]]: stream options
+            and an async iterator over all frames (including the first one)
+
+    """
+    reader = AsyncByteReader(inp)
+    is_delimited = delimited_jelly_hint(await reader.peek(3))
+
+    if is_delimited:
+        frames = async_frame_iterator(reader)
+        skipped_frames: list[jelly.RdfStreamFrame] = []
+        async for frame in frames:
+            skipped_frames.append(frame)
+            if frame.rows:
+                break
+        else:
+            msg = "No non-empty frames found in the stream"
+            raise JellyConformanceError(msg)
+
+        options = options_from_frame(skipped_frames[-1], delimited=True)
+        return options, _chain_frames(skipped_frames, frames)
+
+    frame = parse(jelly.RdfStreamFrame, await reader.read_all())
+
+    if not frame.rows:
+        msg = "The stream is corrupted (only contains an empty frame)"
+        raise JellyConformanceError(msg)
+
+    options = options_from_frame(frame, delimited=False)
+    return options, _chain_frames([frame])
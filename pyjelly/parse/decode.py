@@ -3,14 +3,17 @@ from __future__ import annotations
 from abc import ABCMeta, abstractmethod
 from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from enum import Enum, auto
+from time import perf_counter_ns
 from typing import Any, ClassVar, NamedTuple
 from typing_extensions import Never
 
 from mypy_extensions import mypyc_attr
 
 from pyjelly import jelly
+from pyjelly.memory import MemoryTracker
 from pyjelly.options import MAX_VERSION, LookupPreset, StreamParameters, StreamTypes
-from pyjelly.parse.lookup import LookupDecoder
+from pyjelly.parse.lookup import LookupDecoder, TrustedLookupDecoder
+from pyjelly.profiling import DECODE, DECODE_LOOKUP, active_profiler
 
 RowHandler = Callable[[Any], Any | None]
 TermHandler = Callable[[Any], Any | None]
@@ -142,7 +145,7 @@ class Adapter(metaclass=ABCMeta):
             "decoding graph end markers", stream_types=self.options.stream_types
         )
 
-    def namespace_declaration(self, name: str, iri: str) -> Any:  # noqa: ARG002
+    def namespace_declaration(self, name: str, iri: Any) -> Any:  # noqa: ARG002
         _adapter_missing(
             "decoding namespace declarations",
             stream_types=self.options.stream_types,
@@ -179,7 +182,7 @@ class Decoder:
         jelly.RdfTriple: "decode_quoted_triple",
     }
 
-    def __init__(self, adapter: Adapter) -> None:
+    def __init__(self, adapter: Adapter, memory: MemoryTracker | None = None) -> None:
         """
         Initialize decoder.
 
@@ -190,17 +193,20 @@ class Decoder:
             adapter (Adapter): integration-dependent adapter that specifies terms
             conversion to specific objects, framing,
             namespace declarations, and graphs/datasets forming.
+            memory (MemoryTracker | None): tracker of the memory held by
+                the decoder, None to disable accounting.
 
         """
         self.adapter = adapter
-        self.names = LookupDecoder(lookup_size=self.options.lookup_preset.max_names)
-        self.prefixes = LookupDecoder(
-            lookup_size=self.options.lookup_preset.max_prefixes
-        )
-        self.datatypes = LookupDecoder(
-            lookup_size=self.options.lookup_preset.max_datatypes
-        )
+        self.names = self.make_lookup(self.options.lookup_preset.max_names)
+        self.prefixes = self.make_lookup(self.options.lookup_preset.max_prefixes)
+        self.datatypes = self.make_lookup(self.options.lookup_preset.max_datatypes)
         self.repeated_terms: dict[str, jelly.RdfIri | str | jelly.RdfLiteral] = {}
+        self.profiler = active_profiler()
+        self.memory = memory
+        if memory is not None:
+            for lookup in (self.names, self.prefixes, self.datatypes):
+                lookup.track_size()
 
         self.row_handlers: dict[type[Any], RowHandler] = {
             t: getattr(self, name) for t, name in self._ROW_HANDLER_NAMES.items()
@@ -213,6 +219,34 @@ class Decoder:
     def options(self) -> ParserOptions:
         return self.adapter.options
 
+    def make_lookup(self, lookup_size: int) -> LookupDecoder:
+        return LookupDecoder(lookup_size=lookup_size)
+
+    def lookup_byte_size(self) -> int:
+        """Return the UTF-8 encoded size of all lookup tables."""
+        return (
+            self.names.byte_size()
+            + self.prefixes.byte_size()
+            + self.datatypes.byte_size()
+        )
+
+    def account_frame(self, frame: jelly.RdfStreamFrame) -> None:
+        """
+        Account for the frame about to be decoded in the memory tracker.
+
+        Args:
+            frame (jelly.RdfStreamFrame): jelly frame
+
+        Raises:
+            JellyMemoryError: if the tracker's ceiling is crossed
+
+        """
+        memory = self.memory
+        assert memory is not None
+        memory.buffered = frame.ByteSize()
+        memory.lookups = self.lookup_byte_size()
+        memory.check()
+
     def iter_rows(self, frame: jelly.RdfStreamFrame) -> Iterator[Any]:
         """
         Iterate through rows in the frame.
@@ -223,9 +257,15 @@ class Decoder:
             Iterator[Any]: decoded rows
 
         """
+        if self.memory is not None:
+            self.account_frame(frame)
+        profiler = self.profiler
         for row_owner in frame.rows:
+            start = perf_counter_ns() if profiler is not None else 0
             row = getattr(row_owner, row_owner.WhichOneof("row"))
             decoded_row = self.decode_row(row)
+            if profiler is not None:
+                profiler.add(DECODE, perf_counter_ns() - start)
             if isinstance(
                 row, (jelly.RdfTriple, jelly.RdfQuad, jelly.RdfNamespaceDeclaration)
             ):
@@ -329,8 +369,12 @@ class Decoder:
             Any: IRI, based on adapter implementation, e.g., rdflib.term.URIRef
 
         """
+        profiler = self.profiler
+        start = perf_counter_ns() if profiler is not None else 0
         name = self.names.decode_name_term_index(iri.name_id)
         prefix = self.prefixes.decode_prefix_term_index(iri.prefix_id)
+        if profiler is not None:
+            profiler.add(DECODE_LOOKUP, perf_counter_ns() - start)
         return self.adapter.iri(iri=prefix + name)
 
     def decode_default_graph(self, _: jelly.RdfDefaultGraph) -> Any:
@@ -367,7 +411,11 @@ class Decoder:
         if literal.langtag:
             language = literal.langtag
         elif self.datatypes.lookup_size and literal.HasField("datatype"):
+            profiler = self.profiler
+            start = perf_counter_ns() if profiler is not None else 0
             datatype = self.datatypes.decode_datatype_term_index(literal.datatype)
+            if profiler is not None:
+                profiler.add(DECODE_LOOKUP, perf_counter_ns() - start)
         return self.adapter.literal(
             lex=literal.lex,
             language=language,
@@ -445,3 +493,78 @@ class Decoder:
     def decode_quad(self, quad: jelly.RdfQuad) -> Any:
         terms = self.decode_statement(quad, ("subject", "predicate", "object", "graph"))
         return self.adapter.quad(terms)
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class TrustedDecoder(Decoder):
+    """
+    Decoder for streams from a trusted producer.
+
+    Notes:
+        Skips per-row conformance checks: stream options rows are not
+        validated against the first one, lookup indices are resolved by
+        `TrustedLookupDecoder` and repeated terms are not checked.
+        Malformed input may decode to wrong terms instead of raising.
+
+    """
+
+    def make_lookup(self, lookup_size: int) -> LookupDecoder:
+        return TrustedLookupDecoder(lookup_size=lookup_size)
+
+    def decode_row(self, row: Any) -> Any | None:
+        return self.row_handlers[type(row)](row)
+
+    def validate_stream_options(self, options: jelly.RdfStreamOptions) -> None:
+        pass
+
+    def decode_term(self, term: Any) -> Any:
+        return self.term_handlers[type(term)](term)
+
+    def decode_iri(self, iri: jelly.RdfIri) -> Any:
+        profiler = self.profiler
+        start = perf_counter_ns() if profiler is not None else 0
+        names, prefixes = self.names, self.prefixes
+        name = names.at(iri.name_id or names.last_reused_index + 1)
+        prefix_id = iri.prefix_id or prefixes.last_reused_index
+        prefix = prefixes.at(prefix_id) if prefix_id else ""
+        if profiler is not None:
+            profiler.add(DECODE_LOOKUP, perf_counter_ns() - start)
+        return self.adapter.iri(iri=prefix + name)
+
+    def decode_statement(
+        self,
+        statement: jelly.RdfTriple | jelly.RdfQuad,
+        oneofs: Sequence[str],
+    ) -> Any:
+        terms = []
+        repeated_terms = self.repeated_terms
+        for oneof in oneofs:
+            field = statement.WhichOneof(oneof)
+            if field:
+                decoded_term = self.decode_term(getattr(statement, field))
+                repeated_terms[oneof] = decoded_term
+            else:
+                decoded_term = repeated_terms[oneof]
+            terms.append(decoded_term)
+        return terms
+
+
+def create_decoder(
+    adapter: Adapter, *, trusted: bool = False, memory: MemoryTracker | None = None
+) -> Decoder:
+    """
+    Create a decoder for the adapter.
+
+    Args:
+        adapter (Adapter): integration-dependent adapter
+        trusted (bool): skip conformance checks, see `TrustedDecoder`.
+        memory (MemoryTracker | None): track (and limit) the memory held by
+            the decoder, see `MemoryTracker`.
+
+    Returns:
+        Decoder: `TrustedDecoder` if `trusted`, otherwise the strict `Decoder`
+
+    """
+    if trusted:
+        return TrustedDecoder(adapter=adapter, memory=memory)
+    return Decoder(adapter=adapter, memory=memory)
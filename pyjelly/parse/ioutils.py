@@ -1,14 +1,21 @@
 import io
 import os
+import queue
+import threading
 from collections.abc import Generator, Iterator
+from contextlib import suppress
 from itertools import chain
-from typing import IO
+from time import perf_counter_ns
+from typing import IO, Final
 
 from google.protobuf.proto import parse, parse_length_prefixed
 
 from pyjelly import jelly
 from pyjelly.errors import JellyConformanceError
 from pyjelly.parse.decode import ParserOptions, options_from_frame
+from pyjelly.profiling import READ, READ_IO, Profiler, TimedIO, active_profiler
+
+READ_AHEAD_POLL_INTERVAL: Final[float] = 0.1
 
 
 def delimited_jelly_hint(header: bytes) -> bool:
@@ -55,10 +62,118 @@ def delimited_jelly_hint(header: bytes) -> bool:
 
 
 def frame_iterator(inp: IO[bytes]) -> Generator[jelly.RdfStreamFrame]:
+    profiler = active_profiler()
+    if profiler is not None:
+        yield from _profiled_frame_iterator(inp, profiler)
+        return
     while frame := parse_length_prefixed(jelly.RdfStreamFrame, inp):
         yield frame
 
 
+def _profiled_frame_iterator(
+    inp: IO[bytes], profiler: Profiler
+) -> Generator[jelly.RdfStreamFrame]:
+    timed = TimedIO(inp, profiler, READ_IO)
+    while True:
+        start = perf_counter_ns()
+        frame = parse_length_prefixed(jelly.RdfStreamFrame, timed)
+        profiler.add(READ, perf_counter_ns() - start)
+        if not frame:
+            return
+        yield frame
+
+
+_ReadAheadItem = jelly.RdfStreamFrame | BaseException | None
+
+
+def _put_until_stopped(
+    buffer: queue.Queue[_ReadAheadItem],
+    item: _ReadAheadItem,
+    stopped: threading.Event,
+) -> bool:
+    while not stopped.is_set():
+        try:
+            buffer.put(item, timeout=READ_AHEAD_POLL_INTERVAL)
+        except queue.Full:
+            continue
+        return True
+    return False
+
+
+def _produce_frames(
+    frames: Iterator[jelly.RdfStreamFrame],
+    buffer: queue.Queue[_ReadAheadItem],
+    stopped: threading.Event,
+) -> None:
+    item: _ReadAheadItem = None
+    try:
+        for frame in frames:
+            if not _put_until_stopped(buffer, frame, stopped):
+                return
+    except BaseException as error:  # noqa: BLE001 -- re-raised by the consumer
+        item = error
+    _put_until_stopped(buffer, item, stopped)
+
+
+def read_ahead_frames(
+    frames: Iterator[jelly.RdfStreamFrame], depth: int
+) -> Iterator[jelly.RdfStreamFrame]:
+    """
+    Read and parse frames on a background thread, up to `depth` frames ahead.
+
+    The producer thread consumes `frames` (reading from the input and parsing
+    protobuf messages) into a bounded queue, while the caller decodes
+    the frames already received.
+    Errors raised by the producer are re-raised in the consuming thread.
+
+    Notes:
+        The input behind `frames` must stay open until the returned iterator
+        is exhausted or closed. When the consumer stops early, closing the
+        iterator waits for the producer to finish the frame it is reading,
+        so the input can be closed safely afterwards.
+
+    Args:
+        frames (Iterator[jelly.RdfStreamFrame]): frames to read ahead;
+            must not be consumed by anyone else afterwards
+        depth (int): maximum number of parsed frames waiting in the queue;
+            if not positive, `frames` is returned unchanged
+
+    Returns:
+        Iterator[jelly.RdfStreamFrame]: frames in the original order
+
+    """
+    if depth <= 0:
+        return frames
+    return _read_ahead(frames, depth)
+
+
+def _read_ahead(
+    frames: Iterator[jelly.RdfStreamFrame], depth: int
+) -> Generator[jelly.RdfStreamFrame]:
+    buffer: queue.Queue[_ReadAheadItem] = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+    producer = threading.Thread(
+        target=_produce_frames,
+        args=(frames, buffer, stopped),
+        name="pyjelly-read-ahead",
+        daemon=True,
+    )
+    producer.start()
+    try:
+        while (item := buffer.get()) is not None:
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stopped.set()
+        # Free the queue so a blocked put sees `stopped`, then wait for the
+        # producer to stop reading from the input
+        with suppress(queue.Empty):
+            while True:
+                buffer.get_nowait()
+        producer.join()
+
+
 def get_options_and_frames(
     inp: IO[bytes],
 ) -> tuple[ParserOptions, Iterator[jelly.RdfStreamFrame]]:
@@ -4,9 +4,16 @@ from collections import deque
 from dataclasses import dataclass
 
 from pyjelly.errors import JellyAssertionError, JellyConformanceError
+from pyjelly.memory import utf8_size
 from pyjelly.options import MAX_LOOKUP_SIZE
 
 
+def check_lookup_size(lookup_size: int) -> None:
+    if lookup_size > MAX_LOOKUP_SIZE:
+        msg = f"lookup size cannot be larger than {MAX_LOOKUP_SIZE}"
+        raise JellyAssertionError(msg)
+
+
 @dataclass
 class LookupDecoder:
     """
@@ -25,20 +32,30 @@ class LookupDecoder:
     last_reused_index: int
 
     def __init__(self, *, lookup_size: int) -> None:
-        if lookup_size > MAX_LOOKUP_SIZE:
-            msg = f"lookup size cannot be larger than {MAX_LOOKUP_SIZE}"
-            raise JellyAssertionError(msg)
+        check_lookup_size(lookup_size)
         self.lookup_size = lookup_size
         placeholders = (None,) * lookup_size
         self.data: deque[str | None] = deque(placeholders, maxlen=lookup_size)
         self.last_assigned_index = 0
         self.last_reused_index = 0
+        self.tracks_size = False
+        self.total_size = 0
+
+    def track_size(self) -> None:
+        """Keep a running total of the entries' size from now on."""
+        self.total_size = sum(utf8_size(value) for value in self.data if value)
+        self.tracks_size = True
 
     def assign_entry(self, index: int, value: str) -> None:
         previous_index = self.last_assigned_index
         if index == 0:
             index = previous_index + 1
         assert index > 0
+        if self.tracks_size:
+            previous = self.data[index - 1]
+            if previous:
+                self.total_size -= utf8_size(previous)
+            self.total_size += utf8_size(value)
         self.data[index - 1] = value
         self.last_assigned_index = index
 
@@ -50,6 +67,12 @@ class LookupDecoder:
             raise IndexError(msg)
         return value
 
+    def byte_size(self) -> int:
+        """Return the UTF-8 encoded size of the lookup entries."""
+        if self.tracks_size:
+            return self.total_size
+        return sum(utf8_size(value) for value in self.data if value)
+
     def decode_prefix_term_index(self, index: int) -> str:
         actual_index = index or self.last_reused_index
         if actual_index == 0:
@@ -68,3 +91,56 @@ class LookupDecoder:
             msg = "0 is not a valid datatype term index"
             raise JellyConformanceError(msg)
         return self.at(index)
+
+
+class TrustedLookupDecoder(LookupDecoder):
+    """
+    Lookup decoder for streams from a trusted producer.
+
+    Resolves indices without conformance checks: entries are kept in a list
+    and unassigned or zero indices are not reported.
+
+    Parameters
+    ----------
+    lookup_size
+        Maximum lookup size.
+
+    """
+
+    def __init__(self, *, lookup_size: int) -> None:
+        # The base constructor would also allocate the unused `data` deque
+        check_lookup_size(lookup_size)
+        self.lookup_size = lookup_size
+        self.values: list[str] = [""] * lookup_size
+        self.last_assigned_index = 0
+        self.last_reused_index = 0
+        self.tracks_size = False
+        self.total_size = 0
+
+    def track_size(self) -> None:
+        self.total_size = sum(map(utf8_size, self.values))
+        self.tracks_size = True
+
+    def assign_entry(self, index: int, value: str) -> None:
+        if index == 0:
+            index = self.last_assigned_index + 1
+        values = self.values
+        if self.tracks_size:
+            self.total_size += utf8_size(value) - utf8_size(values[index - 1])
+        values[index - 1] = value
+        self.last_assigned_index = index
+
+    def at(self, index: int) -> str:
+        self.last_reused_index = index
+        return self.values[index - 1]
+
+    def byte_size(self) -> int:
+        if self.tracks_size:
+            return self.total_size
+        return sum(map(utf8_size, self.values))
+
+    def decode_name_term_index(self, index: int) -> str:
+        return self.at(index or self.last_reused_index + 1)
+
+    def decode_datatype_term_index(self, index: int) -> str | None:
+        return self.values[index - 1]
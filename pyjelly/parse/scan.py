@@ -0,0 +1,455 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import IO, Any, ClassVar
+
+from pyjelly import jelly
+from pyjelly.errors import JellyAssertionError, JellyConformanceError
+from pyjelly.parse.decode import ParserOptions
+from pyjelly.parse.ioutils import get_options_and_frames
+from pyjelly.parse.lookup import LookupDecoder
+
+TRIPLE_ONEOFS: Sequence[str] = ("subject", "predicate", "object")
+QUAD_ONEOFS: Sequence[str] = ("subject", "predicate", "object", "graph")
+
+
+@dataclass
+class FrameStatistics:
+    """
+    Row counts of a single frame, grouped by row type.
+
+    Attributes:
+        rows: total number of rows in the frame.
+        options: stream options rows.
+        triples: triple rows.
+        quads: quad rows.
+        graph_starts: graph start rows (not distinct graphs; see
+            `StreamStatistics.graphs`).
+        graph_ends: graph end rows.
+        namespaces: namespace declaration rows.
+        prefix_entries: prefix lookup entry rows.
+        name_entries: name lookup entry rows.
+        datatype_entries: datatype lookup entry rows.
+
+    """
+
+    rows: int = 0
+    options: int = 0
+    triples: int = 0
+    quads: int = 0
+    graph_starts: int = 0
+    graph_ends: int = 0
+    namespaces: int = 0
+    prefix_entries: int = 0
+    name_entries: int = 0
+    datatype_entries: int = 0
+
+    @property
+    def statements(self) -> int:
+        return self.triples + self.quads
+
+    @property
+    def entries(self) -> int:
+        return self.prefix_entries + self.name_entries + self.datatype_entries
+
+    def update(self, other: FrameStatistics) -> None:
+        """Add the counts of another frame to this one."""
+        self.rows += other.rows
+        self.options += other.options
+        self.triples += other.triples
+        self.quads += other.quads
+        self.graph_starts += other.graph_starts
+        self.graph_ends += other.graph_ends
+        self.namespaces += other.namespaces
+        self.prefix_entries += other.prefix_entries
+        self.name_entries += other.name_entries
+        self.datatype_entries += other.datatype_entries
+
+
+@dataclass
+class StreamStatistics:
+    """
+    Statistics of a whole Jelly stream.
+
+    Attributes:
+        options: options of the scanned stream.
+        frames: per-frame row counts, in stream order.
+        totals: row counts summed over all frames.
+        predicates: distinct predicate IRIs, if collected.
+        graphs: distinct graph names of quads and graph starts, if collected,
+            as (term kind, value...) tuples; the default graph counts as one.
+
+    """
+
+    options: ParserOptions
+    frames: list[FrameStatistics] = field(default_factory=list)
+    totals: FrameStatistics = field(default_factory=FrameStatistics)
+    predicates: set[str] | None = None
+    graphs: set[tuple[str, ...]] | None = None
+
+    @property
+    def statements(self) -> int:
+        return self.totals.statements
+
+    @property
+    def graph_starts(self) -> int:
+        return self.totals.graph_starts
+
+    @property
+    def namespaces(self) -> int:
+        return self.totals.namespaces
+
+
+class StreamScanner:
+    """
+    Scan Jelly frames without materializing RDF terms.
+
+    Only the lookup tables are updated; no adapter is involved, so scanning
+    is considerably cheaper than decoding.
+
+    Args:
+        options (ParserOptions): options of the stream to scan.
+        predicates (bool): collect distinct predicate IRIs.
+            Requires resolving IRI lookup references of every term.
+        graphs (bool): collect distinct graph names, from quads in QUADS
+            streams and from graph starts in GRAPHS streams.
+            Requires resolving IRI lookup references of every term.
+        validate (bool): check the stream for conformance while scanning
+            (lookup references, repeated terms, graph boundaries, row types).
+            Requires resolving lookup references of every term.
+
+    """
+
+    _ROW_HANDLER_NAMES: ClassVar[dict[str, str]] = {
+        "options": "scan_options",
+        "triple": "scan_triple",
+        "quad": "scan_quad",
+        "graph_start": "scan_graph_start",
+        "graph_end": "scan_graph_end",
+        "namespace": "scan_namespace_declaration",
+        "prefix": "ingest_prefix_entry",
+        "name": "ingest_name_entry",
+        "datatype": "ingest_datatype_entry",
+    }
+
+    _COUNTER_NAMES: ClassVar[dict[str, str]] = {
+        "options": "options",
+        "triple": "triples",
+        "quad": "quads",
+        "graph_start": "graph_starts",
+        "graph_end": "graph_ends",
+        "namespace": "namespaces",
+        "prefix": "prefix_entries",
+        "name": "name_entries",
+        "datatype": "datatype_entries",
+    }
+
+    def __init__(
+        self,
+        options: ParserOptions,
+        *,
+        predicates: bool = False,
+        graphs: bool = False,
+        validate: bool = False,
+    ) -> None:
+        self.options = options
+        self.validate = validate
+        self.resolve = predicates or graphs or validate
+        self.statistics = StreamStatistics(
+            options=options,
+            predicates=set() if predicates else None,
+            graphs=set() if graphs else None,
+        )
+        lookup_preset = options.lookup_preset
+        self.names = LookupDecoder(lookup_size=lookup_preset.max_names)
+        self.prefixes = LookupDecoder(lookup_size=lookup_preset.max_prefixes)
+        self.datatypes = LookupDecoder(lookup_size=lookup_preset.max_datatypes)
+        self.repeated_terms: dict[str, Any] = dict.fromkeys(QUAD_ONEOFS)
+        self.in_graph = False
+        self.row_handlers: dict[str, Callable[[Any], None]] = {
+            kind: getattr(self, name) for kind, name in self._ROW_HANDLER_NAMES.items()
+        }
+
+    def scan_frames(self, frames: Iterable[jelly.RdfStreamFrame]) -> StreamStatistics:
+        """
+        Scan all frames and return the accumulated statistics.
+
+        Args:
+            frames (Iterable[jelly.RdfStreamFrame]): frames of the stream
+
+        Raises:
+            JellyConformanceError: in validating mode, if the stream
+                does not conform to the specification
+
+        Returns:
+            StreamStatistics: statistics of the scanned frames
+
+        """
+        for frame in frames:
+            self.scan_frame(frame)
+        if self.validate and self.in_graph:
+            msg = "stream ended inside a graph (missing graph end)"
+            raise JellyConformanceError(msg)
+        return self.statistics
+
+    def scan_frame(self, frame: jelly.RdfStreamFrame) -> FrameStatistics:
+        """
+        Scan one frame, updating the lookup tables and row counters.
+
+        Args:
+            frame (jelly.RdfStreamFrame): jelly frame
+
+        Returns:
+            FrameStatistics: row counts of the frame
+
+        """
+        counts = dict.fromkeys(self._COUNTER_NAMES, 0)
+        for index, row_owner in enumerate(frame.rows):
+            kind = row_owner.WhichOneof("row")
+            if kind is None:
+                if self.validate:
+                    raise self.row_error(index, "empty row")
+                continue
+            counts[kind] += 1
+            if kind in ("name", "prefix", "datatype") or self.resolve:
+                try:
+                    self.scan_row(kind, getattr(row_owner, kind))
+                except (
+                    IndexError,
+                    AssertionError,
+                    JellyConformanceError,
+                ) as error:
+                    if not self.validate:
+                        raise
+                    reason = str(error) or type(error).__name__
+                    raise self.row_error(index, reason) from error
+        frame_statistics = FrameStatistics(
+            rows=len(frame.rows),
+            **{self._COUNTER_NAMES[kind]: count for kind, count in counts.items()},
+        )
+        self.statistics.frames.append(frame_statistics)
+        self.statistics.totals.update(frame_statistics)
+        return frame_statistics
+
+    def row_error(self, row_index: int, reason: str) -> JellyConformanceError:
+        frame_index = len(self.statistics.frames)
+        msg = f"frame {frame_index}, row {row_index}: {reason}"
+        return JellyConformanceError(msg)
+
+    def scan_row(self, kind: str, row: Any) -> None:
+        """
+        Process one row of the given kind.
+
+        Args:
+            kind (str): name of the row oneof field, e.g. "triple"
+            row (Any): protobuf row message
+
+        """
+        self.row_handlers[kind](row)
+
+    def ingest_prefix_entry(self, entry: jelly.RdfPrefixEntry) -> None:
+        self.prefixes.assign_entry(index=entry.id, value=entry.value)
+
+    def ingest_name_entry(self, entry: jelly.RdfNameEntry) -> None:
+        self.names.assign_entry(index=entry.id, value=entry.value)
+
+    def ingest_datatype_entry(self, entry: jelly.RdfDatatypeEntry) -> None:
+        self.datatypes.assign_entry(index=entry.id, value=entry.value)
+
+    def scan_options(self, options: jelly.RdfStreamOptions) -> None:
+        if self.validate:
+            self.check_options(options)
+
+    def scan_triple(self, triple: jelly.RdfTriple) -> None:
+        self.check_triple_allowed()
+        self.scan_statement(triple, TRIPLE_ONEOFS)
+
+    def scan_quad(self, quad: jelly.RdfQuad) -> None:
+        self.check_physical_type(jelly.PHYSICAL_STREAM_TYPE_QUADS, "quad")
+        self.scan_statement(quad, QUAD_ONEOFS)
+
+    def scan_graph_start(self, graph_start: jelly.RdfGraphStart) -> None:
+        self.check_physical_type(jelly.PHYSICAL_STREAM_TYPE_GRAPHS, "graph start")
+        if self.validate and self.in_graph:
+            msg = "graph started before the previous graph ended"
+            raise JellyConformanceError(msg)
+        self.in_graph = True
+        field_name = graph_start.WhichOneof("graph")
+        if field_name is None:
+            if self.validate:
+                msg = "graph start without a graph"
+                raise JellyConformanceError(msg)
+            return
+        term = self.resolve_term(getattr(graph_start, field_name))
+        self.collect_graph(field_name, term)
+
+    def scan_graph_end(self, _: jelly.RdfGraphEnd) -> None:
+        self.check_physical_type(jelly.PHYSICAL_STREAM_TYPE_GRAPHS, "graph end")
+        if self.validate and not self.in_graph:
+            msg = "graph end without a graph start"
+            raise JellyConformanceError(msg)
+        self.in_graph = False
+
+    def scan_namespace_declaration(
+        self, declaration: jelly.RdfNamespaceDeclaration
+    ) -> None:
+        self.resolve_iri(declaration.value)
+
+    def check_physical_type(
+        self, physical_type: jelly.PhysicalStreamType, feature: str
+    ) -> None:
+        if self.validate and self.options.stream_types.physical_type != physical_type:
+            physical_type_name = jelly.PhysicalStreamType.Name(
+                self.options.stream_types.physical_type
+            )
+            msg = f"{feature} row is not allowed in a {physical_type_name} stream"
+            raise JellyConformanceError(msg)
+
+    def check_triple_allowed(self) -> None:
+        if not self.validate:
+            return
+        physical_type = self.options.stream_types.physical_type
+        if physical_type == jelly.PHYSICAL_STREAM_TYPE_QUADS:
+            msg = "triple row is not allowed in a PHYSICAL_STREAM_TYPE_QUADS stream"
+            raise JellyConformanceError(msg)
+        if physical_type == jelly.PHYSICAL_STREAM_TYPE_GRAPHS and not self.in_graph:
+            msg = "triple row outside of a graph"
+            raise JellyConformanceError(msg)
+
+    def check_options(self, options: jelly.RdfStreamOptions) -> None:
+        stream_types, lookup_preset, params = self.options
+        if (
+            stream_types.physical_type != options.physical_type
+            or stream_types.logical_type != options.logical_type
+            or params.stream_name != options.stream_name
+            or params.version < options.version
+            or lookup_preset.max_prefixes != options.max_prefix_table_size
+            or lookup_preset.max_datatypes != options.max_datatype_table_size
+            or lookup_preset.max_names != options.max_name_table_size
+        ):
+            msg = "stream options differ from the first options row"
+            raise JellyConformanceError(msg)
+
+    def scan_statement(
+        self,
+        statement: jelly.RdfTriple | jelly.RdfQuad,
+        oneofs: Sequence[str],
+    ) -> None:
+        for oneof in oneofs:
+            field_name = statement.WhichOneof(oneof)
+            if field_name:
+                term = self.resolve_term(getattr(statement, field_name))
+                self.repeated_terms[oneof] = term
+                if oneof == "graph":
+                    self.collect_graph(field_name, term)
+            else:
+                term = self.repeated_terms[oneof]
+                if term is None:
+                    msg = f"missing repeated term {oneof}"
+                    raise JellyConformanceError(msg)
+            if (
+                oneof == "predicate"
+                and self.statistics.predicates is not None
+                and isinstance(term, str)
+            ):
+                self.statistics.predicates.add(term)
+
+    def collect_graph(self, field_name: str, term: Any) -> None:
+        """
+        Record a graph name in the statistics, if graphs are collected.
+
+        Args:
+            field_name (str): name of the graph oneof field, e.g. "g_iri"
+            term (Any): the term as returned by `resolve_term`
+
+        """
+        graphs = self.statistics.graphs
+        if graphs is None:
+            return
+        if isinstance(term, str):
+            graphs.add(("iri", term))
+        elif isinstance(term, jelly.RdfLiteral):
+            datatype: str | None = None
+            if self.datatypes.lookup_size and term.HasField("datatype"):
+                datatype = self.datatypes.decode_datatype_term_index(term.datatype)
+            graphs.add(("literal", term.lex, term.langtag, datatype or ""))
+        elif field_name.endswith("bnode"):
+            graphs.add(("bnode", term[0]))
+        else:
+            graphs.add(("default",))
+
+    def resolve_term(self, term: Any) -> Any:
+        """
+        Resolve lookup references of a term.
+
+        Returns:
+            Any: full IRI string for IRIs, a non-string marker otherwise
+
+        """
+        if isinstance(term, jelly.RdfIri):
+            return self.resolve_iri(term)
+        if isinstance(term, jelly.RdfLiteral):
+            if self.datatypes.lookup_size and term.HasField("datatype"):
+                self.datatypes.decode_datatype_term_index(term.datatype)
+            return term
+        if isinstance(term, jelly.RdfTriple):
+            for oneof in TRIPLE_ONEOFS:
+                field_name = term.WhichOneof(oneof)
+                if not field_name:
+                    msg = "repeated terms are not allowed in quoted triples"
+                    raise JellyConformanceError(msg)
+                self.resolve_term(getattr(term, field_name))
+            return term
+        return (term,)
+
+    def resolve_iri(self, iri: jelly.RdfIri) -> str:
+        name = self.names.decode_name_term_index(iri.name_id)
+        prefix = self.prefixes.decode_prefix_term_index(iri.prefix_id)
+        return prefix + name
+
+
+def scan_stream(
+    inp: IO[bytes], *, predicates: bool = False, graphs: bool = False
+) -> StreamStatistics:
+    """
+    Collect statistics of a Jelly stream without decoding RDF terms.
+
+    Args:
+        inp (IO[bytes]): input jelly buffered binary stream
+        predicates (bool): also collect distinct predicate IRIs
+        graphs (bool): also collect distinct graph names
+
+    Returns:
+        StreamStatistics: per-frame and total row counts
+
+    """
+    options, frames = get_options_and_frames(inp)
+    scanner = StreamScanner(options, predicates=predicates, graphs=graphs)
+    return scanner.scan_frames(frames)
+
+
+def validate_stream(inp: IO[bytes], *, predicates: bool = False) -> StreamStatistics:
+    """
+    Check that a Jelly stream conforms to the specification, without decoding terms.
+
+    Args:
+        inp (IO[bytes]): input jelly buffered binary stream
+        predicates (bool): also collect distinct predicate IRIs
+
+    Raises:
+        JellyConformanceError: if the stream is not conformant;
+            the message points to the offending frame and row,
+            or to the stream options
+
+    Returns:
+        StreamStatistics: per-frame and total row counts
+
+    """
+    try:
+        options, frames = get_options_and_frames(inp)
+        scanner = StreamScanner(options, predicates=predicates, validate=True)
+    except JellyAssertionError as error:
+        msg = f"invalid stream options: {error}"
+        raise JellyConformanceError(msg) from error
+    return scanner.scan_frames(frames)
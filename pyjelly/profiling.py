@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import sys
+from time import perf_counter_ns
+from types import TracebackType
+from typing import IO, Any, Final, TextIO
+from typing_extensions import Self
+
+ENCODE: Final = "encode"
+ENCODE_LOOKUP: Final = "encode.lookup"
+ENCODE_ROWS: Final = "encode.rows"
+FRAME: Final = "frame"
+WRITE: Final = "write"
+WRITE_IO: Final = "write.io"
+READ: Final = "read"
+READ_IO: Final = "read.io"
+DECODE: Final = "decode"
+DECODE_LOOKUP: Final = "decode.lookup"
+
+_active: Profiler | None = None
+
+
+def active_profiler() -> Profiler | None:
+    """Return the profiler of the innermost active `with Profiler()` block."""
+    return _active
+
+
+class Profiler:
+    """
+    Accumulate time and call counts per serialization/parsing phase.
+
+    Notes:
+        Use as a context manager. Streams, term encoders and decoders created
+        inside the block are measured for their whole lifetime; frame
+        assembly and frame reads/writes are measured while the block is
+        active. Outside of it, instrumented code only checks for `None`.
+
+        Phases are nested by name: `encode.lookup` (lookup table updates)
+        and `encode.rows` (statement row construction) are part of `encode`
+        (encoding one statement), `write.io`/`read.io` are the I/O part of
+        `write`/`read` (the rest being protobuf (de)serialization) and
+        `decode.lookup` is part of `decode` (decoding one row).
+        `frame` is the assembly of rows into a stream frame.
+
+    >>> with Profiler() as profiler:
+    ...     profiler.add("encode", 1500)
+    ...     profiler.add("encode", 500)
+    >>> profiler.totals()
+    {'encode': (2000, 2)}
+
+    """
+
+    def __init__(self) -> None:
+        self.times: dict[str, int] = {}
+        self.calls: dict[str, int] = {}
+        self._previous: Profiler | None = None
+
+    def __enter__(self) -> Self:
+        global _active
+        self._previous, _active = _active, self
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        global _active
+        _active, self._previous = self._previous, None
+
+    def add(self, phase: str, elapsed_ns: int) -> None:
+        """
+        Record one call of a phase.
+
+        Args:
+            phase (str): phase name
+            elapsed_ns (int): duration of the call in nanoseconds
+
+        """
+        self.times[phase] = self.times.get(phase, 0) + elapsed_ns
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+
+    def totals(self) -> dict[str, tuple[int, int]]:
+        """
+        Return cumulative time and call count per phase.
+
+        Returns:
+            dict[str, tuple[int, int]]: phase name to (nanoseconds, calls)
+
+        """
+        return {phase: (self.times[phase], self.calls[phase]) for phase in self.times}
+
+    def reset(self) -> None:
+        self.times.clear()
+        self.calls.clear()
+
+    def report(self, file: TextIO | None = None) -> None:
+        """
+        Print a table with the time breakdown per phase.
+
+        Notes:
+            Nested phases are indented under their parent; the share column
+            is relative to the sum of top-level phases.
+
+        Args:
+            file (TextIO | None): output, defaults to stdout
+
+        """
+        out = sys.stdout if file is None else file
+        top_level = sum(t for phase, t in self.times.items() if "." not in phase)
+        print(
+            f"{'phase':<16} {'total ms':>10} {'calls':>10} {'ns/call':>9} {'share':>7}",
+            file=out,
+        )
+        for phase in sorted(self.times):
+            elapsed, calls = self.times[phase], self.calls[phase]
+            name = f"  {phase}" if "." in phase else phase
+            share = elapsed / top_level if top_level else 0.0
+            print(
+                f"{name:<16} {elapsed / 1e6:>10.1f} {calls:>10} "
+                f"{elapsed // calls:>9} {share:>7.1%}",
+                file=out,
+            )
+
+
+class TimedIO:
+    """
+    Binary stream wrapper recording the time spent in `read`/`write`.
+
+    Args:
+        inner (IO[bytes]): wrapped stream
+        profiler (Profiler): profiler to record to
+        phase (str): phase name of the recorded calls
+
+    """
+
+    def __init__(self, inner: IO[bytes], profiler: Profiler, phase: str) -> None:
+        self.inner = inner
+        self.profiler = profiler
+        self.phase = phase
+
+    def read(self, size: int = -1) -> bytes:
+        start = perf_counter_ns()
+        data = self.inner.read(size)
+        self.profiler.add(self.phase, perf_counter_ns() - start)
+        return data
+
+    def write(self, data: bytes) -> int:
+        start = perf_counter_ns()
+        written = self.inner.write(data)
+        self.profiler.add(self.phase, perf_counter_ns() - start)
+        return written
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.inner, name)
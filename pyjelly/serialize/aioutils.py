@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import asyncio
+import io
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+)
+from typing import TypeVar
+
+from pyjelly import jelly
+from pyjelly.serialize.ioutils import write_delimited
+from pyjelly.serialize.streams import QuadStream, Stream, TripleStream
+
+T = TypeVar("T")
+
+
+async def prepend_async(first: T, rest: AsyncIterator[T]) -> AsyncGenerator[T]:
+    """Yield `first`, then everything from `rest`."""
+    yield first
+    async for item in rest:
+        yield item
+
+
+async def write_delimited_async(
+    frame: jelly.RdfStreamFrame, writer: asyncio.StreamWriter
+) -> None:
+    """
+    Write one length-prefixed frame and wait until the writer is drained.
+
+    Awaiting `drain()` after every frame lets a slow consumer apply backpressure.
+
+    Args:
+        frame (jelly.RdfStreamFrame): frame to write
+        writer (asyncio.StreamWriter): output stream writer
+
+    """
+    buffer = io.BytesIO()
+    write_delimited(frame, buffer)
+    writer.write(buffer.getvalue())
+    await writer.drain()
+
+
+async def write_frames_async(
+    frames: Iterable[jelly.RdfStreamFrame],
+    writer: asyncio.StreamWriter,
+    *,
+    offload: bool = False,
+) -> None:
+    """
+    Write frames produced by a (blocking) frame generator.
+
+    Args:
+        frames (Iterable[jelly.RdfStreamFrame]): frames to write
+        writer (asyncio.StreamWriter): output stream writer
+        offload (bool): produce all frames in a worker thread first,
+            so encoding does not block the event loop
+
+    """
+    if offload:
+        frames = await asyncio.to_thread(list, frames)
+    for frame in frames:
+        await write_delimited_async(frame, writer)
+
+
+def encode_statements(
+    stream: Stream, statements: Iterable[Iterable[object]]
+) -> list[jelly.RdfStreamFrame]:
+    """
+    Encode a batch of statements, returning the frames that became ready.
+
+    Args:
+        stream (Stream): triple or quad stream to encode with
+        statements (Iterable[Iterable[object]]): statements to encode
+
+    Returns:
+        list[jelly.RdfStreamFrame]: finished frames (possibly none)
+
+    """
+    encode: Callable[[Iterable[object]], jelly.RdfStreamFrame | None]
+    if isinstance(stream, QuadStream):
+        encode = stream.quad
+    elif isinstance(stream, TripleStream):
+        encode = stream.triple
+    else:
+        msg = f"invalid stream implementation {stream}"
+        raise TypeError(msg)
+    return [frame for statement in statements if (frame := encode(statement))]
+
+
+async def write_statements_async(
+    stream: Stream,
+    statements: AsyncIterable[Iterable[object]],
+    writer: asyncio.StreamWriter,
+    *,
+    offload: bool = False,
+    batch_size: int | None = None,
+) -> None:
+    """
+    Encode statements from an async iterator and write them as delimited frames.
+
+    Statements are collected into batches, each batch is encoded at once
+    and the resulting frames are written one by one.
+
+    Args:
+        stream (Stream): triple or quad stream to encode with
+        statements (AsyncIterable[Iterable[object]]): statements to serialize
+        writer (asyncio.StreamWriter): output stream writer
+        offload (bool): encode batches in a worker thread
+            to avoid blocking the event loop
+        batch_size (int | None): number of statements per batch,
+            defaults to the frame size of the stream
+
+    """
+    batch_size = batch_size or stream.options.frame_size
+    stream.enroll()
+    batch: list[Iterable[object]] = []
+    async for statement in statements:
+        batch.append(statement)
+        if len(batch) >= batch_size:
+            await _write_batch(stream, batch, writer, offload=offload)
+            batch = []
+    if batch:
+        await _write_batch(stream, batch, writer, offload=offload)
+    if frame := stream.flow.to_stream_frame():
+        await write_delimited_async(frame, writer)
+
+
+async def _write_batch(
+    stream: Stream,
+    batch: list[Iterable[object]],
+    writer: asyncio.StreamWriter,
+    *,
+    offload: bool,
+) -> None:
+    if offload:
+        frames = await asyncio.to_thread(encode_statements, stream, batch)
+    else:
+        frames = encode_statements(stream, batch)
+    for frame in frames:
+        await write_delimited_async(frame, writer)
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 from collections.abc import Iterable, Iterator, Sequence
 from enum import IntEnum
+from time import perf_counter_ns
 from typing import TypeAlias, TypeVar
 
 from mypy_extensions import mypyc_attr
 
 from pyjelly import jelly, options
 from pyjelly.errors import JellyConformanceError
+from pyjelly.profiling import ENCODE_LOOKUP, ENCODE_ROWS, active_profiler
 from pyjelly.serialize.lookup import LookupEncoder
 
 
@@ -52,6 +54,20 @@ class TermEncoder:
         self.names = LookupEncoder(lookup_size=lookup_preset.max_names)
         self.prefixes = LookupEncoder(lookup_size=lookup_preset.max_prefixes)
         self.datatypes = LookupEncoder(lookup_size=lookup_preset.max_datatypes)
+        self.profiler = active_profiler()
+
+    def track_lookup_sizes(self) -> None:
+        """Keep running sizes of the lookup tables, for memory accounting."""
+        for lookup in (self.names, self.prefixes, self.datatypes):
+            lookup.lookup.track_size()
+
+    def lookup_byte_size(self) -> int:
+        """Return the UTF-8 encoded size of all lookup tables."""
+        return (
+            self.names.byte_size()
+            + self.prefixes.byte_size()
+            + self.datatypes.byte_size()
+        )
 
     def encode_iri_indices(self, iri_string: str) -> tuple[Rows, int, int]:
         """
@@ -66,13 +82,37 @@ class TermEncoder:
 
         """
         prefix, name = split_iri(iri_string)
+        return self.encode_split_iri_indices(prefix, name)
+
+    def encode_split_iri_indices(self, prefix: str, name: str) -> tuple[Rows, int, int]:
+        """
+        Encode lookup indices for IRI already split into prefix and name.
+
+        Notes:
+            If the prefix table is disabled, the whole IRI is used as the name.
+
+        Args:
+            prefix (str): iri's prefix.
+            name (str): iri's name.
+
+        Returns:
+            tuple[Rows, int, int]: additional rows (if any) and
+                indices in prefix and name tables.
+
+        """
+        profiler = self.profiler
+        start = perf_counter_ns() if profiler is not None else 0
         if self.prefixes.lookup.max_size:
             prefix_entry_index = self.prefixes.encode_entry_index(prefix)
         else:
-            name = iri_string
+            name = prefix + name
             prefix_entry_index = None
 
         name_entry_index = self.names.encode_entry_index(name)
+        prefix_index = self.prefixes.encode_prefix_term_index(prefix)
+        name_index = self.names.encode_name_term_index(name)
+        if profiler is not None:
+            profiler.add(ENCODE_LOOKUP, perf_counter_ns() - start)
         term_rows = []
 
         if prefix_entry_index is not None:
@@ -82,9 +122,6 @@ class TermEncoder:
         if name_entry_index is not None:
             name_entry = jelly.RdfNameEntry(id=name_entry_index, value=name)
             term_rows.append(jelly.RdfStreamRow(name=name_entry))
-
-        prefix_index = self.prefixes.encode_prefix_term_index(prefix)
-        name_index = self.names.encode_name_term_index(name)
         return term_rows, prefix_index, name_index
 
     def encode_iri(self, iri_string: str, iri: jelly.RdfIri) -> Rows:
@@ -152,14 +189,17 @@ class TermEncoder:
                     "(its size was set to 0)"
                 )
                 raise JellyConformanceError(msg)
+            profiler = self.profiler
+            start = perf_counter_ns() if profiler is not None else 0
             datatype_entry_id = self.datatypes.encode_entry_index(datatype)
+            datatype_id = self.datatypes.encode_datatype_term_index(datatype)
+            if profiler is not None:
+                profiler.add(ENCODE_LOOKUP, perf_counter_ns() - start)
 
             if datatype_entry_id is not None:
                 entry = jelly.RdfDatatypeEntry(id=datatype_entry_id, value=datatype)
                 term_rows = (jelly.RdfStreamRow(datatype=entry),)
 
-            datatype_id = self.datatypes.encode_datatype_term_index(datatype)
-
         literal.lex = lex
         if language:
             literal.langtag = language
@@ -305,8 +345,13 @@ def encode_triple(
     triple = jelly.RdfTriple()
     terms = iter(terms)
     rows = encode_spo(terms, term_encoder, repeated_terms, triple)
-    row = jelly.RdfStreamRow(triple=triple)
-    rows.append(row)
+    profiler = term_encoder.profiler
+    if profiler is None:
+        rows.append(jelly.RdfStreamRow(triple=triple))
+    else:
+        start = perf_counter_ns()
+        rows.append(jelly.RdfStreamRow(triple=triple))
+        profiler.add(ENCODE_ROWS, perf_counter_ns() - start)
     return rows
 
 
@@ -335,8 +380,13 @@ def encode_quad(
         extra_rows = term_encoder.encode_graph(g, quad)
         rows.extend(extra_rows)
         repeated_terms[Slot.graph] = g
-    row = jelly.RdfStreamRow(quad=quad)
-    rows.append(row)
+    profiler = term_encoder.profiler
+    if profiler is None:
+        rows.append(jelly.RdfStreamRow(quad=quad))
+    else:
+        start = perf_counter_ns()
+        rows.append(jelly.RdfStreamRow(quad=quad))
+        profiler.add(ENCODE_ROWS, perf_counter_ns() - start)
     return rows
 
 
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from collections import UserList
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
+from time import perf_counter_ns
 from typing import Any, ClassVar
 from typing_extensions import override
 
 from pyjelly import jelly
+from pyjelly.profiling import FRAME, active_profiler
 
 DEFAULT_FRAME_SIZE = 250
 
@@ -23,6 +25,7 @@ class FrameFlow(UserList[jelly.RdfStreamRow]):
 
     logical_type: jelly.LogicalStreamType
     registry: ClassVar[dict[jelly.LogicalStreamType, type[FrameFlow]]] = {}
+    before_frame: Callable[[], None] | None
 
     def __init__(
         self,
@@ -33,6 +36,8 @@ class FrameFlow(UserList[jelly.RdfStreamRow]):
     ) -> None:
         super().__init__(initlist)
         self.logical_type = logical_type or self.__class__.logical_type
+        # Lets the stream add rows it still buffers before a frame is cut
+        self.before_frame = None
 
     def frame_from_graph(self) -> jelly.RdfStreamFrame | None:
         """
@@ -58,16 +63,23 @@ class FrameFlow(UserList[jelly.RdfStreamRow]):
         Create stream frame from flow content.
 
         Notes:
-            Clears flow content after creating the frame.
+            Calls `before_frame` first, if set, and clears flow content
+            after creating the frame.
 
         Returns:
             jelly.RdfStreamFrame | None: stream frame
 
         """
+        if self.before_frame is not None:
+            self.before_frame()
         if not self:
             return None
+        profiler = active_profiler()
+        start = perf_counter_ns() if profiler is not None else 0
         frame = jelly.RdfStreamFrame(rows=self)
         self.clear()
+        if profiler is not None:
+            profiler.add(FRAME, perf_counter_ns() - start)
         return frame
 
 
@@ -1,13 +1,28 @@
+from time import perf_counter_ns
 from typing import IO
 
 from google.protobuf.proto import serialize_length_prefixed
 
 from pyjelly import jelly
+from pyjelly.profiling import WRITE, WRITE_IO, TimedIO, active_profiler
 
 
 def write_delimited(frame: jelly.RdfStreamFrame, output_stream: IO[bytes]) -> None:
-    serialize_length_prefixed(frame, output_stream)
+    profiler = active_profiler()
+    if profiler is None:
+        serialize_length_prefixed(frame, output_stream)
+        return
+    start = perf_counter_ns()
+    serialize_length_prefixed(frame, TimedIO(output_stream, profiler, WRITE_IO))
+    profiler.add(WRITE, perf_counter_ns() - start)
 
 
 def write_single(frame: jelly.RdfStreamFrame, output_stream: IO[bytes]) -> None:
-    output_stream.write(frame.SerializeToString(deterministic=True))
+    profiler = active_profiler()
+    if profiler is None:
+        output_stream.write(frame.SerializeToString(deterministic=True))
+        return
+    start = perf_counter_ns()
+    data = frame.SerializeToString(deterministic=True)
+    TimedIO(output_stream, profiler, WRITE_IO).write(data)
+    profiler.add(WRITE, perf_counter_ns() - start)
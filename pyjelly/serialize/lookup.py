@@ -6,6 +6,8 @@ from typing import final
 
 from mypy_extensions import mypyc_attr
 
+from pyjelly.memory import utf8_size
+
 
 @mypyc_attr(allow_interpreted_subclasses=True)
 @final
@@ -32,6 +34,19 @@ class Lookup:
         self.data = OrderedDict[str, int]()
         self.max_size = max_size
         self._evicting = False
+        self.tracks_size = False
+        self.total_size = 0
+
+    def track_size(self) -> None:
+        """Keep a running total of the keys' size from now on."""
+        self.total_size = sum(map(utf8_size, self.data))
+        self.tracks_size = True
+
+    def byte_size(self) -> int:
+        """Return the UTF-8 encoded size of the keys."""
+        if self.tracks_size:
+            return self.total_size
+        return sum(map(utf8_size, self.data))
 
     def make_last_to_evict(self, key: str) -> None:
         self.data.move_to_end(key)
@@ -42,12 +57,16 @@ class Lookup:
             raise IndexError(msg)
         assert key not in self.data, f"key {key!r} already present"
         if self._evicting:
-            _, index = self.data.popitem(last=False)
+            evicted, index = self.data.popitem(last=False)
+            if self.tracks_size:
+                self.total_size -= utf8_size(evicted)
             self.data[key] = index
         else:
             index = len(self.data) + 1
             self.data[key] = index
             self._evicting = index == self.max_size
+        if self.tracks_size:
+            self.total_size += utf8_size(key)
         return index
 
     def __repr__(self) -> str:
@@ -105,6 +124,10 @@ class LookupEncoder:
                 return 0
             return index
 
+    def byte_size(self) -> int:
+        """Return the UTF-8 encoded size of the lookup entries."""
+        return self.lookup.byte_size()
+
     def encode_term_index(self, value: str) -> int:
         self.lookup.make_last_to_evict(value)
         current_index = self.lookup.data[value]
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import heapq
+import os
+import pickle
+import tempfile
+from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
+from contextlib import ExitStack
+from itertools import chain, islice
+from typing import IO, Any, Final, TypeVar
+
+DEFAULT_SORT_BUFFER: Final = 100_000
+DEFAULT_GRAPH_BUFFER: Final = 1_000_000
+TRIPLE_ARITY: Final = 3
+
+S = TypeVar("S", bound=Sequence[Any])
+
+
+def graph_subject_predicate_key(statement: Sequence[Any]) -> tuple[str, str, str]:
+    """
+    Return the (graph, subject, predicate) sort key of a triple or quad.
+
+    Terms are compared by their string form, so the key works for the terms
+    of any integration. Triples belong to the default graph and sort first.
+
+    Args:
+        statement (Sequence[Any]): s/p/o triple or s/p/o/g quad
+
+    Returns:
+        tuple[str, str, str]: sort key
+
+    """
+    graph = str(statement[3]) if len(statement) > TRIPLE_ARITY else ""
+    return graph, str(statement[0]), str(statement[1])
+
+
+def _dump(statements: Iterable[Any], file: IO[bytes]) -> None:
+    pickler = pickle.Pickler(file, protocol=pickle.HIGHEST_PROTOCOL)
+    for statement in statements:
+        pickler.dump(statement)
+        # Keep the memo from growing with the run
+        pickler.clear_memo()
+
+
+def _write_run(run: list[S], directory: str | None) -> IO[bytes]:
+    file = tempfile.TemporaryFile(dir=directory)  # noqa: SIM115
+    _dump(run, file)
+    file.seek(0)
+    return file
+
+
+def _read_run(file: IO[bytes], count: int) -> Generator[Any]:
+    # Only reads back runs written by _write_run
+    unpickler = pickle.Unpickler(file)  # noqa: S301
+    for _ in range(count):
+        yield unpickler.load()
+
+
+def _read_segment(file: IO[bytes], offset: int, count: int) -> Generator[Any]:
+    file.seek(offset)
+    yield from _read_run(file, count)
+
+
+def sort_statements(
+    statements: Iterable[S],
+    *,
+    max_in_memory: int = DEFAULT_SORT_BUFFER,
+    key: Callable[[S], Any] = graph_subject_predicate_key,
+    directory: str | None = None,
+) -> Generator[S]:
+    """
+    Sort statements with bounded memory (external merge sort).
+
+    Statements are read in runs of `max_in_memory`, each run is sorted and,
+    unless the whole input fits in one run, spilled to a temporary file.
+    The runs are then merged lazily, holding one statement per run.
+
+    Notes:
+        The default key groups statements by graph, subject and predicate,
+        which maximizes repeated-term elision in the encoder and keeps
+        lookup entries hot. The sort is stable: statements with equal keys
+        keep their input order. Spilled statements must be picklable.
+
+    Args:
+        statements (Iterable[S]): triples or quads to sort
+        max_in_memory (int): maximum number of statements held in memory
+            while building runs. Defaults to DEFAULT_SORT_BUFFER.
+        key (Callable[[S], Any]): sort key.
+            Defaults to graph_subject_predicate_key.
+        directory (str | None): directory for the temporary files,
+            see `tempfile.TemporaryFile`. Defaults to None.
+
+    Raises:
+        ValueError: if `max_in_memory` is not positive
+
+    Yields:
+        S: statements in key order
+
+    """
+    if max_in_memory < 1:
+        msg = f"max_in_memory must be positive, got {max_in_memory}"
+        raise ValueError(msg)
+    iterator = iter(statements)
+    run = sorted(islice(iterator, max_in_memory), key=key)
+    if len(run) < max_in_memory:
+        yield from run
+        return
+    with ExitStack() as stack:
+        runs = []
+        while run:
+            file = stack.enter_context(_write_run(run, directory))
+            runs.append(_read_run(file, len(run)))
+            run = sorted(islice(iterator, max_in_memory), key=key)
+        yield from heapq.merge(*runs, key=key)
+
+
+def group_by_graph(
+    quads: Iterable[Sequence[Any]],
+    *,
+    max_in_memory: int = DEFAULT_GRAPH_BUFFER,
+    directory: str | None = None,
+) -> Generator[tuple[Any, Iterator[tuple[Any, ...]]]]:
+    """
+    Group quads by graph name with bounded memory.
+
+    Quads are buffered per graph as s/p/o triples. Whenever `max_in_memory`
+    triples are buffered, the largest graph buffers are spilled to a temporary
+    file until at most half of the budget is used. Once the input is exhausted,
+    every graph is emitted exactly once, in the order it was first seen.
+
+    Notes:
+        Each graph's triples must be consumed before advancing to the next
+        graph, as all graphs are read back from the same temporary file.
+        Spilled triples must be picklable.
+
+    Args:
+        quads (Iterable[Sequence[Any]]): s/p/o/g quads in any order
+        max_in_memory (int): maximum number of triples held in memory.
+            Defaults to DEFAULT_GRAPH_BUFFER.
+        directory (str | None): directory for the temporary file,
+            see `tempfile.TemporaryFile`. Defaults to None.
+
+    Raises:
+        ValueError: if `max_in_memory` is not positive
+
+    Yields:
+        tuple[Any, Iterator[tuple[Any, ...]]]: graph name and its triples
+
+    """
+    if max_in_memory < 1:
+        msg = f"max_in_memory must be positive, got {max_in_memory}"
+        raise ValueError(msg)
+    buffers: dict[Any, list[tuple[Any, ...]]] = {}
+    # (offset, triple count) of every spilled segment, per graph
+    segments: dict[Any, list[tuple[int, int]]] = {}
+    buffered = 0
+    with ExitStack() as stack:
+        file: IO[bytes] | None = None
+        for quad in quads:
+            graph = quad[3]
+            buffer = buffers.get(graph)
+            if buffer is None:
+                buffer = buffers[graph] = []
+            buffer.append(tuple(quad[:3]))
+            buffered += 1
+            if buffered < max_in_memory:
+                continue
+            if file is None:
+                file = stack.enter_context(tempfile.TemporaryFile(dir=directory))
+            file.seek(0, os.SEEK_END)
+            for graph, buffer in sorted(
+                buffers.items(), key=lambda item: len(item[1]), reverse=True
+            ):
+                if buffered <= max_in_memory // 2:
+                    break
+                segments.setdefault(graph, []).append((file.tell(), len(buffer)))
+                _dump(buffer, file)
+                buffered -= len(buffer)
+                # Keep the key, so the graph keeps its first-seen position
+                buffers[graph] = []
+
+        for graph, buffer in buffers.items():
+            spilled = segments.get(graph, ())
+            if not spilled:
+                yield graph, iter(buffer)
+                continue
+            assert file is not None
+            yield (
+                graph,
+                chain(
+                    chain.from_iterable(
+                        _read_segment(file, offset, count) for offset, count in spilled
+                    ),
+                    buffer,
+                ),
+            )
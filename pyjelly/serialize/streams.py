@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+from abc import ABCMeta, abstractmethod
 from collections.abc import Generator, Iterable
 from dataclasses import dataclass, field
+from time import perf_counter_ns
 from typing import TYPE_CHECKING, ClassVar
 
 from mypy_extensions import mypyc_attr
 
 from pyjelly import jelly
+from pyjelly.memory import MemoryTracker
 from pyjelly.options import LookupPreset, StreamParameters, StreamTypes
+from pyjelly.profiling import ENCODE, active_profiler
 from pyjelly.serialize.encode import (
     Slot,
     TermEncoder,
@@ -25,6 +29,7 @@ from pyjelly.serialize.flows import (
     ManualFrameFlow,
     flow_for_type,
 )
+from pyjelly.serialize.sort import DEFAULT_GRAPH_BUFFER, graph_subject_predicate_key
 
 if TYPE_CHECKING:
     from jelly import LogicalStreamType  # type: ignore[import-not-found]
@@ -37,13 +42,17 @@ class SerializerOptions:
     logical_type: LogicalStreamType = jelly.LOGICAL_STREAM_TYPE_UNSPECIFIED
     params: StreamParameters = field(default_factory=StreamParameters)
     lookup_preset: LookupPreset = field(default_factory=LookupPreset)
+    reorder: bool = False
+    graph_buffer: int = DEFAULT_GRAPH_BUFFER
+    memory: MemoryTracker | None = None
 
 
 @mypyc_attr(allow_interpreted_subclasses=True)
-class Stream:
+class Stream(metaclass=ABCMeta):
     physical_type: ClassVar[jelly.PhysicalStreamType]
     default_delimited_flow_class: ClassVar[type[BoundedFrameFlow]]
     repeated_terms: list[object | None]
+    pending: list[tuple[object, ...]]
 
     def __init__(
         self,
@@ -60,7 +69,19 @@ class Stream:
             flow = self.infer_flow()
         self.flow = flow
         self.repeated_terms = [None] * len(Slot)
+        self.reorder = options.reorder
+        self.pending = []
+        if self.reorder:
+            # Every frame, however it is emitted, includes the buffered tail
+            self.flow.before_frame = self.encode_pending
+        self.elided_terms = 0
         self.enrolled = False
+        self.profiler = active_profiler()
+        self.memory = options.memory
+        if self.memory is not None:
+            encoder.track_lookup_sizes()
+        self.accounted_rows = 0
+        self.accounted_head: jelly.RdfStreamRow | None = None
         self.stream_types = StreamTypes(
             physical_type=self.physical_type,
             logical_type=self.flow.logical_type,
@@ -125,8 +146,81 @@ class Stream:
             value=iri,
             term_encoder=self.encoder,
         )
+        # Keep the declaration after the statements that came before it
+        self.encode_pending()
         self.flow.extend(rows)
 
+    @abstractmethod
+    def encode_statement(self, terms: Iterable[object]) -> None:
+        """Encode one statement and append its rows to the current flow."""
+        raise NotImplementedError
+
+    def buffer_statement(self, terms: Iterable[object]) -> jelly.RdfStreamFrame | None:
+        """
+        Buffer one statement for in-frame reordering.
+
+        Notes:
+            Once a frame's worth of statements (`options.frame_size`) is
+            buffered, they are encoded grouped by graph, subject and predicate,
+            so the encoder can elide more repeated terms. Statements still
+            buffered are encoded whenever the flow emits a frame.
+
+        Args:
+            terms (Iterable[object]): RDF terms of the statement.
+
+        Returns:
+            jelly.RdfStreamFrame | None: stream frame if the buffer was full
+
+        """
+        self.pending.append(tuple(terms))
+        if len(self.pending) < self.options.frame_size:
+            return None
+        self.encode_pending()
+        return self.flow.frame_from_bounds()
+
+    def encode_pending(self) -> None:
+        """Encode all buffered statements, grouped by graph, subject, predicate."""
+        if not self.pending:
+            return
+        pending = sorted(self.pending, key=graph_subject_predicate_key)
+        self.pending = []
+        repeated_terms = self.repeated_terms
+        elided = 0
+        for terms in pending:
+            for slot, term in enumerate(terms):
+                if repeated_terms[slot] == term:
+                    elided += 1
+            self.encode_statement(terms)
+        self.elided_terms += elided
+
+    def account_memory(self) -> None:
+        """
+        Account for the rows buffered in the flow in the memory tracker.
+
+        Notes:
+            Only rows added since the last call are measured; once the flow
+            is emptied (a frame was emitted), the count starts over and
+            the lookup tables are measured again.
+
+        Raises:
+            JellyMemoryError: if the tracker's ceiling is crossed
+
+        """
+        memory = self.memory
+        assert memory is not None
+        rows = self.flow.data
+        start = self.accounted_rows
+        if start > len(rows) or (start and rows[0] is not self.accounted_head):
+            start = 0
+        if start == 0:
+            memory.buffered = 0
+            memory.lookups = self.encoder.lookup_byte_size()
+        for row in rows[start:]:
+            memory.buffered += row.ByteSize()
+        self.accounted_rows = len(rows)
+        self.accounted_head = rows[0] if rows else None
+        memory.check()
+
     @classmethod
     def for_rdflib(cls, options: SerializerOptions | None = None) -> Stream:
         """
@@ -206,13 +300,24 @@ class TripleStream(Stream):
                 flow supports frames slicing and current flow is full
 
         """
+        if self.reorder:
+            return self.buffer_statement(terms)
+        self.encode_statement(terms)
+        return self.flow.frame_from_bounds()
+
+    def encode_statement(self, terms: Iterable[object]) -> None:
+        profiler = self.profiler
+        start = perf_counter_ns() if profiler is not None else 0
         new_rows = encode_triple(
             terms,
             term_encoder=self.encoder,
             repeated_terms=self.repeated_terms,
         )
         self.flow.extend(new_rows)
-        return self.flow.frame_from_bounds()
+        if profiler is not None:
+            profiler.add(ENCODE, perf_counter_ns() - start)
+        if self.memory is not None:
+            self.account_memory()
 
 
 class QuadStream(Stream):
@@ -231,13 +336,24 @@ class QuadStream(Stream):
                 flow supports frames slicing and current flow is full
 
         """
+        if self.reorder:
+            return self.buffer_statement(terms)
+        self.encode_statement(terms)
+        return self.flow.frame_from_bounds()
+
+    def encode_statement(self, terms: Iterable[object]) -> None:
+        profiler = self.profiler
+        start = perf_counter_ns() if profiler is not None else 0
         new_rows = encode_quad(
             terms,
             term_encoder=self.encoder,
             repeated_terms=self.repeated_terms,
         )
         self.flow.extend(new_rows)
-        return self.flow.frame_from_bounds()
+        if profiler is not None:
+            profiler.add(ENCODE, perf_counter_ns() - start)
+        if self.memory is not None:
+            self.account_memory()
 
 
 class GraphStream(TripleStream):
@@ -268,6 +384,8 @@ class GraphStream(TripleStream):
         for triple in graph:
             if frame := self.triple(triple):  # has frame slicing inside
                 yield frame
+        # Buffered triples must not cross the graph end
+        self.encode_pending()
         end_row = jelly.RdfStreamRow(graph_end=jelly.RdfGraphEnd())
         self.flow.append(end_row)
         if frame := self.flow.frame_from_bounds():
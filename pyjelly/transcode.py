@@ -0,0 +1,429 @@
+"""
+Jelly to Jelly transcoding without RDF term objects.
+
+Re-frames a stream, changes its lookup sizes, or switches between delimited
+and non-delimited framing. Rows are decoded only as far as strings: IRIs keep
+the prefix and name they had in the input lookups, and statements are encoded
+again by a `TermEncoder` that takes these strings directly.
+
+Decoded terms are plain Python values:
+
+- IRI: `(prefix, name)` tuple
+- literal: `(lex, language, datatype)` tuple
+- blank node: its label
+- quoted triple: list of its three terms
+- default graph: empty tuple
+"""
+
+from __future__ import annotations
+
+from collections.abc import Generator, Iterable
+from dataclasses import replace
+from time import perf_counter_ns
+from typing import IO, Any, Final
+
+from mypy_extensions import mypyc_attr
+
+from pyjelly import jelly
+from pyjelly.memory import MemoryTracker
+from pyjelly.options import LookupPreset, StreamParameters, StreamTypes
+from pyjelly.parse.decode import Adapter, Decoder, ParserOptions
+from pyjelly.parse.ioutils import get_options_and_frames
+from pyjelly.parse.lookup import LookupDecoder, TrustedLookupDecoder
+from pyjelly.profiling import DECODE_LOOKUP
+from pyjelly.serialize.encode import (
+    HasGraph,
+    Rows,
+    Slot,
+    Statement,
+    TermEncoder,
+    split_iri,
+)
+from pyjelly.serialize.flows import (
+    DEFAULT_FRAME_SIZE,
+    BoundedFrameFlow,
+    FrameFlow,
+    ManualFrameFlow,
+)
+from pyjelly.serialize.ioutils import write_delimited, write_single
+from pyjelly.serialize.streams import SerializerOptions, Stream, stream_for_type
+
+DEFAULT_GRAPH: Final = ()
+IRI_PARTS: Final = 2
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class StringTermEncoder(TermEncoder):
+    """
+    Term encoder for the plain values decoded by `TranscodingDecoder`.
+
+    Notes:
+        IRIs are encoded with the prefix and name they were decoded with.
+        IRIs without a prefix are split again if the output has a prefix
+        table, and joined if it does not.
+
+    """
+
+    def encode_iri_parts(self, prefix: str, name: str, iri: jelly.RdfIri) -> Rows:
+        """
+        Encode iri from its prefix and name.
+
+        Args:
+            prefix (str): iri's prefix, may be empty.
+            name (str): iri's name.
+            iri (jelly.RdfIri): iri to fill
+
+        Returns:
+            Rows: extra rows for prefix and name tables, if any.
+
+        """
+        if not prefix and self.prefixes.lookup.max_size:
+            prefix, name = split_iri(name)
+        term_rows, prefix_index, name_index = self.encode_split_iri_indices(
+            prefix, name
+        )
+        iri.prefix_id = prefix_index
+        iri.name_id = name_index
+        return term_rows
+
+    def encode_spo(self, term: object, slot: Slot, statement: Statement) -> Rows:
+        if isinstance(term, str):
+            self.set_bnode_field(statement, slot, term)
+            return ()
+        if isinstance(term, tuple):
+            if len(term) == IRI_PARTS:
+                prefix, name = term
+                iri = self.get_iri_field(statement, slot)
+                return self.encode_iri_parts(prefix, name, iri)
+            lex, language, datatype = term
+            return self.encode_literal(
+                lex=lex,
+                language=language,
+                datatype=datatype,
+                literal=self.get_literal_field(statement, slot),
+            )
+        if isinstance(term, list):
+            quoted_statement = self.get_triple_field(statement, slot)
+            return self.encode_quoted_triple(term, quoted_statement)
+        return super().encode_spo(term, slot, statement)  # error if not handled
+
+    def encode_graph(self, term: object, statement: HasGraph) -> Rows:
+        if isinstance(term, str):
+            statement.g_bnode = term
+            return ()
+        if isinstance(term, tuple):
+            if not term:
+                return self.encode_default_graph(statement.g_default_graph)
+            if len(term) == IRI_PARTS:
+                prefix, name = term
+                return self.encode_iri_parts(prefix, name, statement.g_iri)
+            lex, language, datatype = term
+            return self.encode_literal(
+                lex=lex,
+                language=language,
+                datatype=datatype,
+                literal=statement.g_literal,
+            )
+        return super().encode_graph(term, statement)  # error if not handled
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class TranscodingAdapter(Adapter):
+    """
+    Adapter that encodes every decoded row into the output stream.
+
+    Notes:
+        Statements and namespace declarations return the output frame if
+        it became full, and None otherwise.
+
+    Args:
+        options (ParserOptions): input stream options
+        stream (Stream): output stream, with a `StringTermEncoder`
+        bnode_prefix (str): prepended to every blank node label
+
+    """
+
+    def __init__(
+        self, options: ParserOptions, stream: Stream, bnode_prefix: str = ""
+    ) -> None:
+        super().__init__(options=options)
+        self.stream = stream
+        self.bnode_prefix = bnode_prefix
+
+    def iri(self, iri: str) -> tuple[str, str]:
+        return ("", iri)
+
+    def default_graph(self) -> tuple[()]:
+        return DEFAULT_GRAPH
+
+    def bnode(self, bnode: str) -> str:
+        return self.bnode_prefix + bnode
+
+    def literal(
+        self,
+        lex: str,
+        language: str | None = None,
+        datatype: str | None = None,
+    ) -> tuple[str, str | None, str | None]:
+        return (lex, language, datatype)
+
+    def quoted_triple(self, terms: Iterable[Any]) -> list[Any]:
+        return list(terms)
+
+    def triple(self, terms: Iterable[Any]) -> jelly.RdfStreamFrame | None:
+        stream = self.stream
+        stream.encode_statement(terms)
+        return stream.flow.frame_from_bounds()
+
+    def quad(self, terms: Iterable[Any]) -> jelly.RdfStreamFrame | None:
+        stream = self.stream
+        stream.encode_statement(terms)
+        return stream.flow.frame_from_bounds()
+
+    def graph_start(self, graph_id: Any) -> None:
+        graph_start = jelly.RdfGraphStart()
+        [*rows] = self.stream.encoder.encode_graph(graph_id, graph_start)
+        rows.append(jelly.RdfStreamRow(graph_start=graph_start))
+        self.stream.flow.extend(rows)
+
+    def graph_end(self) -> None:
+        self.stream.flow.append(jelly.RdfStreamRow(graph_end=jelly.RdfGraphEnd()))
+
+    def namespace_declaration(
+        self, name: str, iri: tuple[str, str]
+    ) -> jelly.RdfStreamFrame | None:
+        encoder = self.stream.encoder
+        assert isinstance(encoder, StringTermEncoder)
+        value = jelly.RdfIri()
+        [*rows] = encoder.encode_iri_parts(*iri, value)
+        declaration = jelly.RdfNamespaceDeclaration(name=name, value=value)
+        rows.append(jelly.RdfStreamRow(namespace=declaration))
+        flow = self.stream.flow
+        flow.extend(rows)
+        return flow.frame_from_bounds()
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class TranscodingDecoder(Decoder):
+    """
+    Decoder that resolves IRIs to their prefix and name strings.
+
+    Args:
+        adapter (TranscodingAdapter): adapter encoding the output
+        trusted (bool): skip conformance checks of the lookups and stream
+            options, see `TrustedDecoder`.
+        memory (MemoryTracker | None): track (and limit) the memory held by
+            the decoder, see `MemoryTracker`.
+
+    """
+
+    def __init__(
+        self,
+        adapter: TranscodingAdapter,
+        *,
+        trusted: bool = False,
+        memory: MemoryTracker | None = None,
+    ) -> None:
+        self.trusted = trusted
+        super().__init__(adapter, memory)
+
+    def make_lookup(self, lookup_size: int) -> LookupDecoder:
+        if self.trusted:
+            return TrustedLookupDecoder(lookup_size=lookup_size)
+        return LookupDecoder(lookup_size=lookup_size)
+
+    def validate_stream_options(self, options: jelly.RdfStreamOptions) -> None:
+        if not self.trusted:
+            super().validate_stream_options(options)
+
+    def decode_iri(self, iri: jelly.RdfIri) -> tuple[str, str]:
+        profiler = self.profiler
+        start = perf_counter_ns() if profiler is not None else 0
+        name = self.names.decode_name_term_index(iri.name_id)
+        prefix = self.prefixes.decode_prefix_term_index(iri.prefix_id)
+        if profiler is not None:
+            profiler.add(DECODE_LOOKUP, perf_counter_ns() - start)
+        return (prefix, name)
+
+
+class Transcoder:
+    """
+    Encode the rows of one or more Jelly streams as one new stream.
+
+    Notes:
+        Streams of flat (or unspecified) logical types are framed again
+        with `frame_size` rows per frame. Streams of graphs or datasets
+        keep one frame per input frame, as the frames carry meaning there.
+        Non-delimited output is always one frame.
+
+    Args:
+        stream_types (StreamTypes): types of the output stream; all input
+            streams must have its physical type
+        params (StreamParameters): parameters of the output stream, which
+            must allow the features the input streams use
+        frame_size (int): rows per output frame of flat streams
+        lookup_preset (LookupPreset | None): output lookup sizes, the
+            default preset if omitted
+
+    """
+
+    def __init__(
+        self,
+        stream_types: StreamTypes,
+        params: StreamParameters,
+        *,
+        frame_size: int = DEFAULT_FRAME_SIZE,
+        lookup_preset: LookupPreset | None = None,
+    ) -> None:
+        if lookup_preset is None:
+            lookup_preset = LookupPreset()
+        logical_type = stream_types.logical_type
+        flow: FrameFlow
+        if not params.delimited:
+            flow = ManualFrameFlow(logical_type=logical_type)
+        elif stream_types.flat or logical_type == jelly.LOGICAL_STREAM_TYPE_UNSPECIFIED:
+            flow = BoundedFrameFlow(logical_type=logical_type, frame_size=frame_size)
+        else:
+            flow = ManualFrameFlow(logical_type=logical_type)
+        self.keep_frames = params.delimited and isinstance(flow, ManualFrameFlow)
+        options = SerializerOptions(
+            flow=flow,
+            frame_size=frame_size,
+            logical_type=logical_type,
+            params=params,
+            lookup_preset=lookup_preset,
+        )
+        stream_class = stream_for_type(stream_types.physical_type)
+        self.stream = stream_class(
+            encoder=StringTermEncoder(lookup_preset=lookup_preset), options=options
+        )
+        self.stream.enroll()
+
+    def transcode(
+        self,
+        frames: Iterable[jelly.RdfStreamFrame],
+        options: ParserOptions,
+        *,
+        trusted: bool = False,
+        bnode_prefix: str = "",
+    ) -> Generator[jelly.RdfStreamFrame]:
+        """
+        Transcode the frames of one input stream.
+
+        Args:
+            frames (Iterable[jelly.RdfStreamFrame]): frames of the stream
+            options (ParserOptions): options of the input stream
+            trusted (bool): skip conformance checks for input from a trusted
+                producer, see `TrustedDecoder`.
+            bnode_prefix (str): prepended to the blank node labels of this
+                stream, to keep them apart from those of other streams
+
+        Raises:
+            ValueError: if the physical type of the input is different
+
+        Yields:
+            jelly.RdfStreamFrame: output frames that are complete
+
+        """
+        physical_type = options.stream_types.physical_type
+        if physical_type != self.stream.stream_types.physical_type:
+            msg = (
+                "cannot transcode a stream of physical type "
+                f"{jelly.PhysicalStreamType.Name(physical_type)} into "
+                f"{jelly.PhysicalStreamType.Name(self.stream.physical_type)}"
+            )
+            raise ValueError(msg)
+        decoder = TranscodingDecoder(
+            TranscodingAdapter(options, self.stream, bnode_prefix), trusted=trusted
+        )
+        flow = self.stream.flow
+        for frame in frames:
+            for output in decoder.iter_rows(frame):
+                if output is not None:
+                    yield output
+            if self.keep_frames and (output := flow.to_stream_frame()):
+                yield output
+
+    def finish(self) -> jelly.RdfStreamFrame | None:
+        """
+        Return the last output frame.
+
+        Returns:
+            jelly.RdfStreamFrame | None: frame with the remaining rows, if any
+
+        """
+        return self.stream.flow.to_stream_frame()
+
+
+def transcode_frames(  # noqa: PLR0913
+    frames: Iterable[jelly.RdfStreamFrame],
+    options: ParserOptions,
+    *,
+    frame_size: int = DEFAULT_FRAME_SIZE,
+    lookup_preset: LookupPreset | None = None,
+    delimited: bool = True,
+    trusted: bool = False,
+) -> Generator[jelly.RdfStreamFrame]:
+    """
+    Transcode the frames of a Jelly stream, see `Transcoder`.
+
+    Args:
+        frames (Iterable[jelly.RdfStreamFrame]): frames of the input stream
+        options (ParserOptions): options of the input stream
+        frame_size (int): rows per output frame of flat streams
+        lookup_preset (LookupPreset | None): output lookup sizes, the ones
+            of the input if omitted
+        delimited (bool): produce frames of a delimited stream, or a
+            single frame of a non-delimited one
+        trusted (bool): skip conformance checks for input from a trusted
+            producer, see `TrustedDecoder`.
+
+    Yields:
+        jelly.RdfStreamFrame: output frames
+
+    """
+    transcoder = Transcoder(
+        options.stream_types,
+        replace(options.params, delimited=delimited),
+        frame_size=frame_size,
+        lookup_preset=lookup_preset or options.lookup_preset,
+    )
+    yield from transcoder.transcode(frames, options, trusted=trusted)
+    if frame := transcoder.finish():
+        yield frame
+
+
+def transcode(  # noqa: PLR0913
+    inp: IO[bytes],
+    output: IO[bytes],
+    *,
+    frame_size: int = DEFAULT_FRAME_SIZE,
+    lookup_preset: LookupPreset | None = None,
+    delimited: bool = True,
+    trusted: bool = False,
+) -> None:
+    """
+    Re-frame a Jelly stream and write it to a binary output.
+
+    Args:
+        inp (IO[bytes]): Jelly input, delimited or not
+        output (IO[bytes]): binary output
+        frame_size (int): rows per output frame of flat streams
+        lookup_preset (LookupPreset | None): output lookup sizes, the ones
+            of the input if omitted
+        delimited (bool): write a delimited stream, or a single frame
+        trusted (bool): skip conformance checks for input from a trusted
+            producer, see `TrustedDecoder`.
+
+    """
+    options, frames = get_options_and_frames(inp)
+    write = write_delimited if delimited else write_single
+    for frame in transcode_frames(
+        frames,
+        options,
+        frame_size=frame_size,
+        lookup_preset=lookup_preset,
+        delimited=delimited,
+        trusted=trusted,
+    ):
+        write(frame, output)
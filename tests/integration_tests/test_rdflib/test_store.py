@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from array import array
+from pathlib import Path
+
+import pytest
+import rdflib
+from rdflib import XSD, BNode, Dataset, Graph, Literal, Namespace, URIRef
+from rdflib.graph import DATASET_DEFAULT_GRAPH_ID
+
+from pyjelly.errors import JellyNotImplementedError
+from pyjelly.integrations.generic import generic_sink
+from pyjelly.integrations.generic.serialize import flat_stream_to_file
+from pyjelly.integrations.rdflib.store import (
+    INDEX_SUFFIX,
+    INDEX_TYPECODE,
+    JellyStore,
+    _build_index,
+)
+from pyjelly.options import StreamParameters
+from pyjelly.serialize.streams import SerializerOptions
+
+EX = Namespace("http://example.org/")
+
+
+@pytest.fixture
+def graph_file(tmp_path: Path) -> tuple[Graph, Path]:
+    graph = Graph()
+    graph.bind("ex", EX)
+    blank = BNode()
+    for i in range(30):
+        graph.add((EX[f"s{i % 7}"], EX[f"p{i % 3}"], Literal(i)))
+    graph.add((blank, EX.p0, Literal("chat", lang="fr")))
+    graph.add((EX.s0, EX.knows, blank))
+    path = tmp_path / "graph.jelly"
+    options = SerializerOptions(params=StreamParameters(namespace_declarations=True))
+    graph.serialize(path.as_posix(), format="jelly", options=options)
+    return graph, path
+
+
+@pytest.fixture
+def dataset_file(tmp_path: Path) -> tuple[Dataset, Path]:
+    dataset = Dataset()
+    for i in range(20):
+        dataset.graph(EX[f"g{i % 3}"]).add((EX[f"s{i % 4}"], EX.p, Literal(i)))
+    dataset.add((EX.s, EX.p, EX.o))
+    path = tmp_path / "dataset.jelly"
+    dataset.serialize(path.as_posix(), format="jelly")
+    return dataset, path
+
+
+def test_store_answers_triple_patterns(graph_file: tuple[Graph, Path]) -> None:
+    graph, path = graph_file
+    store_graph = Graph(store=JellyStore(path.as_posix()))
+    assert len(store_graph) == len(graph)
+    assert set(store_graph) == set(graph)
+    patterns = [
+        (EX.s3, None, None),
+        (None, EX.p1, None),
+        (None, None, Literal(4)),
+        (EX.s1, EX.p1, None),
+        (None, EX.p0, Literal("chat", lang="fr")),
+        (EX.s0, EX.knows, None),
+        (EX.missing, None, None),
+    ]
+    for pattern in patterns:
+        assert set(store_graph.triples(pattern)) == set(graph.triples(pattern))
+    assert dict(store_graph.namespaces())["ex"] == URIRef(EX)
+
+
+def test_store_answers_sparql(graph_file: tuple[Graph, Path]) -> None:
+    graph, path = graph_file
+    store_graph = Graph(store=JellyStore(path.as_posix()))
+    query = "SELECT ?s ?o WHERE { ?s <http://example.org/p2> ?o }"
+    assert set(store_graph.query(query)) == set(graph.query(query))
+
+
+def test_store_contexts_and_quads(dataset_file: tuple[Dataset, Path]) -> None:
+    dataset, path = dataset_file
+    store = JellyStore(path.as_posix())
+    store_dataset = Dataset(store=store)
+    assert set(store_dataset.quads()) == set(dataset.quads())
+    assert {g.identifier for g in store.contexts()} == {
+        g.identifier for g in dataset.graphs()
+    }
+    named = store_dataset.graph(EX.g1)
+    assert set(named) == set(dataset.graph(EX.g1))
+    assert len(named) == len(dataset.graph(EX.g1))
+    assert set(store_dataset.graph(DATASET_DEFAULT_GRAPH_ID)) == {(EX.s, EX.p, EX.o)}
+    assert len(store_dataset.graph(EX.unknown)) == 0
+    assert set(store.quads((None, None, Literal(5), None))) == {
+        (EX.s1, EX.p, Literal(5), EX.g2)
+    }
+
+
+def test_store_persists_index(
+    graph_file: tuple[Graph, Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    graph, path = graph_file
+    JellyStore(path.as_posix(), persist=True)
+    assert path.with_name(path.name + INDEX_SUFFIX).exists()
+
+    def fail_decode(*_: object) -> None:
+        msg = "decoded again"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(JellyStore, "_decode", fail_decode)
+    reloaded = Graph(store=JellyStore(path.as_posix(), persist=True))
+    assert set(reloaded) == set(graph)
+    for pattern in [(EX.s3, None, None), (None, EX.p1, Literal(4))]:
+        assert set(reloaded.triples(pattern)) == set(graph.triples(pattern))
+    assert dict(reloaded.namespaces())["ex"] == URIRef(EX)
+
+    # A changed source file invalidates the index
+    path.write_bytes(path.read_bytes() + b"\0")
+    with pytest.raises(AssertionError, match="decoded again"):
+        JellyStore(path.as_posix(), persist=True)
+
+
+@pytest.mark.parametrize("ids", [[], [0], [3, 1, 3, 0, 1, 3], [5, 5, 2, 7, 2]])
+def test_build_index_groups_rows_by_term(ids: list[int]) -> None:
+    order, bounds = _build_index(array(INDEX_TYPECODE, ids))
+    assert list(order) == sorted(range(len(ids)), key=ids.__getitem__)
+    assert list(bounds) == sorted(set(ids))
+    for term_id, (start, stop) in bounds.items():
+        assert [ids[row] for row in order[start:stop]] == [term_id] * ids.count(term_id)
+
+
+def test_store_is_read_only(graph_file: tuple[Graph, Path]) -> None:
+    _, path = graph_file
+    store_graph = Graph(store=JellyStore(path.as_posix()))
+    with pytest.raises(TypeError, match="read-only"):
+        store_graph.add((EX.s, EX.p, EX.o))
+    with pytest.raises(TypeError, match="read-only"):
+        store_graph.remove((None, None, None))
+
+
+def write_generic(path: Path, statements: list[generic_sink.Triple]) -> None:
+    options = SerializerOptions(params=StreamParameters(rdf_star=True))
+    with path.open("wb") as out:
+        flat_stream_to_file((s for s in statements), out, options)
+
+
+def test_store_finds_normalized_literals(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(rdflib, "NORMALIZE_LITERALS", True)
+    path = tmp_path / "literals.jelly"
+    subject = generic_sink.IRI(str(EX.s))
+    predicate = generic_sink.IRI(str(EX.p))
+    write_generic(
+        path,
+        [
+            generic_sink.Triple(
+                subject,
+                predicate,
+                generic_sink.Literal("01", datatype=str(XSD.integer)),
+            ),
+            generic_sink.Triple(subject, predicate, generic_sink.Literal("x")),
+        ],
+    )
+    store = JellyStore(path.as_posix())
+    store_graph = Graph(store=store)
+    assert set(store_graph.subjects(EX.p, Literal("y"))) == set()
+    # Missed lookups do not turn the stored literals into rdflib terms
+    assert not any(isinstance(term, Literal) for term in store._terms.values())
+    assert set(store_graph.subjects(EX.p, Literal(1))) == {EX.s}
+    assert set(store_graph.subjects(EX.p, Literal("x"))) == {EX.s}
+
+
+def test_store_rejects_quoted_triples(tmp_path: Path) -> None:
+    path = tmp_path / "star.jelly"
+    node = generic_sink.IRI(str(EX.s))
+    quoted = generic_sink.Triple(node, node, node)
+    write_generic(path, [generic_sink.Triple(quoted, node, node)])
+    with pytest.raises(JellyNotImplementedError, match="quoted triples"):
+        JellyStore(path.as_posix())
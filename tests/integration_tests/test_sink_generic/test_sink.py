@@ -1,15 +1,32 @@
+import io
+import itertools
+import pickle
 import unittest
 from pathlib import Path
 
 import pytest
+from rdflib import Graph, URIRef
 
+from pyjelly import jelly
 from pyjelly.integrations.generic.generic_sink import (
     IRI,
     BlankNode,
+    DefaultGraph,
     GenericStatementSink,
+    GraphName,
+    LazyStatementSink,
     Literal,
+    Node,
+    Prefix,
+    Quad,
+    TermFactory,
     Triple,
+    graph_of,
 )
+from pyjelly.integrations.generic.parse import parse_jelly_to_graph
+from pyjelly.integrations.generic.serialize import grouped_stream_to_file
+from pyjelly.options import StreamParameters
+from pyjelly.serialize.streams import SerializerOptions
 
 
 class TestGenericStatementSink(unittest.TestCase):
@@ -359,3 +376,232 @@ def test_parse_serialize() -> None:
     assert len(new_sink) == len(sink)
     for s_in, s_out in zip(sink.store, new_sink.store, strict=False):
         assert repr(s_in) == repr(s_out)
+
+
+@pytest.mark.parametrize(
+    "term",
+    [
+        IRI("http://example.com/s"),
+        BlankNode("b0"),
+        Literal("chat", langtag="en"),
+        Literal("1", datatype="http://www.w3.org/2001/XMLSchema#integer"),
+    ],
+)
+def test_terms_are_slotted_and_immutable(term: IRI | BlankNode | Literal) -> None:
+    assert not hasattr(term, "__dict__")
+    before = hash(term)
+    with pytest.raises(AttributeError, match="immutable"):
+        term._hash = 0
+    with pytest.raises(AttributeError, match="immutable"):
+        del term._hash
+    assert hash(term) == before
+    restored = pickle.loads(pickle.dumps(term))  # noqa: S301
+    assert restored == term
+    assert hash(restored) == hash(term)
+
+
+def test_term_hashes_match_values() -> None:
+    assert hash(IRI("http://example.com/s")) == hash("http://example.com/s")
+    assert hash(Literal("a", "en")) == hash(("a", "en", None))
+    assert IRI("x") != BlankNode("x")
+    assert Literal("a") != Literal("a", "en")
+
+
+def test_term_factory_interns_terms() -> None:
+    terms = TermFactory()
+    assert terms.iri("http://example.com/s") is terms.iri("http://example.com/s")
+    assert terms.bnode("b0") is terms.bnode("b0")
+    assert terms.literal("a", "en") is terms.literal("a", "en")
+    assert terms.literal("a", "en") is not terms.literal("a")
+    terms.clear()
+    assert len(terms) == 0
+
+
+def test_term_factory_max_size() -> None:
+    max_size = 2
+    terms = TermFactory(max_size=max_size)
+    first = terms.iri("http://example.com/0")
+    second = terms.iri("http://example.com/1")
+    # Using a term keeps it; the least recently used one is evicted
+    assert terms.iri("http://example.com/0") is first
+    terms.iri("http://example.com/2")
+    assert len(terms) == max_size
+    assert terms.iri("http://example.com/0") is first
+    assert terms.iri("http://example.com/1") is not second
+
+    bnode = terms.bnode("b")
+    literal = terms.literal("v", "en")
+    for i in range(max_size):
+        terms.bnode(f"c{i}")
+        terms.literal(str(i))
+    assert terms.bnode("b") is not bnode
+    assert terms.literal("v", "en") is not literal
+    assert len(terms) == 3 * max_size
+
+
+def test_parsed_terms_are_shared() -> None:
+    sink = GenericStatementSink()
+    for i in range(10):
+        sink.add(
+            Triple(
+                IRI(f"http://example.com/s{i}"),
+                IRI("http://example.com/p"),
+                Literal("value"),
+            )
+        )
+    out = io.BytesIO()
+    sink.serialize(out)
+    parsed = list(parse_jelly_to_graph(io.BytesIO(out.getvalue())))
+    assert len({id(statement.p) for statement in parsed}) == 1
+    assert len({id(statement.o) for statement in parsed}) == 1
+
+
+def make_quads() -> list[Quad]:
+    subjects = [IRI(f"http://example.com/s{i}") for i in range(3)]
+    predicates = [IRI(f"http://example.com/p{i}") for i in range(2)]
+    objects = [Literal(str(i)) for i in range(3)] + [BlankNode("b")]
+    graphs: list[GraphName] = [DefaultGraph, IRI("http://example.com/g")]
+    return [
+        Quad(s, p, o, g)
+        for s, p, o, g in itertools.product(subjects, predicates, objects, graphs)
+        if hash((s, p, o, g)) % 3
+    ]
+
+
+def matches(statement: Triple | Quad, pattern: tuple[object, ...]) -> bool:
+    values = (*statement[:3], graph_of(statement))
+    return all(
+        term is None or term == value
+        for term, value in zip(pattern, values, strict=True)
+    )
+
+
+def test_quads_patterns_match_scan() -> None:
+    quads = make_quads()
+    sink = GenericStatementSink()
+    for quad in quads[: len(quads) // 2]:
+        sink.add(quad)
+    next(sink.quads((None, None, None, DefaultGraph)), None)
+    next(sink.triples((quads[0].s, None, quads[0].o)), None)
+    for quad in quads[len(quads) // 2 :]:
+        sink.add(quad)  # indexes built above are updated incrementally
+
+    sample = quads[0]
+    choices: list[list[Node | GraphName | None]] = [
+        [None, sample.s],
+        [None, sample.p],
+        [None, sample.o],
+        [None, sample.g, IRI("http://example.com/missing")],
+    ]
+    for pattern in itertools.product(*choices):
+        expected = sorted(repr(q) for q in quads if matches(q, pattern))
+        found = sorted(repr(q) for q in sink.quads(pattern))  # type: ignore[arg-type]
+        assert found == expected, pattern
+        if pattern[3] is None:
+            triples = sink.triples(pattern[:3])  # type: ignore[arg-type]
+            assert sorted(repr(q) for q in triples) == expected
+
+
+def test_triples_pattern_on_triple_sink() -> None:
+    sink = GenericStatementSink()
+    s, p = IRI("http://example.com/s"), IRI("http://example.com/p")
+    sink.add(Triple(s, p, Literal("1")))
+    sink.add(Triple(s, p, Literal("2")))
+    sink.add(Triple(IRI("http://example.com/x"), p, Literal("1")))
+    assert len(list(sink.triples((s, None, None)))) == len([0, 1])
+    assert list(sink.triples((None, None, Literal("2")))) == [
+        Triple(s, p, Literal("2"))
+    ]
+    assert len(list(sink.quads((None, p, None, DefaultGraph)))) == len(sink)
+    sink.drop_indexes()
+    assert list(sink.triples((IRI("http://example.com/x"), None, None))) == [
+        Triple(IRI("http://example.com/x"), p, Literal("1"))
+    ]
+
+
+def test_deduplicating_sink() -> None:
+    statements = [
+        Triple(IRI("http://example.com/s"), IRI("http://example.com/p"), Literal("1")),
+        Triple(IRI("http://example.com/s"), IRI("http://example.com/p"), Literal("2")),
+    ]
+    quad = Quad(*statements[0], DefaultGraph)
+    sink = GenericStatementSink(deduplicate=True)
+    added: list[Triple | Quad] = [*statements, *statements, quad, statements[1]]
+    for statement in added:
+        sink.add(statement)
+    assert sink.deduplicate
+    assert list(sink) == [*statements, quad]
+    assert sink.duplicates == len(statements) + 1
+
+    plain = GenericStatementSink()
+    plain.add(statements[0])
+    plain.add(statements[0])
+    assert not plain.deduplicate
+    assert len(plain) == len(statements)
+    assert plain.duplicates == 0
+
+
+def test_namespace_declarations_round_trip() -> None:
+    sink = GenericStatementSink()
+    sink.bind("ex", IRI("http://example.com/"))
+    sink.add(
+        Triple(IRI("http://example.com/s"), IRI("http://example.com/p"), Literal("o"))
+    )
+    options = SerializerOptions(
+        logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_TRIPLES,
+        params=StreamParameters(namespace_declarations=True),
+    )
+    out = io.BytesIO()
+    grouped_stream_to_file((s for s in [sink]), out, options=options)
+
+    # The declared IRI is the bare namespace, not its N-Triples form
+    graph = Graph().parse(data=out.getvalue(), format="jelly")
+    assert dict(graph.namespaces())["ex"] == URIRef("http://example.com/")
+
+    reparsed = GenericStatementSink()
+    reparsed.parse(io.BytesIO(out.getvalue()))
+    assert dict(reparsed.namespaces) == {"ex": IRI("http://example.com/")}
+    assert list(reparsed) == list(sink)
+
+
+def test_lazy_sink_rereads_file(tmp_path: Path) -> None:
+    sink = GenericStatementSink()
+    sink.bind("ex", IRI("http://example.com/"))
+    for i in range(600):
+        sink.add(
+            Triple(
+                IRI(f"http://example.com/s{i}"),
+                IRI("http://example.com/p"),
+                Literal("o"),
+            )
+        )
+    path = tmp_path / "lazy.jelly"
+    options = SerializerOptions(
+        logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_TRIPLES,
+        params=StreamParameters(namespace_declarations=True),
+    )
+    with path.open("wb") as out:
+        grouped_stream_to_file((s for s in [sink]), out, options=options)
+
+    lazy = LazyStatementSink(path)
+    assert len(lazy) == len(sink)
+    assert lazy.is_triples_sink
+    assert dict(lazy.namespaces) == {}
+    assert list(lazy) == list(sink)
+    assert dict(lazy.namespaces) == {"ex": IRI("http://example.com/")}
+    assert list(lazy) == list(sink)
+    assert list(lazy.triples((IRI("http://example.com/s5"), None, None))) == [
+        list(sink)[5]
+    ]
+    with pytest.raises(TypeError, match="read-only"):
+        lazy.add(next(iter(sink)))
+
+    buffer = io.BytesIO()
+    lazy.serialize(buffer)
+    with path.open("rb") as file:
+        from_handle = LazyStatementSink(file)
+        assert list(from_handle) == list(from_handle) == list(sink)
+    reparsed = GenericStatementSink()
+    reparsed.parse(io.BytesIO(buffer.getvalue()))
+    assert list(reparsed) == list(sink)
+    assert not any(isinstance(s, Prefix) for s in reparsed)
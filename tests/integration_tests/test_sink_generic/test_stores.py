@@ -0,0 +1,144 @@
+import io
+from pathlib import Path
+
+import pytest
+
+from pyjelly.integrations.generic.generic_sink import (
+    IRI,
+    BlankNode,
+    DefaultGraph,
+    GenericStatementSink,
+    Literal,
+    Quad,
+    Triple,
+)
+from pyjelly.integrations.generic.stores import (
+    ColumnarStore,
+    SpillingStore,
+    TermDictionary,
+)
+
+EX = "http://example.com/"
+
+
+def make_statements() -> list[Triple | Quad]:
+    quoted = Triple(IRI(f"{EX}a"), IRI(f"{EX}b"), Literal("c"))
+    return [
+        Triple(IRI(f"{EX}s"), IRI(f"{EX}p"), Literal("1", datatype=f"{EX}int")),
+        Triple(BlankNode("b0"), IRI(f"{EX}p"), Literal("chat", langtag="fr")),
+        Quad(IRI(f"{EX}s"), IRI(f"{EX}p"), IRI(f"{EX}o"), IRI(f"{EX}g")),
+        Quad(quoted, IRI(f"{EX}p"), IRI(f"{EX}o"), DefaultGraph),
+        Triple(IRI(f"{EX}s"), IRI(f"{EX}p"), Literal("1", datatype=f"{EX}int")),
+    ]
+
+
+def test_columnar_store_roundtrip() -> None:
+    statements = make_statements()
+    store = ColumnarStore()
+    for statement in statements:
+        store.append(statement)
+    assert list(store) == statements
+    assert [type(s) for s in store] == [type(s) for s in statements]
+    assert store[0] == statements[0]
+    assert store[-1] == statements[-1]
+    assert len(store) == len(statements)
+    assert store.nbytes == 4 * len(statements) * 4  # four 4-byte columns
+    store.clear()
+    assert len(store) == 0
+    assert list(store) == []
+
+
+def test_columnar_store_shares_terms() -> None:
+    terms = TermDictionary()
+    first, second = ColumnarStore(terms), ColumnarStore(terms, typecode="Q")
+    first.append(Triple(IRI(f"{EX}s"), IRI(f"{EX}p"), IRI(f"{EX}o")))
+    second.append(Triple(IRI(f"{EX}o"), IRI(f"{EX}p"), IRI(f"{EX}s")))
+    assert len(terms) == len({"s", "p", "o"})
+    assert second.typecode == "Q"
+
+
+def test_columnar_store_rejects_typecode() -> None:
+    with pytest.raises(ValueError, match="typecode must be one of"):
+        ColumnarStore(typecode="f")
+
+
+def test_sink_with_columnar_store() -> None:
+    source = GenericStatementSink()
+    for i in range(100):
+        source.add(Triple(IRI(f"{EX}s{i % 10}"), IRI(f"{EX}p"), Literal(str(i))))
+    out = io.BytesIO()
+    source.serialize(out)
+
+    sink = GenericStatementSink(store=ColumnarStore())
+    sink.parse(io.BytesIO(out.getvalue()))
+    assert isinstance(sink._store, ColumnarStore)
+    assert list(sink) == list(source)
+    assert sink.is_triples_sink
+    assert len(list(sink.triples((IRI(f"{EX}s3"), None, None)))) == len(
+        range(3, 100, 10)
+    )
+
+    again = io.BytesIO()
+    sink.serialize(again)
+    assert again.getvalue() == out.getvalue()
+
+
+@pytest.mark.parametrize("typecode", ["I", "Q"])
+def test_deduplicating_sink_with_columnar_store(typecode: str) -> None:
+    statements = make_statements()
+    store = ColumnarStore(typecode=typecode)
+    sink = GenericStatementSink(store=store, deduplicate=True)
+    for statement in statements + statements:
+        sink.add(statement)
+    unique = list(dict.fromkeys(statements))
+    assert list(sink) == unique
+    assert sink.duplicates == 2 * len(statements) - len(unique)
+    assert len({store.statement_key(s) for s in statements}) == len(unique)
+
+
+def test_spilling_store_replays_in_order(tmp_path: Path) -> None:
+    statements = make_statements() * 5
+    store = SpillingStore(max_in_memory=4, directory=str(tmp_path))
+    for statement in statements:
+        store.append(statement)
+    assert store.spilled == len(statements) - len(statements) % 4
+    assert len(store) == len(statements)
+    assert list(store) == statements
+    assert [store[i] for i in range(-len(statements), len(statements))] == (
+        statements + statements
+    )
+    with pytest.raises(IndexError):
+        store[len(statements)]
+    store.clear()
+    assert list(store) == []
+    store.append(statements[0])
+    assert list(store) == [statements[0]]
+    store.close()
+    assert len(store) == 0
+
+
+def test_spilling_store_rejects_budget() -> None:
+    with pytest.raises(ValueError, match="must be positive"):
+        SpillingStore(max_in_memory=0)
+
+
+def test_sink_with_spilling_store() -> None:
+    source = GenericStatementSink()
+    for i in range(1000):
+        source.add(Triple(IRI(f"{EX}s{i % 10}"), IRI(f"{EX}p"), Literal(str(i))))
+    out = io.BytesIO()
+    source.serialize(out)
+
+    store = SpillingStore(max_in_memory=64)
+    sink = GenericStatementSink(store=store)
+    sink.parse(io.BytesIO(out.getvalue()))
+    sink.bind("ex", IRI(EX))
+    assert store.spilled > len(source) // 2
+    assert len(sink) == len(source)
+    assert list(sink) == list(source)
+    assert dict(sink.namespaces) == {"ex": IRI(EX)}
+
+    again = io.BytesIO()
+    sink.serialize(again)
+    assert again.getvalue() == out.getvalue()
+    store.close()
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from pyjelly import jelly
+from pyjelly.cli import main
+from pyjelly.integrations.generic import ntriples
+from pyjelly.integrations.generic.generic_sink import IRI, BlankNode, Quad
+from pyjelly.integrations.generic.parse import parse_jelly_flat
+from pyjelly.parse.scan import scan_stream
+from pyjelly.serialize.ioutils import write_delimited
+
+NQUADS = """\
+# a comment
+<http://example.com/s> <http://example.com/p> "tab\\there \\"q\\"\\n"@en-US .
+
+<http://example.com/s> <http://example.com/p> "5"^^<http://example.com/int> \
+<http://example.com/g> .
+_:b1 <http://example.com/p> <http://example.com/\\u00e9> _:g .
+"""
+
+
+def test_convert_and_reframe(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    source = tmp_path / "data.nq"
+    source.write_text(NQUADS, encoding="utf-8")
+    jelly_path = tmp_path / "data.jelly"
+    assert main(["convert", str(source), str(jelly_path), "--frame-size", "1"]) == 0
+    with jelly_path.open("rb") as f:
+        assert len(scan_stream(f).frames) == 3
+
+    reframed = tmp_path / "reframed.jelly"
+    args = ["convert", str(jelly_path), str(reframed), "--preset", "small"]
+    assert main([*args, "--max-names", "32"]) == 0
+    with reframed.open("rb") as f:
+        statistics = scan_stream(f)
+    assert len(statistics.frames) == 1
+    assert statistics.options.lookup_preset.max_names == 32
+
+    assert main(["convert", str(reframed), "-", "--to", "nq"]) == 0
+    output = capsys.readouterr().out
+    assert list(ntriples.parse_lines(io.StringIO(output), quads=True)) == list(
+        ntriples.parse_lines(io.StringIO(NQUADS), quads=True)
+    )
+
+    assert main(["convert", str(source), "-", "--to", "nt"]) == 2
+    assert "named graphs" in capsys.readouterr().err
+
+
+def test_cat_stats_and_validate(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    source = tmp_path / "data.nq"
+    source.write_text(NQUADS, encoding="utf-8")
+    part = tmp_path / "part.jelly"
+    assert main(["convert", str(source), str(part)]) == 0
+    merged = tmp_path / "merged.jelly"
+    assert main(["cat", str(part), str(part), "-o", str(merged)]) == 0
+    with merged.open("rb") as f:
+        assert len(list(parse_jelly_flat(f))) == 6
+
+    assert main(["stats", str(merged), "--frames", "--predicates"]) == 0
+    text = capsys.readouterr().out
+    assert "statements:      6" in text
+    assert "predicates:      1" in text
+    assert "frame 0:" in text
+
+    # Named graphs of quads are not graph start rows
+    assert main(["stats", str(merged), "--graphs"]) == 0
+    text = capsys.readouterr().out
+    assert "graph starts:    0" in text
+    assert "graphs:          4" in text
+
+    assert main(["stats", str(merged), "--json", "--graphs"]) == 0
+    result = json.loads(capsys.readouterr().out)
+    assert result["graphs"] == 4
+    assert result["logical_type"] == "LOGICAL_STREAM_TYPE_FLAT_QUADS"
+    assert result["totals"]["quads"] == 6
+
+    assert main(["validate", str(merged), str(source)]) == 1
+    captured = capsys.readouterr()
+    assert f"{merged}: ok, 6 statements" in captured.out
+    assert f"{source}: invalid" in captured.err
+
+
+def test_cat_keeps_blank_nodes_apart(tmp_path: Path) -> None:
+    triples = tmp_path / "triples.nt"
+    triples.write_text("_:b1 <http://example.com/p> _:b2 .\n", encoding="utf-8")
+    quads = tmp_path / "quads.nq"
+    quads.write_text(NQUADS, encoding="utf-8")
+    parts = [tmp_path / "quads.jelly", tmp_path / "triples.jelly"]
+    assert main(["convert", str(quads), str(parts[0])]) == 0
+    assert main(["convert", str(triples), str(parts[1])]) == 0
+    merged = tmp_path / "merged.jelly"
+    assert main(["cat", *map(str, parts), "-o", str(merged)]) == 0
+    with merged.open("rb") as f:
+        statements = [s for s in parse_jelly_flat(f) if isinstance(s, Quad)]
+    assert len(statements) == 4
+    assert (statements[2].s, statements[2].g) == (BlankNode("f0_b1"), BlankNode("f0_g"))
+    assert (statements[3].s, statements[3].o) == (
+        BlankNode("f1_b1"),
+        BlankNode("f1_b2"),
+    )
+    assert statements[3].p == IRI("http://example.com/p")
+
+
+def test_invalid_options_are_reported(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    path = tmp_path / "invalid.jelly"
+    options = jelly.RdfStreamOptions(
+        physical_type=jelly.PHYSICAL_STREAM_TYPE_TRIPLES,
+        logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_QUADS,
+        max_name_table_size=128,
+        version=1,
+    )
+    with path.open("wb") as f:
+        write_delimited(
+            jelly.RdfStreamFrame(rows=[jelly.RdfStreamRow(options=options)]), f
+        )
+    assert main(["validate", str(path)]) == 1
+    assert f"{path}: invalid" in capsys.readouterr().err
+    assert main(["stats", str(path)]) == 2
+    assert "pyjelly stats:" in capsys.readouterr().err
+
+    source = tmp_path / "data.nq"
+    source.write_text(NQUADS, encoding="utf-8")
+    args = ["convert", str(source), str(tmp_path / "out.jelly")]
+    assert main([*args, "--max-names", "0"]) == 2
+    assert "at least 8" in capsys.readouterr().err
+
+
+def test_stdio_without_rdflib(tmp_path: Path) -> None:
+    source = tmp_path / "data.nq"
+    source.write_text(NQUADS, encoding="utf-8")
+    code = (
+        "import sys; from pyjelly.cli import main; code = main(sys.argv[1:]); "
+        "assert 'rdflib' not in sys.modules; sys.exit(code)"
+    )
+    to_jelly = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code, "convert", "-f", "nq", "-t", "jelly"],
+        input=source.read_bytes(),
+        capture_output=True,
+        check=True,
+    )
+    stats = subprocess.run(
+        [sys.executable, "-m", "pyjelly", "stats"],
+        input=to_jelly.stdout,
+        capture_output=True,
+        check=True,
+    )
+    assert b"statements:      3" in stats.stdout
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from pyjelly import jelly
+from pyjelly.errors import JellyMemoryError, JellyMemoryWarning
+from pyjelly.integrations.generic.generic_sink import (
+    IRI,
+    GenericStatementSink,
+    Literal,
+    Triple,
+)
+from pyjelly.integrations.generic.parse import (
+    GenericStatementSinkAdapter,
+    parse_jelly_flat,
+    parse_jelly_grouped,
+)
+from pyjelly.integrations.generic.serialize import (
+    GenericSinkTermEncoder,
+    flat_stream_to_file,
+    grouped_stream_to_file,
+)
+from pyjelly.memory import MemoryTracker
+from pyjelly.options import LookupPreset, StreamParameters, StreamTypes
+from pyjelly.parse.decode import Decoder, ParserOptions
+from pyjelly.serialize.streams import SerializerOptions, TripleStream
+
+
+def triples(count: int) -> list[Triple]:
+    return [
+        Triple(
+            IRI(f"http://example.com/s{i}"),
+            IRI("http://example.com/p"),
+            Literal(f"value {i}"),
+        )
+        for i in range(count)
+    ]
+
+
+def sink(count: int) -> GenericStatementSink:
+    graph = GenericStatementSink()
+    for triple in triples(count):
+        graph.add(triple)
+    return graph
+
+
+def serialize_graphs(*sizes: int, memory: MemoryTracker | None = None) -> bytes:
+    out = io.BytesIO()
+    options = SerializerOptions(
+        logical_type=jelly.LOGICAL_STREAM_TYPE_GRAPHS, memory=memory
+    )
+    grouped_stream_to_file((sink(size) for size in sizes), out, options=options)
+    return out.getvalue()
+
+
+def test_grouped_serialization_tracks_graph_buffer() -> None:
+    small, large = MemoryTracker(), MemoryTracker()
+    serialize_graphs(10, memory=small)
+    serialize_graphs(10, 1000, 10, memory=large)
+    assert 0 < small.high_water_mark < large.high_water_mark
+    assert large.current < large.high_water_mark
+    assert large.lookups > 0
+
+
+def test_flat_serialization_buffer_is_bounded_by_frames() -> None:
+    memory = MemoryTracker()
+    options = SerializerOptions(
+        logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_TRIPLES,
+        frame_size=10,
+        memory=memory,
+    )
+    flat_stream_to_file((t for t in triples(1000)), io.BytesIO(), options)
+    whole = MemoryTracker()
+    serialize_graphs(1000, memory=whole)
+    assert memory.high_water_mark < whole.high_water_mark / 4
+
+
+def test_serialization_ceiling_raises() -> None:
+    with pytest.raises(JellyMemoryError, match="over the ceiling of 2000"):
+        serialize_graphs(10, 1000, memory=MemoryTracker(ceiling=2000))
+
+
+def test_serialization_ceiling_warns_once_per_crossing() -> None:
+    memory = MemoryTracker(ceiling=10_000, warn=True)
+    with pytest.warns(JellyMemoryWarning) as record:
+        serialize_graphs(1000, 10, 1000, memory=memory)
+    assert len(record) == 2
+    assert memory.high_water_mark > 10_000
+
+
+def test_parsing_tracks_frames() -> None:
+    data = serialize_graphs(1000, 10)
+    memory = MemoryTracker()
+    graphs = list(parse_jelly_grouped(io.BytesIO(data), memory=memory))
+    assert [len(graph) for graph in graphs] == [1000, 10]
+    assert memory.high_water_mark > memory.current > 0
+
+    with pytest.raises(JellyMemoryError):
+        list(parse_jelly_grouped(io.BytesIO(data), memory=MemoryTracker(2000)))
+
+    trusted = MemoryTracker()
+    statements = list(parse_jelly_flat(io.BytesIO(data), trusted=True, memory=trusted))
+    assert len(statements) == 1010
+    assert trusted.high_water_mark == memory.high_water_mark
+
+
+@pytest.mark.parametrize("memory", [None, MemoryTracker()])
+def test_lookup_sizes_tracked_only_with_tracker(memory: MemoryTracker | None) -> None:
+    options = SerializerOptions(memory=memory)
+    stream = TripleStream(encoder=GenericSinkTermEncoder(), options=options)
+    assert stream.encoder.names.lookup.tracks_size is (memory is not None)
+
+    adapter = GenericStatementSinkAdapter(
+        ParserOptions(
+            stream_types=StreamTypes(),
+            lookup_preset=LookupPreset(),
+            params=StreamParameters(),
+        )
+    )
+    decoder = Decoder(adapter, memory=memory)
+    assert decoder.names.tracks_size is (memory is not None)
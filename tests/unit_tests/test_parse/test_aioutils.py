@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import socket
+from collections.abc import AsyncIterator, MutableMapping
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any
+
+import pytest
+from rdflib import Dataset, Graph, Literal, Namespace
+
+from pyjelly import jelly
+from pyjelly.errors import JellyConformanceError
+from pyjelly.integrations.generic import parse as gparse
+from pyjelly.integrations.generic.generic_sink import IRI, Triple
+from pyjelly.integrations.generic.serialize import flat_stream_to_file
+from pyjelly.integrations.rdflib import parse as rparse
+from pyjelly.options import StreamParameters
+from pyjelly.parse.aioutils import (
+    AsyncByteReader,
+    async_frame_iterator,
+    async_get_options_and_frames,
+)
+from pyjelly.parse.ioutils import get_options_and_frames
+from pyjelly.serialize.streams import SerializerOptions
+
+EX = Namespace("http://example.org/")
+
+
+async def chunked(data: bytes, size: int = 7) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+def generic_triples(count: int) -> list[Triple]:
+    return [
+        Triple(IRI(f"{EX}s{i}"), IRI(f"{EX}p"), IRI(f"{EX}o{i % 5}"))
+        for i in range(count)
+    ]
+
+
+def serialize_generic(count: int, *, delimited: bool = True) -> bytes:
+    out = io.BytesIO()
+    options = SerializerOptions(
+        logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_TRIPLES,
+        frame_size=8,
+        params=StreamParameters(delimited=delimited),
+    )
+    flat_stream_to_file((t for t in generic_triples(count)), out, options)
+    return out.getvalue()
+
+
+def test_read_varint() -> None:
+    async def main() -> list[int | None]:
+        reader = AsyncByteReader(chunked(bytes([0x96, 0x01, 0x05]), size=1))
+        return [await reader.read_varint() for _ in range(3)]
+
+    assert asyncio.run(main()) == [150, 5, None]
+
+
+def test_truncated_frame_raises() -> None:
+    data = serialize_generic(10)
+
+    async def main() -> None:
+        async for _ in async_frame_iterator(chunked(data[:-3])):
+            pass
+
+    with pytest.raises(JellyConformanceError, match="unexpected end of stream"):
+        asyncio.run(main())
+
+
+def test_async_frames_match_sync_frames() -> None:
+    data = serialize_generic(50)
+
+    async def main() -> list[jelly.RdfStreamFrame]:
+        _, frames = await async_get_options_and_frames(chunked(data))
+        return [frame async for frame in frames]
+
+    frames = asyncio.run(main())
+    expected = list(get_options_and_frames(io.BytesIO(data))[1])
+    assert frames == expected
+
+
+def test_generic_flat_async_from_iterator() -> None:
+    data = serialize_generic(40)
+
+    async def main() -> list[object]:
+        return [s async for s in gparse.parse_jelly_flat_async(chunked(data, 3))]
+
+    assert asyncio.run(main()) == generic_triples(40)
+
+
+def test_generic_flat_async_non_delimited() -> None:
+    data = serialize_generic(20, delimited=False)
+
+    async def main() -> list[object]:
+        return [s async for s in gparse.parse_jelly_flat_async(chunked(data))]
+
+    assert asyncio.run(main()) == generic_triples(20)
+
+
+def test_generic_grouped_async_over_socket() -> None:
+    data = serialize_generic(30)
+    left, right = socket.socketpair()
+
+    async def main() -> list[int]:
+        reader, writer = await asyncio.open_connection(sock=left)
+        loop = asyncio.get_running_loop()
+        send = loop.run_in_executor(None, right.sendall, data)
+        await send
+        right.shutdown(socket.SHUT_WR)
+        sizes = [len(sink) async for sink in gparse.parse_jelly_grouped_async(reader)]
+        writer.close()
+        return sizes
+
+    try:
+        sizes = asyncio.run(main())
+    finally:
+        right.close()
+    assert sum(sizes) == 30
+    assert len(sizes) > 1
+
+
+def test_rdflib_async_parsing() -> None:
+    graph = Graph()
+    for i in range(10):
+        graph.add((EX[f"s{i}"], EX.p, Literal(i)))
+    dataset = Dataset()
+    dataset.graph(EX.g).add((EX.s, EX.p, EX.o))
+    graph_data = graph.serialize(format="jelly", encoding="jelly")
+    dataset_data = dataset.serialize(format="jelly", encoding="jelly")
+
+    async def main() -> tuple[set[rparse.Statement | rparse.Prefix], list[Graph]]:
+        triples = {s async for s in rparse.parse_jelly_flat_async(chunked(graph_data))}
+        grouped = [
+            g async for g in rparse.parse_jelly_grouped_async(chunked(dataset_data))
+        ]
+        return triples, grouped
+
+    triples, grouped = asyncio.run(main())
+    assert triples == set(graph)
+    assert len(grouped) == 1
+    assert isinstance(grouped[0], Dataset)
+    assert set(grouped[0].quads()) == {(EX.s, EX.p, EX.o, EX.g)}
+
+
+@pytest.mark.parametrize("parse", [gparse, rparse])
+def test_async_frame_metadata_is_a_copy(parse: Any) -> None:
+    path = Path(__file__).parent / "test_frame_metadata"
+    data = (path / "triple_stream_with_metadata.jelly").read_bytes()
+    frame_metadata: ContextVar[MutableMapping[str, bytes]] = ContextVar(
+        "frame_metadata"
+    )
+
+    async def main() -> list[MutableMapping[str, bytes]]:
+        return [
+            frame_metadata.get()
+            async for _ in parse.parse_jelly_grouped_async(
+                chunked(data, size=4096), frame_metadata=frame_metadata
+            )
+        ]
+
+    metadatas = asyncio.run(main())
+    assert metadatas == [{"c": b"\x00"}, {}]
+    assert all(type(metadata) is dict for metadata in metadatas)
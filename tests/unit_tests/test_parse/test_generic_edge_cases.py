@@ -13,6 +13,8 @@ from pyjelly.errors import JellyConformanceError
 from pyjelly.integrations.generic import parse as gparse
 from pyjelly.integrations.generic.generic_sink import (
     IRI,
+    BlankNode,
+    DefaultGraph,
     Literal,
     Prefix,
     Quad,
@@ -21,12 +23,16 @@ from pyjelly.integrations.generic.generic_sink import (
 from pyjelly.integrations.generic.parse import (
     GenericGraphsAdapter,
     GenericStatementSinkAdapter,
+    make_decoder,
     parse_jelly_flat,
     parse_jelly_grouped,
     parse_jelly_to_graph,
 )
+from pyjelly.integrations.generic.serialize import flat_stream_to_file
+from pyjelly.memory import MemoryTracker
 from pyjelly.options import LookupPreset, StreamParameters, StreamTypes
-from pyjelly.parse.decode import ParserOptions
+from pyjelly.parse.decode import ParserOptions, TrustedDecoder
+from pyjelly.serialize.streams import SerializerOptions
 
 
 def test_parse_jelly_flat_unsupported_physical_type_raises() -> None:
@@ -145,6 +151,9 @@ def test_parse_jelly_grouped_prefixes_triples(monkeypatch: pytest.MonkeyPatch) -
     def dummy_triples_stream(
         frames: Iterable[jelly.RdfStreamFrame],  # noqa: ARG001
         options: ParserOptions,  # noqa: ARG001
+        *,
+        trusted: bool,  # noqa: ARG001
+        memory: MemoryTracker | None,  # noqa: ARG001
     ) -> Any:
         yield [
             Prefix("ex", IRI("http://example.com/")),
@@ -180,6 +189,9 @@ def test_parse_jelly_grouped_prefixes_quads(monkeypatch: pytest.MonkeyPatch) ->
     def fake_parse_quads_stream(
         frames: Iterable[jelly.RdfStreamFrame],  # noqa: ARG001
         options: ParserOptions,  # noqa: ARG001
+        *,
+        trusted: bool,  # noqa: ARG001
+        memory: MemoryTracker | None,  # noqa: ARG001
     ) -> Any:
         yield [
             Prefix("ex", IRI("http://example.com/")),
@@ -207,12 +219,14 @@ def test_parse_jelly_to_graph_prefix(monkeypatch: pytest.MonkeyPatch) -> None:
     )
     monkeypatch.setattr(gparse, "get_options_and_frames", lambda _: (opts, iter(())))
 
-    def dummy_parse_jelly_flat(
+    def dummy_parse_jelly_flat(  # noqa: PLR0913
         *,
         inp: IO[bytes],  # noqa: ARG001
         frames: Iterable[jelly.RdfStreamFrame],  # noqa: ARG001
         options: ParserOptions,  # noqa: ARG001
         logical_type_strict: bool,  # noqa: ARG001
+        trusted: bool,  # noqa: ARG001
+        memory: MemoryTracker | None,  # noqa: ARG001
     ) -> Any:
         yield Prefix("ex", IRI("http://example.com/"))
         yield Triple(
@@ -225,3 +239,44 @@ def test_parse_jelly_to_graph_prefix(monkeypatch: pytest.MonkeyPatch) -> None:
 
     sink = parse_jelly_to_graph(io.BytesIO(b"dummy"))
     assert any(isinstance(st, Triple) for st in sink.store)
+
+
+def test_trusted_parse_matches_strict() -> None:
+    quads = [
+        Quad(
+            IRI(f"http://example.com/s{i % 5}"),
+            IRI(f"http://example.com/p{i % 3}"),
+            Literal(str(i), datatype="http://www.w3.org/2001/XMLSchema#integer")
+            if i % 2
+            else BlankNode(f"b{i}"),
+            DefaultGraph if i % 4 else IRI(f"http://example.com/g{i % 3}"),
+        )
+        for i in range(200)
+    ]
+    out = io.BytesIO()
+    options = SerializerOptions(
+        logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_QUADS, frame_size=17
+    )
+    flat_stream_to_file((q for q in quads), out, options)
+
+    strict = list(parse_jelly_flat(io.BytesIO(out.getvalue())))
+    trusted = list(parse_jelly_flat(io.BytesIO(out.getvalue()), trusted=True))
+    assert list(map(repr, trusted)) == list(map(repr, strict))
+    assert len(strict) == len(quads)
+
+
+def test_trusted_decoder_skips_options_validation() -> None:
+    options = ParserOptions(
+        stream_types=StreamTypes(
+            physical_type=jelly.PHYSICAL_STREAM_TYPE_TRIPLES,
+            logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_TRIPLES,
+        ),
+        lookup_preset=LookupPreset(),
+        params=StreamParameters(),
+    )
+    other = jelly.RdfStreamOptions(physical_type=jelly.PHYSICAL_STREAM_TYPE_QUADS)
+    with pytest.raises(AssertionError):
+        make_decoder(options).validate_stream_options(other)
+    decoder = make_decoder(options, trusted=True)
+    assert isinstance(decoder, TrustedDecoder)
+    decoder.validate_stream_options(other)
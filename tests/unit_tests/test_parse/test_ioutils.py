@@ -1,9 +1,18 @@
 import io
+import threading
+import time
 import typing
 
 import pytest
+from google.protobuf.message import DecodeError
+from rdflib import Graph
 
-from pyjelly.parse.ioutils import get_options_and_frames
+from pyjelly import jelly
+from pyjelly.integrations.generic.generic_sink import IRI, Triple
+from pyjelly.integrations.generic.parse import parse_jelly_flat
+from pyjelly.integrations.generic.serialize import flat_stream_to_file
+from pyjelly.parse.ioutils import get_options_and_frames, read_ahead_frames
+from pyjelly.serialize.streams import SerializerOptions
 
 
 # Regression test for https://github.com/Jelly-RDF/pyjelly/issues/298
@@ -22,3 +31,67 @@ def test_get_options_and_frames_no_seek(monkeypatch: pytest.MonkeyPatch) -> None
 
     monkeypatch.setattr(inp, "seek", seek)
     get_options_and_frames(inp)
+
+
+def serialized_triples(count: int, frame_size: int = 5) -> bytes:
+    out = io.BytesIO()
+    options = SerializerOptions(
+        logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_TRIPLES, frame_size=frame_size
+    )
+    triples = (
+        Triple(IRI(f"http://e/s{i}"), IRI("http://e/p"), IRI("http://e/o"))
+        for i in range(count)
+    )
+    flat_stream_to_file(triples, out, options)
+    return out.getvalue()
+
+
+@pytest.mark.parametrize("read_ahead", [1, 4])
+def test_read_ahead_yields_same_frames(read_ahead: int) -> None:
+    data = serialized_triples(53)
+    expected_options, expected = get_options_and_frames(io.BytesIO(data))
+    options, frames = get_options_and_frames(io.BytesIO(data))
+    frames = read_ahead_frames(frames, read_ahead)
+    assert options == expected_options
+    assert list(frames) == list(expected)
+
+
+def test_read_ahead_reraises_producer_errors() -> None:
+    data = serialized_triples(53)
+    _, frames = get_options_and_frames(io.BytesIO(data[:-4]))
+    frames = read_ahead_frames(frames, 2)
+    with pytest.raises(DecodeError):
+        list(frames)
+
+
+def test_read_ahead_stops_producer_on_close() -> None:
+    produced = []
+
+    def frames() -> typing.Iterator[typing.Any]:
+        for i in range(1000):
+            # A slow read, still in progress when the consumer stops
+            time.sleep(0.01)
+            produced.append(i)
+            yield i
+
+    consumer = read_ahead_frames(frames(), 2)
+    assert isinstance(consumer, typing.Generator)
+    assert next(consumer) == 0
+    consumer.close()
+    # close() returns only once the producer has stopped reading
+    stopped_at = len(produced)
+    time.sleep(0.05)
+    assert len(produced) == stopped_at < 10
+    assert not any(
+        thread.name == "pyjelly-read-ahead" and thread.is_alive()
+        for thread in threading.enumerate()
+    )
+
+
+def test_read_ahead_in_entry_points() -> None:
+    data = serialized_triples(40)
+    assert list(parse_jelly_flat(io.BytesIO(data), read_ahead=3)) == list(
+        parse_jelly_flat(io.BytesIO(data))
+    )
+    graph = Graph().parse(io.BytesIO(data), format="jelly", read_ahead=3)
+    assert len(graph) == 40
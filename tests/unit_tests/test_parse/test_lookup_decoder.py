@@ -4,7 +4,7 @@ from hypothesis import strategies as st
 
 from pyjelly.errors import JellyAssertionError, JellyConformanceError
 from pyjelly.options import MAX_LOOKUP_SIZE
-from pyjelly.parse.lookup import LookupDecoder
+from pyjelly.parse.lookup import LookupDecoder, TrustedLookupDecoder
 
 
 @given(st.integers(min_value=1, max_value=MAX_LOOKUP_SIZE))
@@ -39,3 +39,55 @@ def test_at_invalid_index() -> None:
         decoder.at(2)
     assert "invalid resolved index 2" in str(excinfo.value)
     assert decoder.last_reused_index == 2
+
+
+@given(st.lists(st.sampled_from([0, 1, 2, 3, 4]), min_size=1, max_size=50))
+def test_trusted_lookup_matches_strict(indices: list[int]) -> None:
+    strict = LookupDecoder(lookup_size=4)
+    trusted = TrustedLookupDecoder(lookup_size=4)
+    for step, raw in enumerate(indices):
+        # Implicit (0) indices wrap around to the first entry
+        index = 1 if raw == 0 and strict.last_assigned_index == 4 else raw
+        strict.assign_entry(index, str(step))
+        trusted.assign_entry(index, str(step))
+        assert trusted.last_assigned_index == strict.last_assigned_index
+        assigned = strict.last_assigned_index
+        assert trusted.at(assigned) == strict.at(assigned)
+        assert trusted.decode_prefix_term_index(0) == strict.decode_prefix_term_index(0)
+        assert trusted.decode_datatype_term_index(
+            assigned
+        ) == strict.decode_datatype_term_index(assigned)
+
+
+@given(
+    st.lists(
+        st.tuples(st.sampled_from([0, 1, 2, 3]), st.text(max_size=5)),
+        min_size=1,
+        max_size=50,
+    )
+)
+def test_byte_size_tracks_assigned_entries(entries: list[tuple[int, str]]) -> None:
+    strict = LookupDecoder(lookup_size=3)
+    trusted = TrustedLookupDecoder(lookup_size=3)
+    untracked = LookupDecoder(lookup_size=3)
+    for step, (raw, value) in enumerate(entries):
+        if step == 1:
+            strict.track_size()
+            trusted.track_size()
+        # Implicit (0) indices wrap around to the first entry
+        index = 1 if raw == 0 and strict.last_assigned_index == 3 else raw
+        for decoder in (strict, trusted, untracked):
+            decoder.assign_entry(index, value)
+        expected = sum(len(entry.encode()) for entry in strict.data if entry)
+        assert strict.byte_size() == trusted.byte_size() == expected
+        assert untracked.byte_size() == expected
+    assert not untracked.tracks_size
+    assert untracked.total_size == 0
+
+
+def test_trusted_lookup_keeps_one_table() -> None:
+    decoder = TrustedLookupDecoder(lookup_size=4)
+    assert decoder.values == [""] * 4
+    assert not hasattr(decoder, "data")
+    with pytest.raises(JellyAssertionError, match="cannot be larger"):
+        TrustedLookupDecoder(lookup_size=MAX_LOOKUP_SIZE + 1)
@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+import io
+from collections.abc import Sequence
+from pathlib import Path
+
+import pytest
+
+from pyjelly import jelly
+from pyjelly.errors import JellyConformanceError
+from pyjelly.integrations.generic import ntriples
+from pyjelly.integrations.generic.generic_sink import (
+    IRI,
+    BlankNode,
+    DefaultGraph,
+    Literal,
+    Quad,
+    TermFactory,
+    Triple,
+)
+from pyjelly.integrations.generic.parse import parse_jelly_flat
+from pyjelly.integrations.generic.serialize import flat_stream_to_file
+from pyjelly.options import LookupPreset, StreamParameters, StreamTypes
+from pyjelly.parse.decode import ParserOptions
+from pyjelly.serialize.streams import SerializerOptions
+
+EX = "http://example.com/"
+E2E = Path(__file__).parents[2] / "e2e_test_cases"
+
+NQUADS = """\
+# a comment
+<http://example.com/s> <http://example.com/p> "tab\\there \\"q\\"\\n"@en-US .
+
+<http://example.com/s> <http://example.com/p> "5"^^<http://example.com/int> \
+<http://example.com/g> .
+_:b1 <http://example.com/p> <http://example.com/\\u00e9> _:g . # trailing
+"""
+
+STAR = """\
+<< <http://example.com/s> <http://example.com/p> "o" >> <http://example.com/q> _:b .
+<http://example.com/s> <http://example.com/p> <<_:x <http://example.com/p> \
+<< <http://example.com/s> <http://example.com/p> <http://example.com/o> >>>> .
+"""
+
+
+def test_round_trip() -> None:
+    statements = list(ntriples.parse_lines(io.StringIO(NQUADS)))
+    assert statements == [
+        Triple(IRI(f"{EX}s"), IRI(f"{EX}p"), Literal('tab\there "q"\n', "en-US")),
+        Quad(
+            IRI(f"{EX}s"),
+            IRI(f"{EX}p"),
+            Literal("5", datatype=f"{EX}int"),
+            IRI(f"{EX}g"),
+        ),
+        Quad(BlankNode("b1"), IRI(f"{EX}p"), IRI(f"{EX}é"), BlankNode("g")),
+    ]
+    out = io.StringIO()
+    assert ntriples.write_statements(statements, out) == 3
+    assert list(ntriples.parse_lines(io.StringIO(out.getvalue()))) == statements
+
+    as_quads = list(ntriples.parse_lines(io.StringIO(NQUADS), quads=True))
+    first = statements[0]
+    assert isinstance(first, Triple)
+    assert as_quads[0] == Quad(first.s, first.p, first.o, DefaultGraph)
+    assert ntriples.statement_to_nt(as_quads[0]).count("<") == 2
+    with pytest.raises(ValueError, match="named graphs"):
+        ntriples.write_statements(statements, io.StringIO(), quads=False)
+
+
+def test_quoted_triples() -> None:
+    inner = Triple(IRI(f"{EX}s"), IRI(f"{EX}p"), IRI(f"{EX}o"))
+    statements = list(ntriples.parse_lines(STAR.splitlines()))
+    assert statements == [
+        Triple(
+            Triple(IRI(f"{EX}s"), IRI(f"{EX}p"), Literal("o")),
+            IRI(f"{EX}q"),
+            BlankNode("b"),
+        ),
+        Triple(
+            IRI(f"{EX}s"),
+            IRI(f"{EX}p"),
+            Triple(BlankNode("x"), IRI(f"{EX}p"), inner),
+        ),
+    ]
+    out = io.StringIO()
+    ntriples.write_statements(statements, out)
+    assert list(ntriples.parse_lines(io.StringIO(out.getvalue()))) == statements
+
+    options = SerializerOptions(
+        logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_TRIPLES,
+        params=StreamParameters(rdf_star=True),
+    )
+    data = io.BytesIO()
+    flat_stream_to_file(ntriples.parse_lines(STAR.splitlines()), data, options)
+    data.seek(0)
+    assert list(parse_jelly_flat(data)) == statements
+
+
+def test_split_lines() -> None:
+    assert list(ntriples.split_lines(io.StringIO(NQUADS))) == [
+        (f"<{EX}s>", f"<{EX}p>", '"tab\\there \\"q\\"\\n"@en-US'),
+        (f"<{EX}s>", f"<{EX}p>", f'"5"^^<{EX}int>', f"<{EX}g>"),
+        ("_:b1", f"<{EX}p>", f"<{EX}\\u00e9>", "_:g"),
+    ]
+    (quoted, *rest) = next(ntriples.split_lines(STAR.splitlines()))
+    assert quoted == f'<< <{EX}s> <{EX}p> "o" >>'
+    assert ntriples.parse_term(quoted) == Triple(
+        IRI(f"{EX}s"), IRI(f"{EX}p"), Literal("o")
+    )
+    assert [ntriples.parse_term(term) for term in rest] == [
+        IRI(f"{EX}q"),
+        BlankNode("b"),
+    ]
+
+
+def test_terms_are_shared() -> None:
+    terms = TermFactory()
+    first, second = ntriples.parse_lines(
+        [f"<{EX}s> <{EX}p> <{EX}o> .", f"<{EX}o> <{EX}p> <{EX}s> ."], terms=terms
+    )
+    assert first.p is second.p
+    assert first.s is second.o
+    assert len(terms) == 3
+
+
+@pytest.mark.parametrize(
+    ("line", "reason"),
+    [
+        (f"<{EX}s> <{EX}p> .", "expected object at column"),
+        (f"<{EX}s> <{EX}p> <{EX}o>", "expected graph label"),
+        (f'<{EX}s> <{EX}p> "open .', "expected object"),
+        (f'"s" <{EX}p> <{EX}o> .', "literal cannot be subject"),
+        (f"<{EX}s> _:p <{EX}o> .", "blank node cannot be predicate"),
+        (f'<{EX}s> <{EX}p> <{EX}o> "g" .', "literal cannot be graph label"),
+        (f"<{EX}s> <{EX}p> << <{EX}s> <{EX}p> <{EX}o> .", "expected '>>'"),
+        (
+            f"<{EX}s> <{EX}p> <{EX}o> << <{EX}s> <{EX}p> <{EX}o> >> .",
+            "quoted triple cannot be graph label",
+        ),
+        (f"<{EX}s> <{EX}p> <{EX}o> . x", "expected graph label"),
+        ("<s> <p> <o> .", "expected subject"),
+        (f"<{EX}s t> <{EX}p> <{EX}o> .", "expected subject"),
+        (f"_:a. <{EX}p> <{EX}o> .", "expected predicate"),
+        (f'<{EX}s> <{EX}p> "\\a" .', "expected object"),
+        (f'<{EX}s> <{EX}p> "x"@1 .', "expected graph label"),
+        pytest.param(
+            f"<{EX}s> <{EX}p> " + f"<< <{EX}s> <{EX}p> " * 65,
+            "quoted triples nested too deeply",
+            id="nesting",
+        ),
+    ],
+)
+def test_syntax_errors(line: str, reason: str) -> None:
+    with pytest.raises(ValueError, match=f"line 2: {reason}"):
+        list(ntriples.parse_lines(["", line]))
+    with pytest.raises(ValueError, match=reason):
+        list(ntriples.split_lines([line]))
+
+
+def test_invalid_code_point() -> None:
+    line = f"<{EX}s> <{EX}p> <{EX}\\U00110000> ."
+    with pytest.raises(ValueError, match="invalid code point escape"):
+        ntriples.parse_line(line)
+    assert ntriples.NTriplesParser().split_line(line) is not None
+
+
+def test_iter_lines_bounds_line_length() -> None:
+    data = f"<{EX}s> <{EX}p> <{EX}o> .\r\n".encode() * 3
+    lines = list(ntriples.iter_lines(io.BytesIO(data), max_line_length=100))
+    assert len(lines) == 3
+    assert len(list(ntriples.parse_lines(lines))) == 3
+
+    inp = io.BytesIO(data)
+    with pytest.raises(ValueError, match="line 1: longer than 16 characters"):
+        list(ntriples.iter_lines(inp, max_line_length=16))
+    assert not inp.closed
+    assert list(ntriples.iter_lines(io.StringIO("a\nb"), max_line_length=None)) == [
+        "a\n",
+        "b",
+    ]
+
+
+@pytest.mark.parametrize(
+    "path",
+    sorted(E2E.glob("*/*.n[tq]")),
+    ids=lambda path: path.name,
+)
+def test_e2e_documents_round_trip(path: Path) -> None:
+    with path.open("rb") as f:
+        statements = list(ntriples.parse_lines(ntriples.iter_lines(f)))
+    assert statements
+    out = io.StringIO()
+    ntriples.write_statements(statements, out)
+    assert list(ntriples.parse_lines(io.StringIO(out.getvalue()))) == statements
+
+
+def test_canonical_escaping() -> None:
+    assert ntriples.format_literal('a\tb"\\\x00\x7f\u00e9') == (
+        '"a\\tb\\"\\\\\\u0000\\u007F\u00e9"'
+    )
+    assert ntriples.format_literal("x", datatype=f"{EX}a b") == f'"x"^^<{EX}a\\u0020b>'
+    assert ntriples.format_bnode("b1") == "_:b1"
+    assert ntriples.format_bnode("a b") == "_:x612062"
+    with pytest.raises(ValueError, match="invalid language tag"):
+        ntriples.format_literal("x", "en US")
+    statement = Triple(BlankNode("-"), IRI(f"{EX}p<"), Literal("\b\f\x01"))
+    (parsed,) = ntriples.parse_lines([ntriples.statement_to_nt(statement)])
+    assert parsed == Triple(BlankNode("x2d"), IRI(f"{EX}p<"), Literal("\b\f\x01"))
+
+
+def jelly_bytes(
+    statements: Sequence[Triple | Quad],
+    frame_size: int = 250,
+    lookup_preset: LookupPreset | None = None,
+) -> bytes:
+    out = io.BytesIO()
+    options = SerializerOptions(
+        frame_size=frame_size,
+        params=StreamParameters(rdf_star=True, generalized_statements=True),
+        lookup_preset=lookup_preset or LookupPreset(),
+    )
+    flat_stream_to_file((statement for statement in statements), out, options)
+    return out.getvalue()
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_jelly_to_ntriples(*, trusted: bool) -> None:
+    # More names and datatypes than the lookups hold, so entries get evicted
+    statements = [
+        Quad(
+            IRI(f"{EX}s{i % 20}"),
+            IRI(f"http://example.org/{i % 3}/p"),
+            Literal(f"v{i}\n", datatype=f"{EX}dt{i % 5}"),
+            IRI(f"{EX}g") if i % 2 else DefaultGraph,
+        )
+        for i in range(100)
+    ]
+    data = jelly_bytes(statements, frame_size=7, lookup_preset=LookupPreset(8, 2, 2))
+    out = io.BytesIO()
+    count = ntriples.jelly_to_ntriples(
+        io.BytesIO(data), out, trusted=trusted, chunk_size=100
+    )
+    assert count == 100
+    expected = "".join(map(ntriples.statement_to_nt, statements))
+    assert out.getvalue().decode() == expected
+
+    with pytest.raises(ValueError, match="named graphs"):
+        ntriples.jelly_to_ntriples(io.BytesIO(data), io.BytesIO(), quads=False)
+
+    default_graph = statements[::2]
+    out = io.BytesIO()
+    data = jelly_bytes(default_graph)
+    ntriples.jelly_to_ntriples(io.BytesIO(data), out, quads=False)
+    assert out.getvalue().decode() == "".join(
+        map(ntriples.statement_to_nt, default_graph)
+    )
+
+
+def test_jelly_to_ntriples_star() -> None:
+    statements = list(ntriples.parse_lines(STAR.splitlines()))
+    out = io.BytesIO()
+    assert ntriples.jelly_to_ntriples(io.BytesIO(jelly_bytes(statements)), out) == 2
+    assert list(ntriples.parse_lines(io.StringIO(out.getvalue().decode()))) == (
+        statements
+    )
+
+
+def test_ntriples_chunks_graphs_stream() -> None:
+    options = ParserOptions(
+        stream_types=StreamTypes(
+            physical_type=jelly.PHYSICAL_STREAM_TYPE_GRAPHS,
+            logical_type=jelly.LOGICAL_STREAM_TYPE_DATASETS,
+        ),
+        lookup_preset=LookupPreset.small(),
+        params=StreamParameters(namespace_declarations=True),
+    )
+    iri = jelly.RdfIri(prefix_id=1, name_id=1)
+    triple = jelly.RdfTriple(s_bnode="b", p_iri=iri, o_bnode="c")
+    frame = jelly.RdfStreamFrame(
+        rows=[
+            jelly.RdfStreamRow(prefix=jelly.RdfPrefixEntry(value=EX)),
+            jelly.RdfStreamRow(name=jelly.RdfNameEntry(value="g")),
+            jelly.RdfStreamRow(
+                namespace=jelly.RdfNamespaceDeclaration(name="ex", value=iri)
+            ),
+            jelly.RdfStreamRow(
+                graph_start=jelly.RdfGraphStart(g_iri=jelly.RdfIri(name_id=1))
+            ),
+            jelly.RdfStreamRow(triple=triple),
+            jelly.RdfStreamRow(graph_end=jelly.RdfGraphEnd()),
+            jelly.RdfStreamRow(
+                graph_start=jelly.RdfGraphStart(g_default_graph=jelly.RdfDefaultGraph())
+            ),
+            jelly.RdfStreamRow(triple=triple),
+            jelly.RdfStreamRow(graph_end=jelly.RdfGraphEnd()),
+        ]
+    )
+    assert list(ntriples.ntriples_chunks([frame, frame], options)) == [
+        f"_:b <{EX}g> _:c <{EX}g> .\n_:b <{EX}g> _:c .\n" * 2
+    ]
+    outside = jelly.RdfStreamFrame(rows=[jelly.RdfStreamRow(triple=triple)])
+    with pytest.raises(JellyConformanceError, match="new graph was not started"):
+        list(ntriples.ntriples_chunks([frame, outside], options))
+
+
+def test_iri_cache_follows_prefix_changes() -> None:
+    options = ParserOptions(
+        stream_types=StreamTypes(
+            physical_type=jelly.PHYSICAL_STREAM_TYPE_TRIPLES,
+            logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_TRIPLES,
+        ),
+        lookup_preset=LookupPreset(max_names=8, max_prefixes=2, max_datatypes=0),
+        params=StreamParameters(),
+    )
+
+    def triple(prefix_id: int) -> jelly.RdfStreamRow:
+        iri = jelly.RdfIri(prefix_id=prefix_id, name_id=1)
+        return jelly.RdfStreamRow(
+            triple=jelly.RdfTriple(s_iri=iri, p_iri=iri, o_bnode="o")
+        )
+
+    # One name slot is combined with alternating and reassigned prefixes
+    frame = jelly.RdfStreamFrame(
+        rows=[
+            jelly.RdfStreamRow(prefix=jelly.RdfPrefixEntry(value="http://a/")),
+            jelly.RdfStreamRow(prefix=jelly.RdfPrefixEntry(value="http://b/")),
+            jelly.RdfStreamRow(name=jelly.RdfNameEntry(value="x")),
+            triple(1),
+            triple(2),
+            triple(1),
+            jelly.RdfStreamRow(prefix=jelly.RdfPrefixEntry(id=1, value="http://c/")),
+            triple(1),
+        ]
+    )
+    adapter = ntriples.NTriplesAdapter(options)
+    decoder = ntriples.NTriplesDecoder(adapter)
+    lines = [row for row in decoder.iter_rows(frame) if row is not None]
+    assert lines == [f"<http://{host}/x> <http://{host}/x> _:o .\n" for host in "abac"]
+    assert len(decoder.iris) == 8
+    assert sum(entry is not None for entry in decoder.iris) == 1
@@ -1,8 +1,45 @@
+from __future__ import annotations
+
+import io
+from collections.abc import Iterable
+from typing import Any, cast
+
 import pytest
-from rdflib import Graph
+from rdflib import XSD, Dataset, Graph, Literal, URIRef
 from rdflib.parser import InputSource
+from rdflib.plugins.stores.memory import Memory
+
+from pyjelly.integrations.rdflib.parse import (
+    RDFLibJellyParser,
+    Triple,
+    TrustedLiteral,
+    add_statements,
+    parse_jelly_flat,
+    parse_jelly_grouped,
+    parse_jelly_to_graph,
+)
+
+EX = "http://example.org/"
+
+
+class RecordingMemory(Memory):
+    """Memory store recording the size of every addN batch."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[int] = []
 
-from pyjelly.integrations.rdflib.parse import RDFLibJellyParser
+    def addN(self, quads: Iterable[Any]) -> None:  # noqa: N802
+        quads = list(quads)
+        self.batches.append(len(quads))
+        super().addN(quads)
+
+
+def _graph(count: int) -> Graph:
+    graph = Graph()
+    for i in range(count):
+        graph.add((URIRef(f"{EX}s{i}"), URIRef(f"{EX}p"), Literal(i)))
+    return graph
 
 
 def test_parse_raises_type_no_bytestream() -> None:
@@ -15,3 +52,91 @@ def test_parse_raises_type_no_bytestream() -> None:
 
     with pytest.raises(TypeError, match="expected source to be a stream of bytes"):
         parser.parse(source, sink)
+
+
+def test_parse_to_graph_adds_in_batches() -> None:
+    graph = _graph(10)
+    data = graph.serialize(format="jelly", encoding="jelly")
+    store = RecordingMemory()
+    parsed = parse_jelly_to_graph(
+        io.BytesIO(data), graph_factory=lambda: Graph(store=store), batch_size=3
+    )
+    assert store.batches == [3, 3, 3, 1]
+    assert set(parsed) == set(graph)
+
+
+def test_parse_grouped_dataset_caches_contexts() -> None:
+    dataset = Dataset()
+    for i in range(12):
+        dataset.graph(URIRef(f"{EX}g{i % 3}")).add(
+            (URIRef(f"{EX}s{i}"), URIRef(f"{EX}p"), Literal(i))
+        )
+    data = dataset.serialize(format="jelly", encoding="jelly")
+    store = RecordingMemory()
+    [parsed] = parse_jelly_grouped(
+        io.BytesIO(data), dataset_factory=lambda: Dataset(store=store), batch_size=5
+    )
+    assert store.batches == [5, 5, 2]
+    assert isinstance(parsed, Dataset)
+    assert set(parsed.quads()) == set(dataset.quads())
+
+
+def test_rdflib_parser_adds_in_batches_to_user_store() -> None:
+    graph = _graph(7)
+    data = graph.serialize(format="jelly", encoding="jelly")
+    store = RecordingMemory()
+    parsed = Graph(store=store).parse(data=data, format="jelly", batch_size=2)
+    assert store.batches == [2, 2, 2, 1]
+    assert set(parsed) == set(graph)
+
+
+def test_add_statements_rejects_empty_batch() -> None:
+    with pytest.raises(ValueError, match="must be positive"):
+        add_statements(Graph(), [], batch_size=0)
+
+
+def _literals(data: bytes, *, trusted: bool) -> list[Literal]:
+    objects = [
+        statement[2]
+        for statement in parse_jelly_flat(io.BytesIO(data), trusted=trusted)
+        if isinstance(statement, Triple)
+    ]
+    assert all(isinstance(o, Literal) for o in objects)
+    return cast(list[Literal], objects)
+
+
+def test_trusted_parse_matches_strict() -> None:
+    graph = _graph(10)
+    graph.add(
+        (
+            URIRef(f"{EX}s"),
+            URIRef(f"{EX}date"),
+            Literal("2024-01-02", datatype=XSD.date),
+        )
+    )
+    graph.add((URIRef(f"{EX}s"), URIRef(f"{EX}label"), Literal("chat", lang="fr")))
+    graph.add((URIRef(f"{EX}s"), URIRef(f"{EX}plain"), Literal("plain")))
+    data = graph.serialize(format="jelly", encoding="utf-8")
+
+    validated = list(parse_jelly_flat(io.BytesIO(data)))
+    trusted = list(parse_jelly_flat(io.BytesIO(data), trusted=True))
+    assert trusted == validated
+    assert set(trusted) == set(graph)
+    for expected, literal in zip(
+        _literals(data, trusted=False), _literals(data, trusted=True), strict=True
+    ):
+        assert isinstance(literal, TrustedLiteral)
+        assert literal.value == expected.value
+        assert literal.language == expected.language
+        assert literal.ill_typed == expected.ill_typed
+        assert hash(literal) == hash(expected)
+
+    trusted_graph = parse_jelly_to_graph(io.BytesIO(data), trusted=True)
+    assert len(trusted_graph) == len(graph)
+
+
+def test_trusted_literal_caches_datatypes() -> None:
+    data = _graph(5).serialize(format="jelly", encoding="utf-8")
+    objects = _literals(data, trusted=True)
+    assert len({id(o.datatype) for o in objects}) == 1
+    assert objects[0].datatype == XSD.integer
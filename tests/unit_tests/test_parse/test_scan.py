@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from pyjelly import jelly
+from pyjelly.errors import JellyConformanceError
+from pyjelly.integrations.generic.generic_sink import (
+    IRI,
+    BlankNode,
+    DefaultGraph,
+    GenericStatementSink,
+    GraphName,
+    Literal,
+    Quad,
+    Triple,
+)
+from pyjelly.integrations.generic.parse import parse_jelly_flat
+from pyjelly.integrations.generic.serialize import (
+    flat_stream_to_file,
+    grouped_stream_to_file,
+)
+from pyjelly.options import LookupPreset, StreamParameters, StreamTypes
+from pyjelly.parse.decode import ParserOptions
+from pyjelly.parse.scan import StreamScanner, scan_stream, validate_stream
+from pyjelly.serialize.ioutils import write_delimited
+from pyjelly.serialize.streams import SerializerOptions
+
+EX = "http://example.org/"
+
+
+def make_triples(count: int) -> list[Triple]:
+    return [
+        Triple(
+            IRI(f"{EX}s{i % 7}"),
+            IRI(f"{EX}p{i % 3}"),
+            Literal(str(i), datatype="http://www.w3.org/2001/XMLSchema#integer")
+            if i % 2
+            else BlankNode(f"b{i}"),
+        )
+        for i in range(count)
+    ]
+
+
+def serialize_triples(triples: list[Triple], frame_size: int = 10) -> bytes:
+    out = io.BytesIO()
+    options = SerializerOptions(
+        logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_TRIPLES,
+        frame_size=frame_size,
+        lookup_preset=LookupPreset.small(),
+        params=StreamParameters(namespace_declarations=True),
+    )
+    flat_stream_to_file((t for t in triples), out, options)
+    return out.getvalue()
+
+
+def test_scan_counts_match_decoding() -> None:
+    data = serialize_triples(make_triples(100))
+    stats = scan_stream(io.BytesIO(data))
+
+    decoded = list(parse_jelly_flat(io.BytesIO(data)))
+    assert stats.statements == len(decoded) == 100
+    assert stats.totals.triples == 100
+    assert stats.totals.quads == 0
+    assert stats.totals.options == 1
+    assert stats.graph_starts == 0
+    assert stats.predicates is None
+    assert len(stats.frames) > 1
+    assert sum(frame.rows for frame in stats.frames) == stats.totals.rows
+    assert stats.totals.name_entries > 0
+    assert stats.totals.prefix_entries > 0
+    assert stats.totals.datatype_entries == 1
+
+
+def test_scan_collects_predicates() -> None:
+    data = serialize_triples(make_triples(50))
+    stats = scan_stream(io.BytesIO(data), predicates=True)
+    assert stats.predicates == {f"{EX}p0", f"{EX}p1", f"{EX}p2"}
+
+
+def test_scan_quads_and_namespaces() -> None:
+    sink = GenericStatementSink()
+    sink.bind("ex", IRI(EX))
+    sink.add(Quad(IRI(f"{EX}s"), IRI(f"{EX}p"), IRI(f"{EX}o"), DefaultGraph))
+    sink.add(Quad(IRI(f"{EX}s"), IRI(f"{EX}p"), IRI(f"{EX}o"), IRI(f"{EX}g")))
+    out = io.BytesIO()
+    options = SerializerOptions(
+        logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_QUADS,
+        params=StreamParameters(namespace_declarations=True),
+    )
+    grouped_stream_to_file((s for s in [sink]), out, options=options)
+
+    stats = validate_stream(io.BytesIO(out.getvalue()), predicates=True)
+    assert stats.totals.quads == 2
+    assert stats.namespaces == 1
+    assert stats.predicates == {f"{EX}p"}
+
+
+def test_scan_counts_distinct_graphs() -> None:
+    graphs: list[GraphName] = [
+        DefaultGraph,
+        IRI(f"{EX}g1"),
+        IRI(f"{EX}g2"),
+        BlankNode("g"),
+        Literal("g", datatype=f"{EX}dt"),
+    ]
+    quads = [
+        Quad(IRI(f"{EX}s{i}"), IRI(f"{EX}p"), IRI(f"{EX}o"), graphs[i % 5])
+        for i in range(40)
+    ]
+    out = io.BytesIO()
+    options = SerializerOptions(
+        logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_QUADS,
+        frame_size=7,
+        lookup_preset=LookupPreset.small(),
+        params=StreamParameters(generalized_statements=True),
+    )
+    flat_stream_to_file((q for q in quads), out, options)
+
+    stats = scan_stream(io.BytesIO(out.getvalue()), graphs=True)
+    assert stats.graph_starts == 0
+    assert stats.graphs is not None
+    assert len(stats.graphs) == len(graphs)
+    assert scan_stream(io.BytesIO(out.getvalue())).graphs is None
+
+    scanner = StreamScanner(
+        ParserOptions(
+            stream_types=StreamTypes(
+                physical_type=jelly.PHYSICAL_STREAM_TYPE_GRAPHS,
+                logical_type=jelly.LOGICAL_STREAM_TYPE_DATASETS,
+            ),
+            lookup_preset=LookupPreset.small(),
+            params=StreamParameters(),
+        ),
+        graphs=True,
+    )
+    starts = [
+        jelly.RdfGraphStart(g_bnode="a"),
+        jelly.RdfGraphStart(g_default_graph=jelly.RdfDefaultGraph()),
+        jelly.RdfGraphStart(g_bnode="a"),
+    ]
+    frame = jelly.RdfStreamFrame(
+        rows=[
+            row
+            for start in starts
+            for row in (
+                jelly.RdfStreamRow(graph_start=start),
+                jelly.RdfStreamRow(graph_end=jelly.RdfGraphEnd()),
+            )
+        ]
+    )
+    stats = scanner.scan_frames([frame])
+    assert stats.graph_starts == 3
+    assert stats.graphs == {("bnode", "a"), ("default",)}
+
+
+def test_validate_accepts_valid_stream() -> None:
+    data = serialize_triples(make_triples(30))
+    stats = validate_stream(io.BytesIO(data))
+    assert stats.statements == 30
+
+
+def triples_options() -> ParserOptions:
+    return ParserOptions(
+        stream_types=StreamTypes(
+            physical_type=jelly.PHYSICAL_STREAM_TYPE_TRIPLES,
+            logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_TRIPLES,
+        ),
+        lookup_preset=LookupPreset.small(),
+        params=StreamParameters(),
+    )
+
+
+@pytest.mark.parametrize(
+    ("rows", "reason"),
+    [
+        pytest.param(
+            [jelly.RdfStreamRow(triple=jelly.RdfTriple(s_bnode="b"))],
+            "missing repeated term predicate",
+            id="repeated-term-at-start",
+        ),
+        pytest.param(
+            [
+                jelly.RdfStreamRow(
+                    triple=jelly.RdfTriple(
+                        s_bnode="b",
+                        p_iri=jelly.RdfIri(name_id=3),
+                        o_bnode="c",
+                    )
+                )
+            ],
+            "invalid resolved index 3",
+            id="unknown-lookup-reference",
+        ),
+        pytest.param(
+            [
+                jelly.RdfStreamRow(
+                    quad=jelly.RdfQuad(s_bnode="b", p_bnode="c", o_bnode="d")
+                )
+            ],
+            "quad row is not allowed",
+            id="quad-in-triples-stream",
+        ),
+        pytest.param(
+            [jelly.RdfStreamRow(graph_end=jelly.RdfGraphEnd())],
+            "graph end row is not allowed",
+            id="graph-end-in-triples-stream",
+        ),
+        pytest.param(
+            [
+                jelly.RdfStreamRow(
+                    triple=jelly.RdfTriple(
+                        s_triple_term=jelly.RdfTriple(s_bnode="b"),
+                        p_bnode="c",
+                        o_bnode="d",
+                    )
+                )
+            ],
+            "repeated terms are not allowed in quoted triples",
+            id="repeated-term-in-quoted-triple",
+        ),
+    ],
+)
+def test_validate_rejects(rows: list[jelly.RdfStreamRow], reason: str) -> None:
+    scanner = StreamScanner(triples_options(), validate=True)
+    frame = jelly.RdfStreamFrame(rows=rows)
+    with pytest.raises(JellyConformanceError, match=reason) as excinfo:
+        scanner.scan_frames([frame])
+    assert str(excinfo.value).startswith("frame 0, row 0: ")
+
+
+def test_scan_without_validation_skips_term_checks() -> None:
+    scanner = StreamScanner(triples_options())
+    frame = jelly.RdfStreamFrame(
+        rows=[jelly.RdfStreamRow(triple=jelly.RdfTriple(s_bnode="b"))]
+    )
+    stats = scanner.scan_frames([frame])
+    assert stats.statements == 1
+
+
+def test_validate_rejects_unterminated_graph() -> None:
+    options = ParserOptions(
+        stream_types=StreamTypes(
+            physical_type=jelly.PHYSICAL_STREAM_TYPE_GRAPHS,
+            logical_type=jelly.LOGICAL_STREAM_TYPE_DATASETS,
+        ),
+        lookup_preset=LookupPreset.small(),
+        params=StreamParameters(),
+    )
+    scanner = StreamScanner(options, validate=True)
+    frame = jelly.RdfStreamFrame(
+        rows=[
+            jelly.RdfStreamRow(
+                graph_start=jelly.RdfGraphStart(g_default_graph=jelly.RdfDefaultGraph())
+            ),
+            jelly.RdfStreamRow(
+                triple=jelly.RdfTriple(s_bnode="b", p_bnode="c", o_bnode="d")
+            ),
+        ]
+    )
+    with pytest.raises(JellyConformanceError, match="missing graph end"):
+        scanner.scan_frames([frame])
+
+
+def test_validate_rejects_graph_start_without_graph() -> None:
+    options = ParserOptions(
+        stream_types=StreamTypes(
+            physical_type=jelly.PHYSICAL_STREAM_TYPE_GRAPHS,
+            logical_type=jelly.LOGICAL_STREAM_TYPE_DATASETS,
+        ),
+        lookup_preset=LookupPreset.small(),
+        params=StreamParameters(),
+    )
+    scanner = StreamScanner(options, validate=True)
+    frame = jelly.RdfStreamFrame(
+        rows=[jelly.RdfStreamRow(graph_start=jelly.RdfGraphStart())]
+    )
+    with pytest.raises(JellyConformanceError, match="row 0: graph start without"):
+        scanner.scan_frames([frame])
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        pytest.param(
+            jelly.RdfStreamOptions(
+                physical_type=jelly.PHYSICAL_STREAM_TYPE_TRIPLES,
+                logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_TRIPLES,
+                max_name_table_size=5000,
+                version=1,
+            ),
+            id="name-table-too-large",
+        ),
+        pytest.param(
+            jelly.RdfStreamOptions(
+                physical_type=jelly.PHYSICAL_STREAM_TYPE_TRIPLES,
+                logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_QUADS,
+                max_name_table_size=128,
+                version=1,
+            ),
+            id="incompatible-types",
+        ),
+    ],
+)
+def test_validate_rejects_invalid_options(options: jelly.RdfStreamOptions) -> None:
+    out = io.BytesIO()
+    frame = jelly.RdfStreamFrame(rows=[jelly.RdfStreamRow(options=options)])
+    write_delimited(frame, out)
+    with pytest.raises(JellyConformanceError, match="invalid stream options"):
+        validate_stream(io.BytesIO(out.getvalue()))
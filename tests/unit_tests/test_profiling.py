@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import io
+
+from pyjelly import jelly
+from pyjelly.integrations.generic.generic_sink import IRI, Literal, Triple
+from pyjelly.integrations.generic.parse import parse_jelly_flat
+from pyjelly.integrations.generic.serialize import flat_stream_to_file
+from pyjelly.profiling import (
+    DECODE,
+    DECODE_LOOKUP,
+    ENCODE,
+    ENCODE_LOOKUP,
+    ENCODE_ROWS,
+    FRAME,
+    READ,
+    READ_IO,
+    WRITE,
+    WRITE_IO,
+    Profiler,
+    active_profiler,
+)
+from pyjelly.serialize.streams import SerializerOptions
+
+XSD_INTEGER = "http://www.w3.org/2001/XMLSchema#integer"
+TRIPLES = [
+    Triple(
+        IRI(f"http://example.com/s{i % 7}"),
+        IRI(f"http://example.com/p{i % 3}"),
+        Literal(str(i), datatype=XSD_INTEGER),
+    )
+    for i in range(100)
+]
+
+
+def round_trip() -> list[object]:
+    out = io.BytesIO()
+    options = SerializerOptions(
+        logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_TRIPLES, frame_size=30
+    )
+    flat_stream_to_file((t for t in TRIPLES), out, options)
+    return list(parse_jelly_flat(io.BytesIO(out.getvalue())))
+
+
+def test_profiler_records_all_phases() -> None:
+    with Profiler() as profiler:
+        assert active_profiler() is profiler
+        statements = round_trip()
+    assert active_profiler() is None
+    assert len(statements) == len(TRIPLES)
+
+    totals = profiler.totals()
+    assert set(totals) == {
+        ENCODE,
+        ENCODE_LOOKUP,
+        ENCODE_ROWS,
+        FRAME,
+        WRITE,
+        WRITE_IO,
+        READ,
+        READ_IO,
+        DECODE,
+        DECODE_LOOKUP,
+    }
+    assert totals[ENCODE][1] == len(TRIPLES)
+    assert totals[ENCODE_ROWS][1] == len(TRIPLES)
+    assert totals[FRAME][1] == totals[WRITE][1]
+    for phase, parent in ((ENCODE_LOOKUP, ENCODE), (DECODE_LOOKUP, DECODE)):
+        assert totals[phase][0] <= totals[parent][0]
+
+
+def test_profiler_disabled_outside_block() -> None:
+    with Profiler() as profiler:
+        pass
+    round_trip()
+    assert profiler.totals() == {}
+
+
+def test_profilers_nest() -> None:
+    with Profiler() as outer:
+        with Profiler() as inner:
+            assert active_profiler() is inner
+        assert active_profiler() is outer
+    assert active_profiler() is None
+
+
+def test_report() -> None:
+    profiler = Profiler()
+    profiler.add(ENCODE, 3_000_000)
+    profiler.add(ENCODE_LOOKUP, 1_000_000)
+    profiler.add(WRITE, 1_000_000)
+    out = io.StringIO()
+    profiler.report(file=out)
+    header, encode, lookup, write = out.getvalue().splitlines()
+    assert header.split() == ["phase", "total", "ms", "calls", "ns/call", "share"]
+    assert encode.split() == ["encode", "3.0", "1", "3000000", "75.0%"]
+    assert lookup.split() == ["encode.lookup", "1.0", "1", "1000000", "25.0%"]
+    assert lookup.startswith("  ")
+    assert write.split() == ["write", "1.0", "1", "1000000", "25.0%"]
+
+    profiler.reset()
+    assert profiler.totals() == {}
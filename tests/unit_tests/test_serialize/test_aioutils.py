@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import socket
+from collections.abc import AsyncIterator, Iterable
+from typing import Any, cast
+
+import pytest
+from rdflib import Dataset, Graph, Literal, Namespace
+
+from pyjelly import jelly
+from pyjelly.integrations.generic import serialize as gserialize
+from pyjelly.integrations.generic.generic_sink import (
+    IRI,
+    GenericStatementSink,
+    Quad,
+    Triple,
+)
+from pyjelly.integrations.generic.parse import parse_jelly_flat, parse_jelly_grouped
+from pyjelly.integrations.rdflib import serialize as rserialize
+from pyjelly.integrations.rdflib.parse import parse_jelly_flat as rdflib_parse_flat
+from pyjelly.parse.ioutils import get_options_and_frames
+from pyjelly.serialize.aioutils import encode_statements, write_statements_async
+from pyjelly.serialize.streams import SerializerOptions, Stream, TripleStream
+
+EX = "http://example.org/"
+
+
+class RecordingWriter:
+    """Collect written bytes and count drain() calls."""
+
+    def __init__(self) -> None:
+        self.buffer = io.BytesIO()
+        self.writes = 0
+        self.drains = 0
+
+    def write(self, data: bytes) -> None:
+        self.writes += 1
+        self.buffer.write(data)
+
+    async def drain(self) -> None:
+        assert self.drains == self.writes - 1, "drain() must follow each write"
+        self.drains += 1
+
+
+def as_writer(writer: RecordingWriter) -> asyncio.StreamWriter:
+    return cast(asyncio.StreamWriter, writer)
+
+
+async def aiterate(items: Iterable[Any]) -> AsyncIterator[Any]:
+    for item in items:
+        yield item
+
+
+def generic_triples(count: int) -> list[Triple]:
+    return [
+        Triple(IRI(f"{EX}s{i}"), IRI(f"{EX}p"), IRI(f"{EX}o{i % 5}"))
+        for i in range(count)
+    ]
+
+
+def triples_options(frame_size: int = 8) -> SerializerOptions:
+    return SerializerOptions(
+        logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_TRIPLES, frame_size=frame_size
+    )
+
+
+@pytest.mark.parametrize("offload", [False, True])
+def test_generic_flat_async_matches_sync(*, offload: bool) -> None:
+    triples = generic_triples(50)
+    writer = RecordingWriter()
+    asyncio.run(
+        gserialize.flat_stream_to_file_async(
+            aiterate(triples), as_writer(writer), triples_options(), offload=offload
+        )
+    )
+    expected = io.BytesIO()
+    gserialize.flat_stream_to_file((t for t in triples), expected, triples_options())
+
+    data = writer.buffer.getvalue()
+    assert list(parse_jelly_flat(io.BytesIO(data))) == triples
+    frames = list(get_options_and_frames(io.BytesIO(data))[1])
+    assert frames == list(get_options_and_frames(io.BytesIO(expected.getvalue()))[1])
+    assert writer.drains == writer.writes == len(frames)
+
+
+def test_generic_flat_async_empty() -> None:
+    writer = RecordingWriter()
+    asyncio.run(gserialize.flat_stream_to_file_async(aiterate([]), as_writer(writer)))
+    assert writer.buffer.getvalue() == b""
+
+
+@pytest.mark.parametrize("offload", [False, True])
+def test_generic_grouped_async(*, offload: bool) -> None:
+    sinks = []
+    for graph in range(3):
+        sink = GenericStatementSink()
+        for i in range(4):
+            sink.add(
+                Quad(
+                    IRI(f"{EX}s{i}"), IRI(f"{EX}p"), IRI(f"{EX}o"), IRI(f"{EX}g{graph}")
+                )
+            )
+        sinks.append(sink)
+    writer = RecordingWriter()
+    asyncio.run(
+        gserialize.grouped_stream_to_file_async(
+            aiterate(sinks), as_writer(writer), offload=offload
+        )
+    )
+    parsed = list(parse_jelly_grouped(io.BytesIO(writer.buffer.getvalue())))
+    assert [list(sink) for sink in parsed] == [list(sink) for sink in sinks]
+
+
+def test_write_statements_batches_respect_frame_size() -> None:
+    stream = TripleStream.for_rdflib(triples_options(frame_size=5))
+    writer = RecordingWriter()
+    graph = Graph()
+    for i in range(23):
+        graph.add((Namespace(EX)[f"s{i}"], Namespace(EX).p, Literal(i)))
+    asyncio.run(
+        write_statements_async(stream, aiterate(graph), as_writer(writer), batch_size=3)
+    )
+    frames = list(get_options_and_frames(io.BytesIO(writer.buffer.getvalue()))[1])
+    assert len(frames) > 1
+    assert set(rdflib_parse_flat(io.BytesIO(writer.buffer.getvalue()))) == set(graph)
+
+
+def test_encode_statements_rejects_unknown_stream() -> None:
+    with pytest.raises(TypeError, match="invalid stream implementation"):
+        encode_statements(cast(Stream, object()), [])
+
+
+def test_rdflib_async_over_socket() -> None:
+    ex = Namespace(EX)
+    dataset = Dataset()
+    for i in range(20):
+        dataset.graph(ex[f"g{i % 2}"]).add((ex[f"s{i}"], ex.p, Literal(i)))
+    left, right = socket.socketpair()
+
+    async def main() -> None:
+        _, writer = await asyncio.open_connection(sock=left)
+        await rserialize.flat_stream_to_file_async(
+            aiterate(dataset.quads()), writer, offload=True
+        )
+        writer.close()
+        await writer.wait_closed()
+
+    received = io.BytesIO()
+    try:
+        asyncio.run(main())
+        while chunk := right.recv(65536):
+            received.write(chunk)
+    finally:
+        right.close()
+    parsed = Dataset()
+    parsed.parse(io.BytesIO(received.getvalue()), format="jelly")
+    assert set(parsed.quads()) == set(dataset.quads())
+
+
+def test_rdflib_grouped_async() -> None:
+    ex = Namespace(EX)
+    graphs = []
+    for i in range(3):
+        graph = Graph()
+        graph.add((ex[f"s{i}"], ex.p, Literal(i)))
+        graphs.append(graph)
+    writer = RecordingWriter()
+    asyncio.run(
+        rserialize.grouped_stream_to_file_async(aiterate(graphs), as_writer(writer))
+    )
+    frames = list(get_options_and_frames(io.BytesIO(writer.buffer.getvalue()))[1])
+    assert len(frames) == writer.drains == 3
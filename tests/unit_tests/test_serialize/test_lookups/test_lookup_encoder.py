@@ -206,3 +206,22 @@ def test_encode_datatype_term_index(subtests: SubTests) -> None:
         with patch.object(encoder, "encode_term_index") as mock:
             encoder.encode_datatype_term_index("foo")
             mock.assert_not_called()
+
+
+def test_byte_size_tracks_evictions() -> None:
+    encoder = LookupEncoder(lookup_size=2)
+    encoder.encode_entry_index("a")
+    encoder.lookup.track_size()
+    for key in ("bé", "ccc", "bé", "dddd"):
+        encoder.encode_entry_index(key)
+        assert encoder.byte_size() == sum(len(k.encode()) for k in encoder.lookup.data)
+    assert encoder.byte_size() == len("bé".encode()) + len("dddd")
+
+
+def test_byte_size_without_tracking() -> None:
+    encoder = LookupEncoder(lookup_size=2)
+    for key in ("a", "bb", "ccc"):
+        encoder.encode_entry_index(key)
+    assert not encoder.lookup.tracks_size
+    assert encoder.lookup.total_size == 0
+    assert encoder.byte_size() == len("bb") + len("ccc")
@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+
 import pytest
 from rdflib import BNode, Graph
 from rdflib.graph import QuotedGraph
@@ -17,6 +19,9 @@ def test_stream_frames_raise_unregistered() -> None:
         def __init__(self) -> None:
             pass
 
+        def encode_statement(self, terms: Iterable[object]) -> None:
+            pass
+
     dummy = DummyStream()
     with pytest.raises(TypeError, match="invalid stream implementation"):
         list(stream_frames(dummy, Graph()))
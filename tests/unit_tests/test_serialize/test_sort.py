@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import io
+import pickle
+import random
+
+import pytest
+from rdflib import Dataset, URIRef
+from rdflib import Literal as RDFLibLiteral
+
+from pyjelly import jelly
+from pyjelly.integrations.generic import serialize as gserialize
+from pyjelly.integrations.generic.generic_sink import (
+    IRI,
+    DefaultGraph,
+    Literal,
+    Prefix,
+    Quad,
+    Triple,
+)
+from pyjelly.integrations.generic.parse import parse_jelly_flat
+from pyjelly.integrations.generic.serialize import GenericSinkTermEncoder, stream_frames
+from pyjelly.integrations.rdflib import serialize as rserialize
+from pyjelly.integrations.rdflib.parse import Quad as RDFLibQuad
+from pyjelly.integrations.rdflib.parse import Triple as RDFLibTriple
+from pyjelly.integrations.rdflib.parse import parse_jelly_flat as rdflib_parse_flat
+from pyjelly.integrations.rdflib.serialize import stream_frames as rdflib_stream_frames
+from pyjelly.parse.scan import scan_stream
+from pyjelly.serialize.ioutils import write_delimited
+from pyjelly.serialize.sort import (
+    DEFAULT_GRAPH_BUFFER,
+    graph_subject_predicate_key,
+    group_by_graph,
+    sort_statements,
+)
+from pyjelly.serialize.streams import GraphStream, SerializerOptions
+
+EX = "http://example.org/"
+
+
+def shuffled_triples(count: int) -> list[Triple]:
+    triples = [
+        Triple(IRI(f"{EX}s{i % 37}"), IRI(f"{EX}p{i % 5}"), Literal(str(i)))
+        for i in range(count)
+    ]
+    random.Random(0).shuffle(triples)  # noqa: S311
+    return triples
+
+
+@pytest.mark.parametrize("max_in_memory", [1, 7, 100, 1000])
+def test_sort_statements_matches_sorted(max_in_memory: int) -> None:
+    triples = shuffled_triples(500)
+    result = list(sort_statements(triples, max_in_memory=max_in_memory))
+    assert result == sorted(triples, key=graph_subject_predicate_key)
+
+
+def test_sort_statements_is_stable() -> None:
+    triples = shuffled_triples(200)
+    result = list(sort_statements(triples, max_in_memory=16))
+    for s, p in {(t.s, t.p) for t in triples}:
+        group = [t for t in result if (t.s, t.p) == (s, p)]
+        assert group == [t for t in triples if (t.s, t.p) == (s, p)]
+
+
+def test_sort_statements_quads_keep_default_graph() -> None:
+    quads = [
+        Quad(IRI(f"{EX}s{i % 3}"), IRI(f"{EX}p"), Literal(str(i)), graph)
+        for i in range(30)
+        for graph in (IRI(f"{EX}g"), DefaultGraph)
+    ]
+    result = list(sort_statements(reversed(quads), max_in_memory=4))
+    assert sorted(map(repr, result)) == sorted(map(repr, quads))
+    assert all(q.g is DefaultGraph for q in result[:30])
+    assert pickle.loads(pickle.dumps(DefaultGraph)) is DefaultGraph  # noqa: S301
+
+
+def test_sort_statements_rejects_empty_buffer() -> None:
+    with pytest.raises(ValueError, match="must be positive"):
+        list(sort_statements([], max_in_memory=0))
+
+
+def test_generic_flat_stream_sorted_is_smaller() -> None:
+    triples = shuffled_triples(2000)
+    unsorted, sorted_ = io.BytesIO(), io.BytesIO()
+    gserialize.flat_stream_to_file((t for t in triples), unsorted)
+    gserialize.flat_stream_to_file((t for t in triples), sorted_, sort_buffer=300)
+    assert len(sorted_.getvalue()) < len(unsorted.getvalue())
+
+    sorted_.seek(0)
+    parsed = [s for s in parse_jelly_flat(sorted_) if not isinstance(s, Prefix)]
+    assert parsed == sorted(triples, key=graph_subject_predicate_key)
+
+
+def test_rdflib_flat_stream_sorted() -> None:
+    triples = [
+        RDFLibTriple(
+            URIRef(f"{EX}s{i % 11}"), URIRef(f"{EX}p{i % 3}"), RDFLibLiteral(i)
+        )
+        for i in range(300)
+    ]
+    random.Random(1).shuffle(triples)  # noqa: S311
+    out = io.BytesIO()
+    rserialize.flat_stream_to_file((t for t in triples), out, sort_buffer=50)
+    out.seek(0)
+    parsed = [tuple(t) for t in rdflib_parse_flat(out)]
+    assert parsed == sorted(triples, key=graph_subject_predicate_key)
+    quad = RDFLibQuad(*triples[0], URIRef(f"{EX}g"))
+    assert pickle.loads(pickle.dumps(quad)) == quad  # noqa: S301
+
+
+def interleaved_quads(count: int, graphs: int) -> list[Quad]:
+    return [
+        Quad(
+            IRI(f"{EX}s{i}"), IRI(f"{EX}p"), Literal(str(i)), IRI(f"{EX}g{i % graphs}")
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("max_in_memory", [1, 5, 64, 10_000])
+def test_group_by_graph_emits_each_graph_once(max_in_memory: int) -> None:
+    quads = interleaved_quads(300, 4)
+    groups = [
+        (graph, list(triples))
+        for graph, triples in group_by_graph(quads, max_in_memory=max_in_memory)
+    ]
+    assert [graph for graph, _ in groups] == [IRI(f"{EX}g{i}") for i in range(4)]
+    for graph, triples in groups:
+        assert triples == [tuple(q[:3]) for q in quads if q.g == graph]
+
+
+def test_group_by_graph_rejects_empty_buffer() -> None:
+    with pytest.raises(ValueError, match="must be positive"):
+        list(group_by_graph([], max_in_memory=0))
+
+
+@pytest.mark.parametrize("graph_buffer", [3, DEFAULT_GRAPH_BUFFER])
+def test_generic_graphs_stream_from_unsorted_quads(graph_buffer: int) -> None:
+    quads = interleaved_quads(100, 3)
+    options = SerializerOptions(
+        logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_QUADS, graph_buffer=graph_buffer
+    )
+    stream = GraphStream(encoder=GenericSinkTermEncoder(), options=options)
+    rows = [
+        row for frame in stream_frames(stream, (q for q in quads)) for row in frame.rows
+    ]
+    kinds = [row.WhichOneof("row") for row in rows]
+    assert kinds.count("graph_start") == kinds.count("graph_end") == 3
+
+    out = io.BytesIO()
+    for frame in stream_frames(
+        GraphStream(encoder=GenericSinkTermEncoder(), options=options),
+        (q for q in quads),
+    ):
+        write_delimited(frame, out)
+    out.seek(0)
+    parsed = [s for s in parse_jelly_flat(out) if not isinstance(s, Prefix)]
+    assert sorted(map(repr, parsed)) == sorted(map(repr, quads))
+
+
+def test_rdflib_graphs_stream_from_unsorted_quads() -> None:
+    quads = [
+        RDFLibQuad(
+            URIRef(f"{EX}s{i}"),
+            URIRef(f"{EX}p"),
+            RDFLibLiteral(i),
+            URIRef(f"{EX}g{i % 3}"),
+        )
+        for i in range(50)
+    ]
+    options = SerializerOptions(
+        logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_QUADS, graph_buffer=4
+    )
+    stream = GraphStream.for_rdflib(options=options)
+    out = io.BytesIO()
+    for frame in rdflib_stream_frames(stream, (q for q in quads)):
+        write_delimited(frame, out)
+    dataset = Dataset()
+    dataset.parse(data=out.getvalue(), format="jelly")
+    assert set(dataset) == {tuple(q) for q in quads}
+
+
+def test_rdflib_graphs_stream_keeps_duplicate_quads() -> None:
+    quad = RDFLibQuad(
+        URIRef(f"{EX}s"), URIRef(f"{EX}p"), RDFLibLiteral(1), URIRef(f"{EX}g")
+    )
+    options = SerializerOptions(logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_QUADS)
+    stream = GraphStream.for_rdflib(options=options)
+    out = io.BytesIO()
+    for frame in rdflib_stream_frames(stream, (q for q in [quad, quad])):
+        write_delimited(frame, out)
+    out.seek(0)
+    assert scan_stream(out).totals.triples == 2
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import io
+
 import pytest
 
 from pyjelly import jelly
 from pyjelly.errors import JellyAssertionError
+from pyjelly.integrations.generic.generic_sink import IRI, Literal, Triple
+from pyjelly.integrations.generic.parse import parse_jelly_grouped
+from pyjelly.integrations.generic.serialize import (
+    GenericSinkTermEncoder,
+    flat_stream_to_file,
+)
 from pyjelly.options import StreamParameters
 from pyjelly.serialize.encode import TermEncoder
 from pyjelly.serialize.flows import (
+    DEFAULT_FRAME_SIZE,
     DatasetsFrameFlow,
     FlatQuadsFrameFlow,
     FlatTriplesFrameFlow,
@@ -23,6 +32,8 @@ from pyjelly.serialize.streams import (
     TripleStream,
 )
 
+EX = "http://example.org/"
+
 
 def test_flat_triples_inference_delimited() -> None:
     stream = TripleStream(encoder=TermEncoder(), options=None)
@@ -106,3 +117,96 @@ def test_wrong_inference(
                 params=StreamParameters(delimited=False),
             ),
         )
+
+
+def _reorder_triples(count: int) -> list[Triple]:
+    # Round-robin over subjects, the worst order for repeated-term elision
+    return [
+        Triple(IRI(f"{EX}s{i % 10}"), IRI(f"{EX}p{i % 3}"), Literal(str(i)))
+        for i in range(count)
+    ]
+
+
+def _encode_reorder_triples(*, reorder: bool) -> tuple[TripleStream, int]:
+    options = SerializerOptions(
+        logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_TRIPLES,
+        frame_size=100,
+        reorder=reorder,
+    )
+    stream = TripleStream(encoder=GenericSinkTermEncoder(), options=options)
+    frames = [frame for t in _reorder_triples(250) if (frame := stream.triple(t))]
+    stream.encode_pending()
+    return stream, len(frames)
+
+
+def test_reorder_counts_elided_terms() -> None:
+    stream, frames = _encode_reorder_triples(reorder=True)
+    assert not stream.pending
+    assert frames == 2
+    assert stream.elided_terms > 200
+
+
+def test_no_reorder_by_default() -> None:
+    assert not SerializerOptions().reorder
+    stream, _ = _encode_reorder_triples(reorder=False)
+    assert stream.elided_terms == 0
+
+
+def test_reorder_within_frames_only() -> None:
+    triples = _reorder_triples(1000)
+    plain, reordered = io.BytesIO(), io.BytesIO()
+    flat_stream_to_file((t for t in triples), plain)
+    options = SerializerOptions(
+        logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_TRIPLES, reorder=True
+    )
+    flat_stream_to_file((t for t in triples), reordered, options)
+    assert len(reordered.getvalue()) < len(plain.getvalue())
+
+    reordered.seek(0)
+    frames = [list(frame) for frame in parse_jelly_grouped(reordered)]
+    assert len(frames) == len(triples) // DEFAULT_FRAME_SIZE
+    for i, frame in enumerate(frames):
+        chunk = triples[i * DEFAULT_FRAME_SIZE : (i + 1) * DEFAULT_FRAME_SIZE]
+        assert frame != chunk
+        assert sorted(frame, key=repr) == sorted(chunk, key=repr)
+
+
+def test_reorder_keeps_graph_boundaries() -> None:
+    options = SerializerOptions(frame_size=7, reorder=True)
+    stream = GraphStream(encoder=GenericSinkTermEncoder(), options=options)
+    graphs = {IRI(f"{EX}g{i}"): _reorder_triples(20) for i in range(3)}
+    rows = [
+        row
+        for graph_id, triples in graphs.items()
+        for frame in stream.graph(graph_id, triples)
+        for row in frame.rows
+    ]
+    rows.extend(stream.flow)
+    kinds = [row.WhichOneof("row") for row in rows]
+    starts = [i for i, kind in enumerate(kinds) if kind == "graph_start"]
+    ends = [i for i, kind in enumerate(kinds) if kind == "graph_end"]
+    assert len(starts) == len(ends) == len(graphs)
+    for start, end in zip(starts, ends, strict=True):
+        assert kinds[start:end].count("triple") == len(graphs[IRI(f"{EX}g0")])
+
+
+def test_reorder_flushes_buffer_when_frame_is_cut() -> None:
+    options = SerializerOptions(
+        logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_TRIPLES,
+        frame_size=100,
+        reorder=True,
+    )
+    stream = TripleStream(encoder=GenericSinkTermEncoder(), options=options)
+    triples = _reorder_triples(30)
+    for triple in triples[:20]:
+        assert stream.triple(triple) is None
+    stream.namespace_declaration("ex", EX)
+    for triple in triples[20:]:
+        assert stream.triple(triple) is None
+    frame = stream.flow.to_stream_frame()
+    assert frame is not None
+    assert not stream.pending
+    kinds = [row.WhichOneof("row") for row in frame.rows]
+    assert kinds.count("triple") == len(triples)
+    # The declaration stays after the statements buffered before it
+    assert kinds[: kinds.index("namespace")].count("triple") == 20
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pytest
+
+from pyjelly import jelly
+from pyjelly.cli import main
+from pyjelly.integrations.generic import ntriples
+from pyjelly.integrations.generic.generic_sink import (
+    IRI,
+    BlankNode,
+    DefaultGraph,
+    Literal,
+    Quad,
+    Triple,
+)
+from pyjelly.integrations.generic.parse import parse_jelly_flat
+from pyjelly.integrations.generic.serialize import flat_stream_to_file
+from pyjelly.options import LookupPreset, StreamParameters, StreamTypes
+from pyjelly.parse.decode import ParserOptions, options_from_frame
+from pyjelly.parse.ioutils import get_options_and_frames
+from pyjelly.parse.scan import scan_stream
+from pyjelly.serialize.streams import SerializerOptions
+from pyjelly.transcode import Transcoder, transcode, transcode_frames
+
+EX = "http://example.com/"
+
+STATEMENTS = [
+    Quad(
+        IRI(f"{EX}s{i % 20}"),
+        IRI(f"http://example.org/{i % 12}/p"),
+        Literal(f"v{i}", datatype=f"{EX}dt{i % 5}")
+        if i % 3
+        else Literal(f"v{i}", langtag="en"),
+        IRI(f"{EX}g") if i % 2 else DefaultGraph,
+    )
+    for i in range(100)
+] + [
+    Quad(
+        Triple(BlankNode("b"), IRI("p"), Literal("o")),
+        IRI(f"{EX}q"),
+        BlankNode("c"),
+        BlankNode("g"),
+    )
+]
+
+
+def jelly_bytes(preset: LookupPreset) -> bytes:
+    out = io.BytesIO()
+    options = SerializerOptions(
+        frame_size=30,
+        lookup_preset=preset,
+        params=StreamParameters(rdf_star=True, generalized_statements=True),
+    )
+    flat_stream_to_file((statement for statement in STATEMENTS), out, options)
+    return out.getvalue()
+
+
+@pytest.mark.parametrize(
+    ("preset", "frame_size"),
+    [
+        (LookupPreset(), 7),
+        (LookupPreset(max_names=8, max_prefixes=8, max_datatypes=2), 1000),
+        (LookupPreset(max_names=8, max_prefixes=0, max_datatypes=2), 20),
+    ],
+)
+@pytest.mark.parametrize("trusted", [False, True])
+def test_transcode(preset: LookupPreset, frame_size: int, *, trusted: bool) -> None:
+    source = jelly_bytes(LookupPreset(max_names=16, max_prefixes=8))
+    out = io.BytesIO()
+    transcode(
+        io.BytesIO(source),
+        out,
+        frame_size=frame_size,
+        lookup_preset=preset,
+        trusted=trusted,
+    )
+    statistics = scan_stream(io.BytesIO(out.getvalue()))
+    assert statistics.options.lookup_preset == preset
+    assert statistics.options.stream_types.logical_type == (
+        jelly.LOGICAL_STREAM_TYPE_FLAT_QUADS
+    )
+    assert all(frame.rows >= frame_size for frame in statistics.frames[:-1])
+    assert list(parse_jelly_flat(io.BytesIO(out.getvalue()))) == STATEMENTS
+
+
+def test_transcode_non_delimited() -> None:
+    source = jelly_bytes(LookupPreset())
+    out = io.BytesIO()
+    transcode(io.BytesIO(source), out, frame_size=10, delimited=False)
+    options, frames = get_options_and_frames(io.BytesIO(out.getvalue()))
+    assert not options.params.delimited
+    assert len(list(frames)) == 1
+    assert list(parse_jelly_flat(io.BytesIO(out.getvalue()))) == STATEMENTS
+
+
+def test_transcode_keeps_graph_frames() -> None:
+    options = ParserOptions(
+        stream_types=StreamTypes(
+            physical_type=jelly.PHYSICAL_STREAM_TYPE_GRAPHS,
+            logical_type=jelly.LOGICAL_STREAM_TYPE_DATASETS,
+        ),
+        lookup_preset=LookupPreset.small(),
+        params=StreamParameters(namespace_declarations=True),
+    )
+    iri = jelly.RdfIri(prefix_id=1, name_id=1)
+    triple = jelly.RdfTriple(s_bnode="b", p_iri=iri, o_bnode="c")
+    frame = jelly.RdfStreamFrame(
+        rows=[
+            jelly.RdfStreamRow(prefix=jelly.RdfPrefixEntry(value=EX)),
+            jelly.RdfStreamRow(name=jelly.RdfNameEntry(value="g")),
+            jelly.RdfStreamRow(
+                namespace=jelly.RdfNamespaceDeclaration(name="ex", value=iri)
+            ),
+            jelly.RdfStreamRow(
+                graph_start=jelly.RdfGraphStart(g_iri=jelly.RdfIri(name_id=1))
+            ),
+            jelly.RdfStreamRow(triple=triple),
+            jelly.RdfStreamRow(graph_end=jelly.RdfGraphEnd()),
+            jelly.RdfStreamRow(
+                graph_start=jelly.RdfGraphStart(g_default_graph=jelly.RdfDefaultGraph())
+            ),
+            jelly.RdfStreamRow(triple=triple),
+            jelly.RdfStreamRow(graph_end=jelly.RdfGraphEnd()),
+        ]
+    )
+    frames = list(
+        transcode_frames([frame, frame], options, frame_size=2, lookup_preset=None)
+    )
+    assert len(frames) == 2
+    output_options = options_from_frame(frames[0], delimited=True)
+    assert output_options.stream_types == options.stream_types
+    assert output_options.params.namespace_declarations
+    assert list(ntriples.ntriples_chunks(frames, output_options)) == list(
+        ntriples.ntriples_chunks([frame, frame], options)
+    )
+
+
+def test_transcoder_physical_type_mismatch() -> None:
+    options, frames = get_options_and_frames(io.BytesIO(jelly_bytes(LookupPreset())))
+    transcoder = Transcoder(
+        StreamTypes(
+            physical_type=jelly.PHYSICAL_STREAM_TYPE_TRIPLES,
+            logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_TRIPLES,
+        ),
+        StreamParameters(),
+    )
+    with pytest.raises(ValueError, match="PHYSICAL_STREAM_TYPE_QUADS"):
+        list(transcoder.transcode(frames, options))
+
+
+def test_cli_cat_transcodes(tmp_path: Path) -> None:
+    part = tmp_path / "part.jelly"
+    part.write_bytes(jelly_bytes(LookupPreset()))
+    merged = tmp_path / "merged.jelly"
+    args = ["cat", str(part), str(part), "-o", str(merged), "--preset", "small"]
+    assert main(args) == 0
+    renamed = [
+        Quad(
+            Triple(BlankNode(f"{prefix}b"), IRI("p"), Literal("o")),
+            IRI(f"{EX}q"),
+            BlankNode(f"{prefix}c"),
+            BlankNode(f"{prefix}g"),
+        )
+        for prefix in ("f0_", "f1_")
+    ]
+    with merged.open("rb") as f:
+        assert list(parse_jelly_flat(f)) == [
+            *STATEMENTS[:-1],
+            renamed[0],
+            *STATEMENTS[:-1],
+            renamed[1],
+        ]
+    with merged.open("rb") as f:
+        options = scan_stream(f).options
+    assert options.lookup_preset == LookupPreset.small()
+    assert options.params.rdf_star